@@ -5,7 +5,9 @@ from . import (
     routes_auth,
     routes_auth_account,
     routes_auth_email,
+    routes_cocktails,
     routes_health,
+    routes_ingredient_catalog,
     routes_ingredients,
     routes_recommendations,
 )
@@ -17,4 +19,6 @@ api_v1.include_router(routes_auth_account.router)
 api_v1.include_router(routes_health.router)
 api_v1.include_router(routes_assistant.router)
 api_v1.include_router(routes_ingredients.router)
+api_v1.include_router(routes_ingredient_catalog.router)
 api_v1.include_router(routes_recommendations.router)
+api_v1.include_router(routes_cocktails.router)
@@ -0,0 +1,170 @@
+from typing import Annotated
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.models.recipe import Recipe
+from app.schemas.recipe import (
+    CocktailDetail,
+    CocktailIngredient,
+    CocktailSearchResponse,
+    CocktailSummary,
+    SimilarCocktail,
+    SimilarCocktailsResponse,
+)
+from app.services import catalog, recommender, search_index
+from app.services.bitset import pack_mask
+from app.services.recommender import RecipeEntry
+
+router = APIRouter(prefix="/cocktails", tags=["cocktails"])
+
+DbDep = Annotated[Session, Depends(get_db)]
+
+
+def _to_summary(recipe: Recipe) -> CocktailSummary:
+    return CocktailSummary(
+        id=recipe.drink_id,
+        name=recipe.name,
+        thumbnail=recipe.thumbnail,
+        category=recipe.category,
+    )
+
+
+def _entry_summary(entry: RecipeEntry) -> CocktailSummary:
+    return CocktailSummary(
+        id=entry.drink_id,
+        name=entry.name,
+        thumbnail=entry.thumbnail,
+        category=entry.category,
+        abv=entry.abv,
+        volume_ml=entry.volume_ml,
+    )
+
+
+def _to_detail(recipe: Recipe) -> CocktailDetail:
+    return CocktailDetail(
+        id=recipe.drink_id,
+        name=recipe.name,
+        thumbnail=recipe.thumbnail,
+        category=recipe.category,
+        abv=recipe.abv,
+        volume_ml=recipe.volume_ml,
+        glass=recipe.glass,
+        alcoholic=recipe.alcoholic,
+        instructions=recipe.instructions,
+        ingredients=[
+            CocktailIngredient(
+                name=ing.name, measure=ing.measure, measure_ml=ing.measure_ml
+            )
+            for ing in recipe.ingredients
+        ],
+    )
+
+
+@router.get("/search", response_model=CocktailSearchResponse)
+def search_cocktails(
+    db: DbDep,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(default=25, ge=1, le=100),
+    offset: int = Query(default=0, ge=0, le=10_000),
+    abv_min: float | None = Query(default=None, ge=0, le=100),
+    abv_max: float | None = Query(default=None, ge=0, le=100),
+    category: list[str] | None = Query(default=None, description="strCategory"),
+    glass: list[str] | None = Query(default=None, description="strGlass"),
+    alcoholic: list[str] | None = Query(default=None, description="strAlcoholic"),
+):
+    """
+    Full-text search of the local cocktail catalog.
+
+    - Matches names, ingredients and instructions; every word of `q` is
+      matched as a prefix, so partial input works while typing
+    - Ranked by BM25, with name matches weighted highest
+    - Paginated with `offset` / `limit`; follow `next_offset`
+    - `abv_min` / `abv_max` keep drinks whose estimated ABV is in range
+    - `category`, `glass` and `alcoholic` (repeatable, case-insensitive) keep
+      drinks with one of the given values; `facets` counts every value of
+      these fields over all matches
+    - When nothing matches because of a typo, `did_you_mean` suggests a
+      corrected query (up to two typos per word, from cocktail and ingredient
+      names) that finds something under the same filters
+    """
+    index = search_index.get_search_index(db)
+    if index is None:
+        return CocktailSearchResponse(cocktails=[], total_found=0)
+
+    allowed = index.facets.mask(
+        {"category": category, "glass": glass, "alcoholic": alcoholic}
+    )
+    if abv_min is not None or abv_max is not None:
+        in_range = index.mask(catalog.drinks_in_abv_range(db, abv_min, abv_max))
+        allowed = in_range if allowed is None else allowed & in_range
+    matches = index.matches(q, allowed)
+    result_set = np.zeros(len(index.entries), dtype=bool)
+    result_set[matches] = True
+
+    hits = matches[offset : offset + limit].tolist()
+    total = len(matches)
+    end = offset + len(hits)
+    return CocktailSearchResponse(
+        cocktails=[_entry_summary(index.entries[idx]) for idx in hits],
+        total_found=len(hits),
+        total_matches=total,
+        next_offset=end if end < total else None,
+        facets=index.facets.counts(pack_mask(result_set)),
+        did_you_mean=index.did_you_mean(q, allowed) if total == 0 else None,
+    )
+
+
+@router.get("/{drink_id}/similar", response_model=SimilarCocktailsResponse)
+def similar_cocktails(
+    drink_id: str,
+    db: DbDep,
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    """
+    Cocktails with the most similar ingredient sets ("more like this").
+
+    - Candidates come from an LSH index over MinHash signatures computed at
+      ingest, so only drinks likely to be similar are compared
+    - Candidates are ranked by exact Jaccard similarity of their ingredients
+      (substitutes, like Cointreau for Triple Sec, count as the same)
+    """
+    index = recommender.get_recommender(db)
+    idx = index.positions.get(drink_id) if index is not None else None
+    if idx is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cocktail not found",
+        )
+    query = index.entries[idx]
+    cocktails = []
+    for other, score in index.lsh.similar(idx, limit):
+        entry = index.entries[other]
+        cocktails.append(
+            SimilarCocktail(
+                **_entry_summary(entry).model_dump(),
+                similarity=round(score, 3),
+                shared_ingredients=[
+                    name
+                    for name, class_id in zip(
+                        entry.ingredients, entry.ingredient_classes
+                    )
+                    if class_id in query.keys
+                ],
+            )
+        )
+    return SimilarCocktailsResponse(cocktails=cocktails)
+
+
+@router.get("/{drink_id}", response_model=CocktailDetail)
+def get_cocktail(drink_id: str, db: DbDep):
+    """Get a single cocktail from the local catalog."""
+    recipe = catalog.get_recipe(db, drink_id)
+    if not recipe:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cocktail not found",
+        )
+    return _to_detail(recipe)
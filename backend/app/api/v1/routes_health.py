@@ -1,8 +1,36 @@
 from fastapi import APIRouter
 
+from app.services.recommendation_cache import recommendation_cache
+from app.services.singleflight import FLIGHTS
+from app.services.upstream import get_upstream
+
 router = APIRouter()
 
 
 @router.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@router.get("/health/recommendations")
+async def recommendations_health():
+    """Recommendation result cache statistics."""
+    return {"cache": recommendation_cache.stats()}
+
+
+@router.get("/health/upstream")
+async def upstream_health():
+    """
+    Shared TheCocktailDB client pool, circuit breaker / concurrency limit,
+    hedging, outbound rate budget (per-lane queue waits), cache and
+    request-coalescing statistics.
+    """
+    client = get_upstream()
+    return {
+        "pool": client.pool_stats(),
+        "guard": client.guard.stats(),
+        "hedging": client.hedger.stats(),
+        "rate_budget": client.budget.stats(),
+        "cache": client.cache.stats() if client.cache else None,
+        "singleflight": {name: f.stats() for name, f in FLIGHTS.items()},
+    }
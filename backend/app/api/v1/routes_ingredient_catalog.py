@@ -0,0 +1,34 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.schemas.ingredient import IngredientAutocompleteResponse, IngredientSuggestion
+from app.services.autocomplete import MAX_SUGGESTIONS, get_ingredient_trie
+
+router = APIRouter(prefix="/ingredients", tags=["ingredients"])
+
+DbDep = Annotated[Session, Depends(get_db)]
+
+
+@router.get("/autocomplete", response_model=IngredientAutocompleteResponse)
+def autocomplete_ingredients(
+    db: DbDep,
+    q: str = Query(..., min_length=1, max_length=64),
+    limit: int = Query(default=10, ge=1, le=MAX_SUGGESTIONS),
+):
+    """
+    Ingredient names starting with `q` (or with a later word or a known alias
+    starting with it), ranked by how many catalog recipes use them.
+    Empty until the local catalog has been synced.
+    """
+    trie = get_ingredient_trie(db)
+    if trie is None:
+        return IngredientAutocompleteResponse(suggestions=[])
+    return IngredientAutocompleteResponse(
+        suggestions=[
+            IngredientSuggestion(name=name, recipe_count=count)
+            for name, count in trie.complete(q, limit)
+        ]
+    )
@@ -9,6 +9,7 @@ from app.models.ingredient import Ingredient
 from app.models.link_tables import UserIngredient
 from app.models.user import User
 from app.schemas.ingredient import PantryAdd, PantryIngredientRead, PantryUpdate
+from app.services.recommendation_cache import bump_pantry_version
 
 router = APIRouter(prefix="/users/me/pantry", tags=["pantry"])
 
@@ -74,6 +75,7 @@ def add_to_pantry(payload: PantryAdd, db: DbDep, current_user: CurrentUser):
         )
         db.add(existing)
 
+    bump_pantry_version(current_user)
     db.commit()
     db.refresh(existing)
     return _to_pantry_read(existing)
@@ -98,6 +100,7 @@ def remove_from_pantry(ingredient_id: int, db: DbDep, current_user: CurrentUser)
         )
 
     db.delete(pantry_item)
+    bump_pantry_version(current_user)
     db.commit()
     return None
 
@@ -123,6 +126,7 @@ def update_pantry_quantity(
         )
 
     pantry_item.quantity = payload.quantity
+    bump_pantry_version(current_user)
     db.commit()
     db.refresh(pantry_item)
     return _to_pantry_read(pantry_item)
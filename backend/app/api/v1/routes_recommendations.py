@@ -1,9 +1,13 @@
 import asyncio
-import re
-from typing import Annotated
+import json
+from collections.abc import AsyncIterator, Callable
+from logging import getLogger
+from typing import Annotated, Literal, NamedTuple
 
 import httpx
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
@@ -13,189 +17,648 @@ from app.models.link_tables import UserIngredient
 from app.models.user import User
 from app.schemas.recipe import (
     CocktailRecommendation,
+    IngredientUnlock,
     MatchScore,
     RecommendationsResponse,
+    Substitution,
+    UnlocksResponse,
 )
+from app.services import catalog, precompute, recommender, taxonomy
+from app.services.bitset import pack_mask
+from app.services.facets import facet_key, facet_values
+from app.services.normalize import normalize_ingredient_name
+from app.services.ranking import CursorError, Ranking, decode_cursor, encode_cursor
+from app.services.recommendation_cache import (
+    SAMPLED_RANKING_TTL,
+    recommendation_cache,
+)
+from app.services.singleflight import SingleFlight
+from app.services.substitutions import PantryClasses, registry
+from app.services.upstream import get_upstream
+
+log = getLogger(__name__)
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
 DbDep = Annotated[Session, Depends(get_db)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
-COCKTAILDB_BASE_URL = "https://www.thecocktaildb.com/api/json/v1/1"
-
-
-def normalize_ingredient_name(name: str) -> str:
-    """Normalize ingredient name for matching (simplified version of frontend logic)."""
-    if not name:
-        return ""
-    # Remove punctuation, convert to lowercase, collapse spaces
-    normalized = re.sub(r"[\(\)\[\]\{\}:,_\-–—]", " ", name.lower())
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    # Remove common filler words
-    normalized = re.sub(
-        r"\b(fresh|house|homemade|of|the|and|a|ml|oz|ounce|ounces|tsp|tbsp|dash|dashes)\b",
-        "",
-        normalized,
-    )
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    # Basic singularization
-    if normalized.endswith("ies") and len(normalized) > 3:
-        normalized = normalized[:-3] + "y"
-    elif normalized.endswith("s") and len(normalized) > 3:
-        normalized = normalized[:-1]
-    return normalized
-
-
-def get_pantry_ingredient_names(db: Session, user_id: int) -> set[str]:
-    """Get normalized ingredient names from user's pantry."""
+recommendations_flight = SingleFlight("recommendations")
+
+UNLOCK_EXAMPLES = 5  # cocktail names listed per unlocking ingredient
+
+
+class RecommendationFilters(NamedTuple):
+    """Filters a ranking is built for; part of its cache key and cursors."""
+
+    fully_makeable_only: bool = False
+    abv_min: float | None = None
+    abv_max: float | None = None
+    # canonical facet values (facets.facet_values); empty: not filtered
+    category: tuple[str, ...] = ()
+    glass: tuple[str, ...] = ()
+    alcoholic: tuple[str, ...] = ()
+
+    @property
+    def facets(self) -> dict[str, tuple[str, ...]]:
+        return {
+            "category": self.category,
+            "glass": self.glass,
+            "alcoholic": self.alcoholic,
+        }
+
+    def allows_facets(self, values: dict) -> bool:
+        return all(
+            not wanted or facet_key(values.get(facet)) in wanted
+            for facet, wanted in self.facets.items()
+        )
+
+    @property
+    def narrows_catalog(self) -> bool:
+        """Whether drinks are excluded by more than makeability."""
+        return self.has_abv_range or any(self.facets.values())
+
+    @property
+    def has_abv_range(self) -> bool:
+        return self.abv_min is not None or self.abv_max is not None
+
+    def allows_abv(self, abv: float | None) -> bool:
+        if not self.has_abv_range:
+            return True
+        return (
+            abv is not None
+            and (self.abv_min is None or abv >= self.abv_min)
+            and (self.abv_max is None or abv <= self.abv_max)
+        )
+
+
+def get_pantry(db: Session, user_id: int) -> PantryClasses:
+    """
+    User's pantry ingredients with their quantities, normalized, expanded with
+    their taxonomy ancestors and mapped to substitution classes.
+    """
     pantry_items = (
         db.query(UserIngredient)
         .filter(UserIngredient.user_id == user_id)
         .join(Ingredient)
         .all()
     )
-    return {normalize_ingredient_name(item.ingredient.name) for item in pantry_items}
+    return PantryClasses.from_items(
+        ((item.ingredient.name, item.quantity) for item in pantry_items),
+        ancestors=taxonomy.get_taxonomy(db).ancestors,
+    )
 
 
 def parse_cocktail_ingredients(drink: dict) -> list[str]:
     """Extract ingredient names from CocktailDB drink data."""
     ingredients = []
     for i in range(1, 16):  # CocktailDB has up to 15 ingredients
-        ingredient = drink.get(f"strIngredient{i}", "").strip()
+        ingredient = (drink.get(f"strIngredient{i}") or "").strip()
         if ingredient:
             ingredients.append(ingredient)
     return ingredients
 
 
-def is_fully_makeable(
-    cocktail_ingredients: list[str], pantry_names: set[str]
-) -> tuple[bool, list[str]]:
-    """Check if cocktail is fully makeable from pantry and return missing ingredients."""
-    missing = []
-    for ingredient in cocktail_ingredients:
-        normalized = normalize_ingredient_name(ingredient)
-        if normalized and normalized not in pantry_names:
-            missing.append(ingredient)
-    return len(missing) == 0, missing
-
+def score_cocktail(
+    cocktail_ingredients: list[str], pantry: PantryClasses
+) -> tuple[bool, list[str], dict, list[tuple[str, str]]]:
+    """
+    Makeability, missing ingredients, match score and substitutions used,
+    normalizing each name once.
+    """
+    keys = [normalize_ingredient_name(ing) for ing in cocktail_ingredients]
+    classes = [registry.class_of(key) if key else "" for key in keys]
+    missing = [
+        ing
+        for ing, class_id in zip(cocktail_ingredients, classes)
+        if class_id and class_id not in pantry.classes
+    ]
+    matched = sum(1 for class_id in classes if class_id in pantry.classes)
+    total = len(keys)
+    return (
+        len(missing) == 0,
+        missing,
+        {
+            "matched": matched,
+            "total": total,
+            "percentage": (matched / total * 100) if total > 0 else 0.0,
+        },
+        pantry.substitutions(cocktail_ingredients, keys, classes),
+    )
 
-def get_match_score(cocktail_ingredients: list[str], pantry_names: set[str]) -> dict:
-    """Calculate match score for a cocktail."""
-    if not cocktail_ingredients:
-        return {"matched": 0, "total": 0, "percentage": 0.0}
 
-    matched = sum(
-        1
-        for ing in cocktail_ingredients
-        if normalize_ingredient_name(ing) in pantry_names
-    )
-    total = len(cocktail_ingredients)
+def _drink_candidate(drink: dict) -> dict:
+    """Candidate fields from a raw CocktailDB drink."""
+    # Catalog drinks get their strength at ingest; samples only while it is empty
+    parsed = catalog.parse_drink(drink)
     return {
-        "matched": matched,
-        "total": total,
-        "percentage": (matched / total * 100) if total > 0 else 0.0,
+        "id": str(drink.get("idDrink", "")),
+        "name": str(drink.get("strDrink", "")),
+        "thumbnail": drink.get("strDrinkThumb"),
+        "category": drink.get("strCategory"),
+        "glass": parsed["glass"],
+        "alcoholic": parsed["alcoholic"],
+        "instructions": drink.get("strInstructions"),
+        "ingredients": parse_cocktail_ingredients(drink),
+        "abv": parsed["abv"],
+        "volume_ml": parsed["volume_ml"],
     }
 
 
+async def iter_random_drinks(count: int) -> AsyncIterator[dict]:
+    """
+    Sample drinks from TheCocktailDB, yielding each one as soon as its reply
+    arrives rather than after the slowest of the parallel calls. Raises 504
+    (timeouts) or 503 when every call failed and the cache has nothing either.
+    """
+    client = get_upstream()
+    # Fetch multiple random cocktails in parallel over the shared pool
+    replies = asyncio.as_completed(
+        [client.get_json("random.php") for _ in range(count)]
+    )
+    failed = 0
+    timed_out = False
+    error: Exception | None = None
+    for reply in replies:
+        try:
+            data = await reply
+        except Exception as e:
+            failed += 1
+            timed_out = timed_out or isinstance(e, httpx.TimeoutException)
+            error = e
+            continue
+        if data.get("drinks"):
+            yield data["drinks"][0]
+
+    # Upstream trouble: fill the gaps with previously seen drinks
+    stand_ins: list[dict] = []
+    if failed and client.cache is not None:
+        loop = asyncio.get_running_loop()
+        stand_ins = await loop.run_in_executor(None, client.cache.sample_drinks, failed)
+    for drink in stand_ins:
+        yield drink
+
+    if failed == count and not stand_ins:
+        # Timeouts also trip the circuit breaker, so later calls fail fast
+        if timed_out:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="CocktailDB API timeout",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"CocktailDB API unavailable: {error}",
+        )
+
+
+async def fetch_random_drinks(count: int) -> list[dict]:
+    """Fallback when the local catalog is empty: sample drinks from TheCocktailDB."""
+    return [drink async for drink in iter_random_drinks(count)]
+
+
+def _catalog_recommendation(
+    index: recommender.RecommenderIndex,
+    idx: int,
+    matched: int,
+    total: int,
+    pantry: PantryClasses,
+    servings: float,
+) -> CocktailRecommendation:
+    entry = index.entries[idx]
+    fully_makeable = matched == total and servings >= 1
+    return CocktailRecommendation(
+        id=entry.drink_id,
+        name=entry.name,
+        thumbnail=entry.thumbnail,
+        category=entry.category,
+        instructions=entry.instructions,
+        ingredients=list(entry.ingredients),
+        abv=entry.abv,
+        volume_ml=entry.volume_ml,
+        fully_makeable=fully_makeable,
+        missing_ingredients=index.missing_ingredients(idx, pantry.classes),
+        match_score=MatchScore(
+            matched=matched, total=total, percentage=matched / total * 100
+        ),
+        substitutions=[
+            Substitution(ingredient=ingredient, substitute=substitute)
+            for ingredient, substitute in index.substitutions(idx, pantry)
+        ],
+        # Not makeable is 0 servings even when the measures are unknown
+        servings=(
+            (None if np.isinf(servings) else int(servings)) if fully_makeable else 0
+        ),
+    )
+
+
+def _filter_mask(
+    db: Session, index: recommender.RecommenderIndex, filters: RecommendationFilters
+) -> np.ndarray | None:
+    """
+    Catalog entries the filters allow (None: all): facets from the index's
+    bitsets, ABV with a range scan on its indexed column.
+    """
+    allowed = index.facets.mask(filters.facets)
+    if filters.has_abv_range:
+        in_range = index.mask(
+            catalog.drinks_in_abv_range(db, filters.abv_min, filters.abv_max)
+        )
+        allowed = in_range if allowed is None else allowed & in_range
+    return allowed
+
+
+def _rank_catalog(
+    index: recommender.RecommenderIndex,
+    pantry: PantryClasses,
+    filters: RecommendationFilters,
+    allowed: np.ndarray | None = None,
+) -> Ranking[CocktailRecommendation]:
+    """
+    Rank every catalog recipe that shares an ingredient with the pantry.
+    Recipes the pantry's quantities cannot pour once are not makeable.
+    """
+    matched, totals = index.score_all(pantry.classes)
+    servings = index.servings(pantry.volumes)
+    makeable = (matched == totals) & (totals > 0) & (servings >= 1)
+    selected = makeable if filters.fully_makeable_only else matched > 0
+    if allowed is not None:
+        selected = selected & allowed
+    positions = np.flatnonzero(selected)
+    m, t = matched[positions], totals[positions]
+    rows = list(
+        zip(
+            (~makeable[positions]).tolist(),
+            (-(m / t) * 100).tolist(),
+            positions.tolist(),
+        )
+    )
+
+    def materialize(idx: int) -> CocktailRecommendation:
+        return _catalog_recommendation(
+            index, idx, int(matched[idx]), int(totals[idx]), pantry, servings[idx]
+        )
+
+    return Ranking(rows, materialize, index.facets.counts(pack_mask(selected)))
+
+
+def _rank_precomputed(
+    index: recommender.RecommenderIndex,
+    stored: list[tuple[str, int, int]],
+    pantry: PantryClasses,
+    filters: RecommendationFilters,
+) -> Ranking[CocktailRecommendation]:
+    """
+    Ranking from the batch job's stored rows (see services/precompute.py).
+    They are the unfiltered ranking, so only fully_makeable_only applies.
+    """
+    servings = index.servings(pantry.volumes)
+    scores = {}
+    for drink_id, m, t in stored:
+        idx = index.positions.get(drink_id)
+        if idx is None:
+            continue
+        makeable = m == t and servings[idx] >= 1
+        if makeable or not filters.fully_makeable_only:
+            scores[idx] = (m, t, makeable)
+    rows = [(not ok, -(m / t) * 100, idx) for idx, (m, t, ok) in scores.items()]
+    selected = np.zeros(len(index), dtype=bool)
+    selected[list(scores)] = True
+
+    def materialize(idx: int) -> CocktailRecommendation:
+        m, t, _ = scores[idx]
+        return _catalog_recommendation(index, idx, m, t, pantry, servings[idx])
+
+    return Ranking(rows, materialize, index.facets.counts(pack_mask(selected)))
+
+
+def _score_candidate(
+    candidate: dict, pantry: PantryClasses, filters: RecommendationFilters
+) -> tuple[bool, list[str], dict, list[tuple[str, str]]] | None:
+    """Score one upstream drink; None when it has no ingredients or is filtered out."""
+    if not filters.allows_abv(candidate["abv"]) or not filters.allows_facets(candidate):
+        return None
+    try:
+        ingredients = candidate["ingredients"]
+        if not ingredients:
+            return None
+
+        scored = score_cocktail(ingredients, pantry)
+    except Exception:
+        # Skip cocktails that fail to process
+        return None
+
+    # Filter if requested
+    if filters.fully_makeable_only and not scored[0]:
+        return None
+    return scored
+
+
+def _recommendation(
+    candidate: dict,
+    fully_makeable: bool,
+    missing: list[str],
+    match_score: dict,
+    substitutions: list[tuple[str, str]],
+) -> CocktailRecommendation:
+    return CocktailRecommendation(
+        **candidate,
+        fully_makeable=fully_makeable,
+        missing_ingredients=missing,
+        match_score=MatchScore(**match_score),
+        substitutions=[
+            Substitution(ingredient=ingredient, substitute=substitute)
+            for ingredient, substitute in substitutions
+        ],
+    )
+
+
+def _rank_candidates(
+    candidates: list[dict], pantry: PantryClasses, filters: RecommendationFilters
+) -> Ranking[CocktailRecommendation]:
+    """Rank upstream drinks one by one (used while the catalog is empty)."""
+    scored = []
+    for candidate in candidates:
+        result = _score_candidate(candidate, pantry, filters)
+        if result is not None:
+            scored.append((candidate, *result))
+
+    rows = [
+        (not fully_makeable, -match_score["percentage"], pos)
+        for pos, (_, fully_makeable, _, match_score, _) in enumerate(scored)
+    ]
+
+    def materialize(pos: int) -> CocktailRecommendation:
+        return _recommendation(*scored[pos])
+
+    return Ranking(rows, materialize, sampled=True)
+
+
+async def build_ranking(
+    db: Session, user_id: int, ranking_key: tuple, sample_size: int
+) -> Ranking[CocktailRecommendation]:
+    """
+    Score the user's pantry against the catalog (or an upstream sample).
+    Rankings stored by the batch job are used when they match ranking_key.
+    """
+    pantry_version, catalog_version, taxonomy_version, *rest = ranking_key
+    filters = RecommendationFilters(*rest)
+    # Get user's pantry ingredients
+    pantry = get_pantry(db, user_id)
+
+    if not pantry:
+        return Ranking([], lambda pos: None)
+
+    index = recommender.get_recommender(db)
+    if index is not None:
+        # Stored rows are the unfiltered ranking; filtered requests are scored
+        # live against the filter masks
+        if not filters.narrows_catalog:
+            stored = precompute.load_precomputed(
+                db, user_id, pantry_version, catalog_version, taxonomy_version
+            )
+            if stored is not None:
+                return _rank_precomputed(index, stored, pantry, filters)
+        return _rank_catalog(index, pantry, filters, _filter_mask(db, index, filters))
+
+    drinks = await fetch_random_drinks(sample_size)
+    return _rank_candidates([_drink_candidate(d) for d in drinks], pantry, filters)
+
+
+def _ranking_key(db: Session, user: User, filters: RecommendationFilters) -> tuple:
+    """
+    Everything a ranking depends on besides the user: pantry, catalog,
+    ingredient taxonomy, filters (flat, as it is embedded in cursors).
+    """
+    return (
+        user.pantry_version,
+        catalog.catalog_version(db),
+        taxonomy.taxonomy_version(db),
+        *filters,
+    )
+
+
+async def _cached_ranking(
+    db: Session, user_id: int, ranking_key: tuple, sample_size: int
+) -> Ranking[CocktailRecommendation]:
+    """The user's ranking from the cache, built (once per key in flight) on a miss."""
+    key = (user_id, *ranking_key)
+    ranking = recommendation_cache.get(key)
+    if ranking is None:
+        ranking = await recommendations_flight.do(
+            key, lambda: build_ranking(db, user_id, ranking_key, sample_size)
+        )
+        ttl = SAMPLED_RANKING_TTL if ranking.sampled else None
+        recommendation_cache.put(key, ranking, ttl)
+    return ranking
+
+
 @router.get("", response_model=RecommendationsResponse)
 async def get_recommendations(
     db: DbDep,
     current_user: CurrentUser,
-    limit: int = Query(default=20, ge=1, le=50),
+    limit: int = Query(default=20, ge=1, le=50, description="Page size"),
     fully_makeable_only: bool = Query(default=False),
+    abv_min: float | None = Query(default=None, ge=0, le=100),
+    abv_max: float | None = Query(default=None, ge=0, le=100),
+    category: list[str] | None = Query(default=None, description="strCategory"),
+    glass: list[str] | None = Query(default=None, description="strGlass"),
+    alcoholic: list[str] | None = Query(default=None, description="strAlcoholic"),
+    cursor: str | None = Query(default=None, description="next_cursor of a page"),
 ):
     """
     Get cocktail recommendations based on user's pantry ingredients.
 
-    - Fetches cocktails from TheCocktailDB API
-    - Filters by user's pantry ingredients
-    - Returns cocktails with metadata about makeability
+    - Scores the whole local catalog when it has been ingested, or serves the
+      nightly precomputed ranking while it is still fresh
+    - Otherwise samples cocktails from TheCocktailDB API
+    - Returns cocktails with metadata about makeability, one page at a time
+    - `abv_min` / `abv_max` keep drinks whose estimated ABV (computed at
+      ingest, indexed) is in range
+    - `category`, `glass` and `alcoholic` (repeatable, case-insensitive) keep
+      drinks with one of the given values; `facets` counts every value of
+      these fields over the whole ranking (catalog only)
+    - The ranking is cached per (pantry version, catalog version, filters), so
+      following `next_cursor` pages through it without recomputing
+    - Identical requests already in flight (double taps) share one computation
     """
-    # Get user's pantry ingredients
-    pantry_names = get_pantry_ingredient_names(db, current_user.id)
+    filters = RecommendationFilters(
+        fully_makeable_only,
+        abv_min,
+        abv_max,
+        facet_values(category),
+        facet_values(glass),
+        facet_values(alcoholic),
+    )
+    ranking_key = _ranking_key(db, current_user, filters)
+    offset = 0
+    if cursor:
+        try:
+            offset = decode_cursor(cursor, ranking_key)
+        except CursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    if not pantry_names:
-        return RecommendationsResponse(
-            cocktails=[],
-            total_found=0,
-            fully_makeable_count=0,
-        )
+    ranking = await _cached_ranking(
+        db, current_user.id, ranking_key, sample_size=min(limit * 2, 50)
+    )
+
+    cocktails = ranking.page(offset, limit)
+    end = offset + len(cocktails)
+    return RecommendationsResponse(
+        cocktails=cocktails,
+        total_found=len(cocktails),
+        fully_makeable_count=sum(1 for c in cocktails if c.fully_makeable),
+        total_ranked=len(ranking),
+        next_cursor=encode_cursor(end, ranking_key) if end < len(ranking) else None,
+        facets=ranking.facets,
+    )
+
+
+# ===== Streaming =====
+
+
+def _ndjson_frame(event: str, data: dict) -> str:
+    return json.dumps({"type": event, "data": data}) + "\n"
+
+
+def _sse_frame(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# format -> (media type, frame encoder)
+STREAM_FORMATS = {
+    "ndjson": ("application/x-ndjson", _ndjson_frame),
+    "sse": ("text/event-stream", _sse_frame),
+}
 
-    # Fetch random cocktails from TheCocktailDB
+
+async def _stream_cocktails(
+    ranking: Ranking[CocktailRecommendation] | None,
+    pantry: PantryClasses,
+    limit: int,
+    filters: RecommendationFilters,
+) -> AsyncIterator[CocktailRecommendation]:
+    """
+    A ready ranking is replayed best-first; otherwise upstream samples are
+    scored and yielded in the order their replies arrive.
+    """
+    if ranking is not None:
+        for cocktail in ranking.page(0, limit):
+            yield cocktail
+        return
+    if not pantry:
+        return
+
+    sent = 0
+    async for drink in iter_random_drinks(min(limit * 2, 50)):
+        candidate = _drink_candidate(drink)
+        result = _score_candidate(candidate, pantry, filters)
+        if result is None:
+            continue
+        yield _recommendation(candidate, *result)
+        sent += 1
+        if sent >= limit:
+            return
+
+
+async def _stream_frames(
+    cocktails: AsyncIterator[CocktailRecommendation], frame: Callable[[str, dict], str]
+) -> AsyncIterator[str]:
+    total_found = 0
+    fully_makeable_count = 0
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Fetch multiple random cocktails in parallel
-            tasks = [
-                client.get(f"{COCKTAILDB_BASE_URL}/random.php")
-                for _ in range(min(limit * 2, 50))
-            ]
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            cocktails_data = []
-            for resp in responses:
-                if isinstance(resp, Exception):
-                    continue
-                if resp.status_code != 200:
-                    continue
-                try:
-                    data = resp.json()
-                    if data and data.get("drinks") and len(data["drinks"]) > 0:
-                        cocktails_data.append(data["drinks"][0])
-                except Exception:
-                    continue
-
-    except httpx.TimeoutException:
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="CocktailDB API timeout",
-        )
+        async for cocktail in cocktails:
+            total_found += 1
+            fully_makeable_count += cocktail.fully_makeable
+            yield frame("cocktail", cocktail.model_dump())
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching cocktails: {str(e)}",
+        # Headers are already sent, so errors travel in-band
+        log.warning("Recommendation stream failed: %s", e)
+        yield frame("error", {"detail": f"Error fetching cocktails: {str(e)}"})
+    yield frame(
+        "summary",
+        {"total_found": total_found, "fully_makeable_count": fully_makeable_count},
+    )
+
+
+@router.get("/stream")
+async def stream_recommendations(
+    db: DbDep,
+    current_user: CurrentUser,
+    limit: int = Query(default=20, ge=1, le=50),
+    fully_makeable_only: bool = Query(default=False),
+    abv_min: float | None = Query(default=None, ge=0, le=100),
+    abv_max: float | None = Query(default=None, ge=0, le=100),
+    category: list[str] | None = Query(default=None, description="strCategory"),
+    glass: list[str] | None = Query(default=None, description="strGlass"),
+    alcoholic: list[str] | None = Query(default=None, description="strAlcoholic"),
+    stream_format: Literal["ndjson", "sse"] = Query(default="ndjson", alias="format"),
+):
+    """
+    Streaming variant of `GET /recommendations` (first page only), with the
+    same filters.
+
+    Each scored cocktail is sent as its own frame as soon as it is ready, so
+    clients can render while the slowest upstream call is still pending. The
+    last frame is a summary with `total_found` and `fully_makeable_count`.
+
+    - `format=ndjson`: one `{"type": ..., "data": ...}` JSON object per line
+    - `format=sse`: Server-Sent Events named `cocktail`, `summary` (and `error`)
+    """
+    # All database work happens here: the session is gone once streaming starts
+    filters = RecommendationFilters(
+        fully_makeable_only,
+        abv_min,
+        abv_max,
+        facet_values(category),
+        facet_values(glass),
+        facet_values(alcoholic),
+    )
+    ranking_key = _ranking_key(db, current_user, filters)
+    ranking = recommendation_cache.get((current_user.id, *ranking_key))
+    if ranking is None and recommender.get_recommender(db) is not None:
+        ranking = await _cached_ranking(
+            db, current_user.id, ranking_key, sample_size=min(limit * 2, 50)
         )
+    pantry = (
+        get_pantry(db, current_user.id)
+        if ranking is None
+        else PantryClasses.from_names(())
+    )
 
-    # Process and filter cocktails
-    results = []
-    for drink in cocktails_data:
-        try:
-            ingredients = parse_cocktail_ingredients(drink)
-            if not ingredients:
-                continue
-
-            fully_makeable, missing = is_fully_makeable(ingredients, pantry_names)
-            match_score = get_match_score(ingredients, pantry_names)
-
-            # Filter if requested
-            if fully_makeable_only and not fully_makeable:
-                continue
-
-            results.append(
-                CocktailRecommendation(
-                    id=str(drink.get("idDrink", "")),
-                    name=str(drink.get("strDrink", "")),
-                    thumbnail=drink.get("strDrinkThumb"),
-                    category=drink.get("strCategory"),
-                    instructions=drink.get("strInstructions"),
-                    ingredients=ingredients,
-                    fully_makeable=fully_makeable,
-                    missing_ingredients=missing,
-                    match_score=MatchScore(**match_score),
-                )
-            )
-        except Exception:
-            # Skip cocktails that fail to process
-            continue
+    media_type, frame = STREAM_FORMATS[stream_format]
+    cocktails = _stream_cocktails(ranking, pantry, limit, filters)
+    return StreamingResponse(
+        _stream_frames(cocktails, frame),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    # Sort by: fully_makeable first, then by match percentage
-    results.sort(key=lambda x: (not x.fully_makeable, -x.match_score.percentage))
 
-    # Limit results
-    results = results[:limit]
+@router.get("/unlocks", response_model=UnlocksResponse)
+def get_unlocks(
+    db: DbDep,
+    current_user: CurrentUser,
+    top: int = Query(default=10, ge=1, le=100),
+):
+    """
+    Rank ingredients the user does not own by how many more cocktails each one
+    would make fully makeable, given the current pantry ("buy one bottle").
+    Needs the local catalog; returns an empty list until it has been synced.
+    """
+    index = recommender.get_recommender(db)
+    if index is None:
+        return UnlocksResponse(unlocks=[])
 
-    return RecommendationsResponse(
-        cocktails=results,
-        total_found=len(results),
-        fully_makeable_count=sum(1 for r in results if r.fully_makeable),
+    pantry = get_pantry(db, current_user.id)
+    return UnlocksResponse(
+        unlocks=[
+            IngredientUnlock(
+                ingredient=index.class_names[key],
+                unlocks=len(recipes),
+                cocktails=[
+                    index.entries[idx].name for idx in recipes[:UNLOCK_EXAMPLES]
+                ],
+            )
+            for key, recipes in index.unlocks(pantry.classes, pantry.volumes)[:top]
+        ]
     )
@@ -7,6 +7,32 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
     REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+    # TheCocktailDB upstream (shared pooled client, see app/services/upstream.py)
+    COCKTAILDB_BASE_URL = os.getenv(
+        "COCKTAILDB_BASE_URL", "https://www.thecocktaildb.com/api/json/v1/1"
+    )
+    UPSTREAM_TIMEOUT_SECONDS = float(os.getenv("UPSTREAM_TIMEOUT_SECONDS", "10"))
+    UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS", "50"))
+    UPSTREAM_MAX_KEEPALIVE = int(os.getenv("UPSTREAM_MAX_KEEPALIVE", "20"))
+    UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY", "30"))
+    UPSTREAM_HTTP2 = os.getenv("UPSTREAM_HTTP2", "true").lower() == "true"
+    # Adaptive in-flight limit starts here and moves between 1 and MAX_CONNECTIONS
+    UPSTREAM_CONCURRENCY_INITIAL = int(os.getenv("UPSTREAM_CONCURRENCY_INITIAL", "16"))
+    # Circuit breaker: open after N consecutive failures, probe again after N seconds
+    UPSTREAM_BREAKER_FAILURES = int(os.getenv("UPSTREAM_BREAKER_FAILURES", "5"))
+    UPSTREAM_BREAKER_RESET_SECONDS = float(
+        os.getenv("UPSTREAM_BREAKER_RESET_SECONDS", "30")
+    )
+    # Hedge calls still pending at the observed p95, within BUDGET extra requests
+    UPSTREAM_HEDGE_ENABLED = (
+        os.getenv("UPSTREAM_HEDGE_ENABLED", "true").lower() == "true"
+    )
+    UPSTREAM_HEDGE_BUDGET = float(os.getenv("UPSTREAM_HEDGE_BUDGET", "0.05"))
+    # Outbound token bucket (requests/second, burst); 0 disables it
+    UPSTREAM_RATE_PER_SECOND = float(os.getenv("UPSTREAM_RATE_PER_SECOND", "20"))
+    UPSTREAM_RATE_BURST = float(os.getenv("UPSTREAM_RATE_BURST", "40"))
+    # SQLite file for cached upstream replies; empty disables the cache
+    UPSTREAM_CACHE_PATH = os.getenv("UPSTREAM_CACHE_PATH", "./cocktaildb_cache.db")
     CORS_ORIGINS = [
         s.strip()
         for s in os.getenv(
@@ -1,4 +1,6 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,9 +10,23 @@ from app.core.db import Base, engine
 
 # Import models BEFORE create_all so tables are registered
 from app.models import auth_token as _m_auth_token  # noqa: F401
+from app.models import recipe as _m_recipe  # noqa: F401
+from app.models import taxonomy as _m_taxonomy  # noqa: F401
 from app.models import user as _m_user  # noqa: F401
+from app.services.upstream import close_upstream, start_upstream
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled upstream client for the whole process
+    await start_upstream()
+    try:
+        yield
+    finally:
+        await close_upstream()
+
 
-app = FastAPI(title="Cocktail API")
+app = FastAPI(title="Cocktail API", lifespan=lifespan)
 
 # CORS configuration
 app.add_middleware(
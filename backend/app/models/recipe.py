@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.db import Base
+
+
+class Recipe(Base):
+    """A cocktail mirrored from TheCocktailDB into the local catalog."""
+
+    __tablename__ = "recipes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # TheCocktailDB idDrink (kept as a string, like the API returns it)
+    drink_id: Mapped[str] = mapped_column(
+        String(16), unique=True, index=True, nullable=False
+    )
+    name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    thumbnail: Mapped[str | None] = mapped_column(String(512))
+    category: Mapped[str | None] = mapped_column(String(64), index=True)
+    glass: Mapped[str | None] = mapped_column(String(64))
+    alcoholic: Mapped[str | None] = mapped_column(String(32))
+    instructions: Mapped[str | None] = mapped_column(Text)
+    # Estimated at ingest from the parsed measures (services/strength.py)
+    volume_ml: Mapped[float | None] = mapped_column(Float)
+    abv: Mapped[float | None] = mapped_column(Float, index=True)
+    # MinHash of the ingredient classes, for similar drinks (services/similarity.py)
+    minhash: Mapped[bytes | None] = mapped_column(LargeBinary)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # Relationships
+    ingredients: Mapped[list[RecipeIngredient]] = relationship(
+        "RecipeIngredient",
+        back_populates="recipe",
+        cascade="all, delete-orphan",
+        order_by="RecipeIngredient.position",
+    )
+
+
+class RecipeIngredient(Base):
+    """One strIngredientN / strMeasureN pair of a recipe."""
+
+    __tablename__ = "recipe_ingredients"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    recipe_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # 1-based slot number from TheCocktailDB (strIngredient1..15)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    name: Mapped[str] = mapped_column(String(128), index=True, nullable=False)
+    measure: Mapped[str | None] = mapped_column(String(64))
+    # `measure` in millilitres, parsed at ingest (None when it has no volume)
+    measure_ml: Mapped[float | None] = mapped_column(Float)
+
+    # Relationships
+    recipe: Mapped[Recipe] = relationship("Recipe", back_populates="ingredients")
+
+    __table_args__ = (
+        UniqueConstraint("recipe_id", "position", name="uq_recipe_ingredient_position"),
+    )
+
+
+class CatalogSync(Base):
+    """One run of the catalog ingest; the latest finished run is the catalog version."""
+
+    __tablename__ = "catalog_syncs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+    drink_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_keys: Mapped[str | None] = mapped_column(String(64))
+
+    # Never reuse ids on SQLite: in-memory indexes are cached per catalog version
+    __table_args__ = {"sqlite_autoincrement": True}
+
+
+class PrecomputedRecommendation(Base):
+    """
+    One row of a user's ranking, written by the batch job
+    (scripts/precompute_recommendations.py). Rows are served only while all
+    versions still match the user's pantry, the catalog and the ingredient
+    taxonomy.
+    """
+
+    __tablename__ = "precomputed_recommendations"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    # 0-based position in the ranking (fully makeable first, then by match %)
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    drink_id: Mapped[str] = mapped_column(String(16), nullable=False)
+    matched: Mapped[int] = mapped_column(Integer, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, nullable=False)
+    pantry_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    catalog_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    taxonomy_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class IngredientTaxonomy(Base):
+    """
+    One edge of the ingredient taxonomy: an ingredient and its more general
+    parent (Bacardi -> white rum -> rum). Keys are normalized ingredient names;
+    every ingredient has at most one parent.
+    """
+
+    __tablename__ = "ingredient_taxonomy"
+
+    ingredient_key: Mapped[str] = mapped_column(String(128), primary_key=True)
+    parent_key: Mapped[str] = mapped_column(String(128), index=True, nullable=False)
+
+
+class IngredientClosure(Base):
+    """
+    Transitive closure of the taxonomy: one row per (ancestor, descendant) pair,
+    including each ingredient with itself at depth 0. Maintained incrementally by
+    services/taxonomy.py whenever an edge changes.
+    """
+
+    __tablename__ = "ingredient_closure"
+
+    ancestor_key: Mapped[str] = mapped_column(String(128), primary_key=True)
+    descendant_key: Mapped[str] = mapped_column(
+        String(128), primary_key=True, index=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class TaxonomyChange(Base):
+    """Log of taxonomy edits; the latest id is the taxonomy version."""
+
+    __tablename__ = "taxonomy_changes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    ingredient_key: Mapped[str] = mapped_column(String(128), nullable=False)
+    # None when the ingredient was detached from its parent
+    parent_key: Mapped[str | None] = mapped_column(String(128))
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    # Never reuse ids on SQLite: in-memory indexes are cached per version
+    __table_args__ = {"sqlite_autoincrement": True}
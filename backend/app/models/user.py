@@ -16,6 +16,10 @@ class User(Base):
     provider: Mapped[str] = mapped_column(String(32), default="local", nullable=False)
     provider_id: Mapped[str | None] = mapped_column(String(128), index=True)
     hashed_password: Mapped[str | None] = mapped_column(String(255))
+    # Bumped on every pantry change; keys the cached recommendations
+    pantry_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # Relationships
     pantry_ingredients: Mapped[list[UserIngredient]] = relationship(
@@ -26,3 +26,18 @@ class PantryUpdate(BaseModel):
     """Schema for updating pantry ingredient quantity."""
 
     quantity: float = Field(..., ge=0.0, le=1.0, description="Quantity as fraction 0-1")
+
+
+class IngredientSuggestion(BaseModel):
+    """One ingredient autocomplete suggestion."""
+
+    name: str = Field(..., description="Ingredient name as used in the catalog")
+    recipe_count: int = Field(..., description="Number of recipes using it")
+
+
+class IngredientAutocompleteResponse(BaseModel):
+    """Schema for the ingredient autocomplete endpoint response."""
+
+    suggestions: list[IngredientSuggestion] = Field(
+        ..., description="Matching ingredients, most used first"
+    )
@@ -9,6 +9,13 @@ class MatchScore(BaseModel):
     percentage: float = Field(..., description="Match percentage (0-100)")
 
 
+class Substitution(BaseModel):
+    """A recipe ingredient covered by a different pantry ingredient."""
+
+    ingredient: str = Field(..., description="Ingredient the recipe calls for")
+    substitute: str = Field(..., description="Pantry ingredient used in its place")
+
+
 class CocktailRecommendation(BaseModel):
     """Schema for a single cocktail recommendation."""
 
@@ -25,6 +32,18 @@ class CocktailRecommendation(BaseModel):
         default_factory=list, description="Ingredients missing from pantry"
     )
     match_score: MatchScore = Field(..., description="Match score details")
+    abv: float | None = Field(None, description="Estimated ABV (%), undiluted")
+    volume_ml: float | None = Field(None, description="Estimated volume in ml")
+    substitutions: list[Substitution] = Field(
+        default_factory=list,
+        description="Ingredients matched through a substitute (e.g. Cointreau "
+        "for Triple Sec)",
+    )
+    servings: int | None = Field(
+        None,
+        description="Servings the pantry's quantities allow (0 when not "
+        "makeable); null when the recipe's measures are unknown",
+    )
 
 
 class RecommendationsResponse(BaseModel):
@@ -33,7 +52,110 @@ class RecommendationsResponse(BaseModel):
     cocktails: list[CocktailRecommendation] = Field(
         ..., description="List of recommended cocktails"
     )
-    total_found: int = Field(..., description="Total number of cocktails found")
+    total_found: int = Field(..., description="Number of cocktails in this page")
     fully_makeable_count: int = Field(
         ..., description="Number of fully makeable cocktails"
     )
+    total_ranked: int = Field(
+        default=0, description="Number of cocktails in the whole ranking"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page, if any"
+    )
+    facets: dict[str, dict[str, int]] | None = Field(
+        default=None,
+        description="category / glass / alcoholic -> value -> ranked cocktails"
+        " (catalog rankings only)",
+    )
+
+
+class CocktailIngredient(BaseModel):
+    """One ingredient line of a cocktail."""
+
+    name: str = Field(..., description="Ingredient name")
+    measure: str | None = Field(None, description="Measure as written upstream")
+    measure_ml: float | None = Field(
+        None, description="Measure in millilitres, if it has a volume"
+    )
+
+
+class CocktailSummary(BaseModel):
+    """Schema for a cocktail in a list of search results."""
+
+    id: str = Field(..., description="Cocktail ID from TheCocktailDB")
+    name: str = Field(..., description="Cocktail name")
+    thumbnail: str | None = Field(None, description="Thumbnail image URL")
+    category: str | None = Field(None, description="Cocktail category")
+    abv: float | None = Field(None, description="Estimated ABV (%), undiluted")
+    volume_ml: float | None = Field(None, description="Estimated volume in ml")
+
+
+class SimilarCocktail(CocktailSummary):
+    """A cocktail with a similar ingredient set."""
+
+    similarity: float = Field(
+        ..., description="Jaccard similarity of the ingredient sets (0-1)"
+    )
+    shared_ingredients: list[str] = Field(
+        default_factory=list, description="Ingredients both cocktails use"
+    )
+
+
+class SimilarCocktailsResponse(BaseModel):
+    """Schema for the similar-cocktails endpoint response."""
+
+    cocktails: list[SimilarCocktail] = Field(
+        ..., description="Most similar cocktails first"
+    )
+
+
+class CocktailDetail(CocktailSummary):
+    """Schema for a single cocktail's detail page."""
+
+    glass: str | None = Field(None, description="Serving glass")
+    alcoholic: str | None = Field(None, description="Alcoholic / Non alcoholic")
+    instructions: str | None = Field(None, description="Preparation instructions")
+    ingredients: list[CocktailIngredient] = Field(
+        default_factory=list, description="Ingredients with their measures"
+    )
+
+
+class CocktailSearchResponse(BaseModel):
+    """Schema for cocktail search endpoint response."""
+
+    cocktails: list[CocktailSummary] = Field(
+        ..., description="Cocktails matching the query"
+    )
+    total_found: int = Field(..., description="Number of cocktails returned")
+    total_matches: int = Field(
+        default=0, description="Number of cocktails matching the query in total"
+    )
+    next_offset: int | None = Field(
+        default=None, description="offset of the next page; null on the last page"
+    )
+    did_you_mean: str | None = Field(
+        default=None,
+        description="Spelling-corrected query, when the query matched nothing",
+    )
+    facets: dict[str, dict[str, int]] | None = Field(
+        default=None,
+        description="category / glass / alcoholic -> value -> matching cocktails",
+    )
+
+
+class IngredientUnlock(BaseModel):
+    """An ingredient the user lacks and what buying it would unlock."""
+
+    ingredient: str = Field(..., description="Ingredient name")
+    unlocks: int = Field(..., description="Cocktails that would become fully makeable")
+    cocktails: list[str] = Field(
+        default_factory=list, description="Names of some of those cocktails"
+    )
+
+
+class UnlocksResponse(BaseModel):
+    """Schema for the buy-one-bottle endpoint response."""
+
+    unlocks: list[IngredientUnlock] = Field(
+        ..., description="Missing ingredients, most unlocked cocktails first"
+    )
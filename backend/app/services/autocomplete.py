@@ -0,0 +1,112 @@
+import re
+from collections import Counter
+from threading import Lock
+
+from sqlalchemy.orm import Session
+
+from app.services import catalog, recommender
+from app.services.normalize import ALIASES_TO_COCKTAILDB, normalize_ingredient_name
+from app.services.recommender import RecommenderIndex
+
+MAX_SUGGESTIONS = 25  # best suggestions kept at every trie node
+
+_SPACES = re.compile(r"\s+")
+
+
+def fold(text: str) -> str:
+    """Lowercase with single spaces: the form both keys and queries are matched in."""
+    return _SPACES.sub(" ", text.lower()).strip()
+
+
+class _Node:
+    __slots__ = ("children", "ranked")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # name -> recipe count while building; best-first names once frozen
+        self.ranked: dict[str, int] | list[str] = {}
+
+
+class IngredientTrie:
+    """
+    Prefix trie over ingredient names, their later words ("rum" finds "Dark
+    rum") and aliases ("cointreau" finds "Triple Sec").
+
+    Every node keeps its best MAX_SUGGESTIONS names, ranked by how many recipes
+    use them, so a lookup is one walk down the query's characters with no
+    subtree scan.
+    """
+
+    def __init__(self, counts: dict[str, int], aliases: dict[str, str] | None = None):
+        self.counts = counts
+        self.root = _Node()
+        for name in counts:
+            words = fold(name).split(" ")
+            for i in range(len(words)):
+                self._insert(" ".join(words[i:]), name)
+        for alias, name in (aliases or {}).items():
+            if name in counts:
+                self._insert(fold(alias), name)
+        self._freeze(self.root)
+
+    @classmethod
+    def from_index(cls, index: RecommenderIndex) -> "IngredientTrie":
+        # Per ingredient key, not per substitution class: Lime and Lime Juice
+        # are separate suggestions
+        counts = Counter(
+            index.display_names[key]
+            for entry in index.entries
+            for key in set(entry.ingredient_keys)
+            if key
+        )
+        aliases = {}
+        for alias, target in ALIASES_TO_COCKTAILDB.items():
+            key = normalize_ingredient_name(target)
+            if key in index.display_names:
+                aliases[alias] = index.display_names[key]
+        return cls(dict(counts), aliases)
+
+    def _insert(self, key: str, name: str) -> None:
+        node = self.root
+        for ch in key:
+            node = node.children.setdefault(ch, _Node())
+            node.ranked[name] = self.counts[name]
+
+    def _freeze(self, node: _Node) -> None:
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            node.ranked = sorted(node.ranked, key=lambda n: (-self.counts[n], n))[
+                :MAX_SUGGESTIONS
+            ]
+            stack.extend(node.children.values())
+
+    def complete(self, prefix: str, limit: int = 10) -> list[tuple[str, int]]:
+        """Up to `limit` (name, recipe count) pairs for the prefix, most used first."""
+        node = self.root
+        for ch in fold(prefix):
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return [(name, self.counts[name]) for name in node.ranked[:limit]]
+
+
+# ===== Process-wide trie, rebuilt when the catalog version changes =====
+
+_lock = Lock()
+_cached: dict = {"version": None, "trie": None}
+
+
+def get_ingredient_trie(db: Session) -> IngredientTrie | None:
+    """The trie for the current catalog, or None if no catalog was ingested."""
+    version = catalog.catalog_version(db)
+    if version is None:
+        return None
+    with _lock:
+        if _cached["version"] != version:
+            index = recommender.get_recommender(db)
+            if index is None:
+                return None
+            _cached["trie"] = IngredientTrie.from_index(index)
+            _cached["version"] = version
+        return _cached["trie"]
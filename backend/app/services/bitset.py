@@ -0,0 +1,79 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+WORD_BITS = 64
+
+
+def n_words(n_bits: int) -> int:
+    return max(1, -(-n_bits // WORD_BITS))
+
+
+def pack(bits: Iterable[int], n_bits: int) -> np.ndarray:
+    """Pack bit positions into a uint64 vector of n_words(n_bits) words."""
+    vec = np.zeros(n_words(n_bits), dtype=np.uint64)
+    for bit in bits:
+        vec[bit // WORD_BITS] |= np.uint64(1) << np.uint64(bit % WORD_BITS)
+    return vec
+
+
+class BitMatrix:
+    """
+    Packed rows x columns bit matrix (one uint64 word per 64 columns).
+
+    A whole-matrix AND against one packed vector followed by a row popcount
+    is a couple of vectorized numpy passes, independent of how many bits
+    each row has set.
+    """
+
+    def __init__(self, words: np.ndarray, n_cols: int):
+        self.words = words
+        self.n_cols = n_cols
+        self.row_counts = np.bitwise_count(words).sum(axis=1, dtype=np.int32)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[int]], n_cols: int) -> "BitMatrix":
+        row_ids: list[int] = []
+        col_ids: list[int] = []
+        n_rows = 0
+        for r, cols in enumerate(rows):
+            n_rows = r + 1
+            for col in cols:
+                row_ids.append(r)
+                col_ids.append(col)
+        words = np.zeros((n_rows, n_words(n_cols)), dtype=np.uint64)
+        cols_arr = np.asarray(col_ids, dtype=np.uint64)
+        np.bitwise_or.at(
+            words,
+            (
+                np.asarray(row_ids, dtype=np.intp),
+                (cols_arr // WORD_BITS).astype(np.intp),
+            ),
+            np.uint64(1) << (cols_arr % np.uint64(WORD_BITS)),
+        )
+        return cls(words, n_cols)
+
+    @property
+    def n_rows(self) -> int:
+        return self.words.shape[0]
+
+    def pack(self, cols: Iterable[int]) -> np.ndarray:
+        return pack(cols, self.n_cols)
+
+    def and_count(self, vec: np.ndarray) -> np.ndarray:
+        """Per-row popcount of (row AND vec)."""
+        return np.bitwise_count(self.words & vec).sum(axis=1, dtype=np.int32)
+
+
+def pack_mask(mask: np.ndarray) -> np.ndarray:
+    """Pack a boolean array into the uint64 layout of `pack` (bit i = mask[i])."""
+    packed = np.packbits(mask, bitorder="little")
+    out = np.zeros(n_words(len(mask)) * 8, dtype=np.uint8)
+    out[: len(packed)] = packed
+    return out.view("<u8").astype(np.uint64)
+
+
+def unpack_mask(vec: np.ndarray, n_bits: int) -> np.ndarray:
+    """Inverse of pack_mask: the first n_bits bits of vec as a boolean array."""
+    bits = np.unpackbits(vec.astype("<u8").view(np.uint8), bitorder="little")
+    return bits[:n_bits].astype(bool)
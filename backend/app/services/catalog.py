@@ -0,0 +1,210 @@
+import asyncio
+import string
+from datetime import datetime
+from logging import getLogger
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.recipe import CatalogSync, Recipe, RecipeIngredient
+from app.services.measures import parse_measure
+from app.services.normalize import normalize_ingredient_name
+from app.services.outbound_budget import BACKGROUND
+from app.services.similarity import signature_bytes
+from app.services.strength import estimate_strength
+from app.services.substitutions import registry
+from app.services.upstream import UpstreamClient
+
+log = getLogger(__name__)
+
+# TheCocktailDB only supports listing drinks by first letter/digit
+CRAWL_KEYS = string.ascii_lowercase + string.digits
+CRAWL_CONCURRENCY = 4
+MAX_INGREDIENTS = 15  # strIngredient1..15
+
+
+def _clean(value) -> str:
+    """CocktailDB uses null, "" and whitespace interchangeably for empty slots."""
+    return (value or "").strip()
+
+
+def parse_drink(drink: dict) -> dict:
+    """Flatten a raw CocktailDB drink into the fields we store."""
+    ingredients = []
+    for i in range(1, MAX_INGREDIENTS + 1):
+        name = _clean(drink.get(f"strIngredient{i}"))
+        if not name:
+            continue
+        measure = _clean(drink.get(f"strMeasure{i}"))[:64] or None
+        ingredients.append(
+            {
+                "position": i,
+                "name": name[:128],
+                "measure": measure,
+                "measure_ml": parse_measure(measure),
+            }
+        )
+    volume_ml, abv = estimate_strength(
+        (ing["name"], ing["measure_ml"]) for ing in ingredients
+    )
+    return {
+        "drink_id": str(drink.get("idDrink", "")),
+        "name": _clean(drink.get("strDrink")),
+        "thumbnail": drink.get("strDrinkThumb") or None,
+        "category": drink.get("strCategory") or None,
+        "glass": drink.get("strGlass") or None,
+        "alcoholic": drink.get("strAlcoholic") or None,
+        "instructions": drink.get("strInstructions") or None,
+        "volume_ml": volume_ml,
+        "abv": abv,
+        "minhash": signature_bytes(
+            registry.class_of(normalize_ingredient_name(ing["name"]))
+            for ing in ingredients
+        ),
+        "ingredients": ingredients,
+    }
+
+
+# ===== Crawl =====
+
+
+async def fetch_catalog(client: UpstreamClient) -> tuple[list[dict], list[str]]:
+    """
+    Crawl the whole CocktailDB dataset letter by letter (search.php?f=).
+    Returns (drinks, failed_keys); drinks are de-duplicated by idDrink.
+    """
+    sem = asyncio.Semaphore(CRAWL_CONCURRENCY)
+
+    async def fetch_key(key: str) -> list[dict]:
+        async with sem:
+            data = await client.get_json("search.php", {"f": key}, lane=BACKGROUND)
+            return data.get("drinks") or []
+
+    results = await asyncio.gather(
+        *(fetch_key(k) for k in CRAWL_KEYS), return_exceptions=True
+    )
+
+    drinks: dict[str, dict] = {}
+    failed: list[str] = []
+    for key, result in zip(CRAWL_KEYS, results):
+        if isinstance(result, Exception):
+            log.warning("Catalog crawl failed for %r: %s", key, result)
+            failed.append(key)
+            continue
+        for drink in result:
+            if drink.get("idDrink"):
+                drinks[str(drink["idDrink"])] = drink
+    return list(drinks.values()), failed
+
+
+# ===== Store =====
+
+
+def upsert_drinks(db: Session, drinks: list[dict]) -> int:
+    """Insert or update recipes (and replace their ingredients). Returns rows written."""
+    parsed = [
+        p for p in (parse_drink(d) for d in drinks) if p["drink_id"] and p["name"]
+    ]
+    existing = {
+        r.drink_id: r
+        for r in db.execute(
+            select(Recipe)
+            .where(Recipe.drink_id.in_([p["drink_id"] for p in parsed]))
+            .options(selectinload(Recipe.ingredients))
+        ).scalars()
+    }
+
+    for p in parsed:
+        ingredients = [RecipeIngredient(**ing) for ing in p.pop("ingredients")]
+        recipe = existing.get(p["drink_id"])
+        if recipe is None:
+            recipe = Recipe(**p)
+            db.add(recipe)
+        else:
+            for field, value in p.items():
+                setattr(recipe, field, value)
+            # flush the removals first so (recipe_id, position) stays unique
+            recipe.ingredients.clear()
+            db.flush()
+        recipe.ingredients.extend(ingredients)
+
+    db.commit()
+    return len(parsed)
+
+
+async def sync_catalog(db: Session, client: UpstreamClient) -> CatalogSync:
+    """
+    Mirror the whole CocktailDB catalog into the local tables.
+    Drinks that disappeared upstream are only pruned after a complete crawl.
+    """
+    run = CatalogSync()
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+
+    drinks, failed = await fetch_catalog(client)
+    run.drink_count = upsert_drinks(db, drinks)
+
+    if not failed:
+        seen = [str(d["idDrink"]) for d in drinks]
+        stale = select(Recipe.id).where(Recipe.drink_id.not_in(seen))
+        # bulk deletes skip ORM cascades, so drop the ingredient rows explicitly
+        db.execute(
+            delete(RecipeIngredient).where(RecipeIngredient.recipe_id.in_(stale))
+        )
+        db.execute(delete(Recipe).where(Recipe.id.in_(stale)))
+
+    run.failed_keys = "".join(failed) or None
+    run.finished_at = datetime.utcnow()
+    db.commit()
+    db.refresh(run)
+    log.info(
+        "Catalog sync %s: %s drinks, failed keys=%r", run.id, run.drink_count, failed
+    )
+    return run
+
+
+# ===== Read =====
+
+
+def catalog_version(db: Session) -> int | None:
+    """Id of the latest finished sync, or None if the catalog was never ingested."""
+    return db.execute(
+        select(func.max(CatalogSync.id)).where(CatalogSync.finished_at.is_not(None))
+    ).scalar()
+
+
+def has_catalog(db: Session) -> bool:
+    return db.execute(select(Recipe.id).limit(1)).first() is not None
+
+
+def drinks_in_abv_range(
+    db: Session, abv_min: float | None = None, abv_max: float | None = None
+) -> set[str]:
+    """
+    drink_ids whose estimated ABV lies within [abv_min, abv_max], read with a
+    range scan on ix_recipes_abv. Drinks without an estimate never match.
+    """
+    query = select(Recipe.drink_id).where(Recipe.abv.is_not(None))
+    if abv_min is not None:
+        query = query.where(Recipe.abv >= abv_min)
+    if abv_max is not None:
+        query = query.where(Recipe.abv <= abv_max)
+    return set(db.execute(query).scalars())
+
+
+def load_recipes(db: Session) -> list[Recipe]:
+    """All recipes with their ingredients, in one round trip per table."""
+    return list(
+        db.execute(
+            select(Recipe).options(selectinload(Recipe.ingredients)).order_by(Recipe.id)
+        ).scalars()
+    )
+
+
+def get_recipe(db: Session, drink_id: str) -> Recipe | None:
+    return db.execute(
+        select(Recipe)
+        .where(Recipe.drink_id == drink_id)
+        .options(selectinload(Recipe.ingredients))
+    ).scalar_one_or_none()
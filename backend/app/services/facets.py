@@ -0,0 +1,92 @@
+# Facets: category, glass and alcoholic flag of the catalog's recipes, as one
+# packed bitset per value (rows of a BitMatrix over recipe positions). Built
+# with the in-memory indexes whenever the catalog version changes, so filtering
+# is an OR of value rows within a facet and an AND across facets, and counting
+# every value for a result set is one AND + popcount per row.
+
+from collections.abc import Iterable, Mapping, Sequence
+
+import numpy as np
+
+from app.services.bitset import BitMatrix, n_words, unpack_mask
+
+# RecipeEntry attributes (strCategory, strGlass, strAlcoholic upstream)
+FACETS = ("category", "glass", "alcoholic")
+
+
+def facet_key(value: str | None) -> str:
+    return (value or "").strip().casefold()
+
+
+def facet_values(values: Iterable[str] | None) -> tuple[str, ...]:
+    """Requested values of one facet, canonical (folded, sorted, distinct)."""
+    return tuple(sorted({facet_key(v) for v in values or () if facet_key(v)}))
+
+
+class FacetIndex:
+    """
+    One bitset per (facet, value) over the recipes, indexed like `entries`.
+    Values are matched case-insensitively; the first spelling seen is shown.
+    """
+
+    def __init__(self, columns: Mapping[str, Sequence[str | None]], n_entries: int):
+        rows: list[list[int]] = []
+        # (facet, display value) per matrix row
+        self.labels: list[tuple[str, str]] = []
+        # facet -> folded value -> matrix row
+        self.rows: dict[str, dict[str, int]] = {}
+        for facet, column in columns.items():
+            lookup = self.rows[facet] = {}
+            for idx, value in enumerate(column):
+                key = facet_key(value)
+                if not key:
+                    continue
+                if key not in lookup:
+                    lookup[key] = len(rows)
+                    self.labels.append((facet, value.strip()))
+                    rows.append([])
+                rows[lookup[key]].append(idx)
+        self.n_entries = n_entries
+        self.matrix = BitMatrix.from_rows(rows, n_entries)
+
+    @classmethod
+    def from_entries(cls, entries: Sequence) -> "FacetIndex":
+        return cls(
+            {facet: [getattr(e, facet) for e in entries] for facet in FACETS},
+            len(entries),
+        )
+
+    def select(self, filters: Mapping[str, Iterable[str]]) -> np.ndarray | None:
+        """
+        Packed bitset of the recipes having one of the requested values of
+        every filtered facet; None when no facet is filtered.
+        """
+        vec = None
+        for facet, values in filters.items():
+            values = facet_values(values)
+            if not values:
+                continue
+            lookup = self.rows.get(facet, {})
+            hits = [lookup[v] for v in values if v in lookup]
+            if hits:
+                union = np.bitwise_or.reduce(self.matrix.words[hits], axis=0)
+            else:
+                union = np.zeros(n_words(self.n_entries), dtype=np.uint64)
+            vec = union if vec is None else vec & union
+        return vec
+
+    def mask(self, filters: Mapping[str, Iterable[str]]) -> np.ndarray | None:
+        """select() as a boolean array over the recipes."""
+        vec = self.select(filters)
+        return None if vec is None else unpack_mask(vec, self.n_entries)
+
+    def counts(self, vec: np.ndarray) -> dict[str, dict[str, int]]:
+        """facet -> value -> recipes of the packed result set having it, largest first."""
+        out: dict[str, dict[str, int]] = {facet: {} for facet in self.rows}
+        per_row = self.matrix.and_count(vec).tolist()
+        order = sorted(range(len(per_row)), key=lambda r: (-per_row[r], self.labels[r]))
+        for row in order:
+            if per_row[row]:
+                facet, value = self.labels[row]
+                out[facet][value] = per_row[row]
+        return out
@@ -0,0 +1,141 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import numpy as np
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+LATENCY_WINDOW = 500  # recent successful calls the p95 is taken over
+MIN_SAMPLES = 20  # no hedging until the p95 means something
+
+
+class Hedger:
+    """
+    Hedged requests: when a call is still pending at the observed p95
+    latency, a duplicate is sent and the first successful reply wins.
+
+    Hedges are paid for from a budget that every primary call tops up by
+    `budget` (0.05 = at most ~5% extra requests), capped at `burst`, so a
+    general slowdown or outage cannot double the upstream load.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        percentile: float = 95.0,
+    ):
+        self.enabled = enabled
+        self.budget = budget
+        self.burst = burst
+        self.percentile = percentile
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._tokens = 0.0
+
+        # Stats
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.over_budget = 0
+
+    @classmethod
+    def from_settings(cls) -> "Hedger":
+        return cls(
+            enabled=settings.UPSTREAM_HEDGE_ENABLED,
+            budget=settings.UPSTREAM_HEDGE_BUDGET,
+        )
+
+    def observe(self, seconds: float) -> None:
+        """Latency of a successful call."""
+        self._latencies.append(seconds)
+
+    def delay(self) -> float | None:
+        """How long to wait before hedging (the current p95), or None."""
+        if not self.enabled or len(self._latencies) < MIN_SAMPLES:
+            return None
+        return float(np.percentile(self._latencies, self.percentile))
+
+    def _spend(self) -> bool:
+        if self._tokens < 1:
+            self.over_budget += 1
+            return False
+        self._tokens -= 1
+        return True
+
+    async def run(
+        self, send: Callable[[], Awaitable[T]], admitted: asyncio.Event | None = None
+    ) -> T:
+        """
+        Run `send`, hedging it with a second `send` if it is slow. With
+        `admitted`, the p95 timer starts only once it is set: time queued
+        locally (rate budget, concurrency limit) is not upstream latency, and a
+        hedge would only join the same queue.
+        """
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.budget)
+        delay = self.delay()
+        if delay is None:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        waiting = asyncio.ensure_future(admitted.wait()) if admitted else None
+        try:
+            if waiting is not None:
+                await asyncio.wait(
+                    {primary, waiting}, return_when=asyncio.FIRST_COMPLETED
+                )
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._spend():
+                return await primary
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(send())
+            winner = await _first_success([primary, hedge])
+            if winner is hedge:
+                self.hedge_wins += 1
+            return winner.result()
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        finally:
+            if waiting is not None:
+                waiting.cancel()
+
+    def stats(self) -> dict:
+        delay = self.delay()
+        return {
+            "enabled": self.enabled,
+            "p95_ms": round(delay * 1000, 3) if delay is not None else None,
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "over_budget": self.over_budget,
+            "hedge_rate": (
+                round(self.hedged / self.requests, 4) if self.requests else 0.0
+            ),
+            "win_rate": round(self.hedge_wins / self.hedged, 4) if self.hedged else 0.0,
+        }
+
+
+async def _first_success(tasks: list[asyncio.Future]) -> asyncio.Future:
+    """The first task to succeed (the others are cancelled); raises if all fail."""
+    pending = set(tasks)
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
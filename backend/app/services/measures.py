@@ -0,0 +1,103 @@
+# Measure parsing: CocktailDB's free-text strMeasureN ("1 1/2 oz", "2 cl",
+# "2-3 dashes", "½ shot") to millilitres. Run once per ingredient at catalog
+# ingest; the result is stored in recipe_ingredients.measure_ml.
+
+import re
+from fractions import Fraction
+
+BOTTLE_ML = 750.0  # a pantry quantity of 1.0 is one standard bottle
+# Pantry items below this fraction of a bottle (~15 ml) count as used up
+EMPTY_BOTTLE_FRACTION = 0.02
+
+OZ_ML = 29.5735
+
+ML_PER_UNIT: dict[str, float] = {
+    "ml": 1.0,
+    "cl": 10.0,
+    "dl": 100.0,
+    "l": 1000.0,
+    "liter": 1000.0,
+    "litre": 1000.0,
+    "oz": OZ_ML,
+    "ounce": OZ_ML,
+    # recipes in parts read as ounces
+    "part": OZ_ML,
+    "shot": 1.5 * OZ_ML,
+    "jigger": 1.5 * OZ_ML,
+    "tsp": 4.929,
+    "teaspoon": 4.929,
+    "tbsp": 14.787,
+    "tblsp": 14.787,
+    "tablespoon": 14.787,
+    "cup": 236.588,
+    "pint": 473.176,
+    "quart": 946.353,
+    "qt": 946.353,
+    "dash": 0.92,
+    "splash": 0.25 * OZ_ML,
+    "drop": 0.05,
+    "pinch": 0.36,
+    "can": 355.0,
+    "bottle": BOTTLE_ML,
+}
+
+_UNICODE_FRACTIONS = {
+    "½": "1/2",
+    "⅓": "1/3",
+    "⅔": "2/3",
+    "¼": "1/4",
+    "¾": "3/4",
+    "⅛": "1/8",
+}
+_NUMBER = r"\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?"
+_AMOUNT = re.compile(rf"({_NUMBER})(?:\s*(?:-|–|to|or)\s*({_NUMBER}))?")
+_UNIT = re.compile(r"(?:fl\.?\s*)?([a-z]+)")
+
+
+def _number(text: str) -> float | None:
+    # None for malformed amounts such as "1/0"
+    try:
+        return float(sum(Fraction(part) for part in text.split()))
+    except (ZeroDivisionError, ValueError):
+        return None
+
+
+def _unit_ml(word: str) -> float | None:
+    # "oz", "parts", "dashes"; only plural endings are stripped, so "lb" is not "l"
+    candidates = [word]
+    if word.endswith("es"):
+        candidates.append(word[:-2])
+    if word.endswith("s"):
+        candidates.append(word[:-1])
+    for candidate in candidates:
+        if candidate in ML_PER_UNIT:
+            return ML_PER_UNIT[candidate]
+    return None
+
+
+def parse_measure(text: str | None) -> float | None:
+    """
+    Millilitres for a measure, or None when it has no volume ("Juice of 1/2",
+    "Garnish", "Fill with"). Ranges use their midpoint; a bare unit
+    ("Dash", "Splash") means one of it.
+    """
+    if not text:
+        return None
+    text = text.lower().strip()
+    for char, fraction in _UNICODE_FRACTIONS.items():
+        text = text.replace(char, f" {fraction}")
+
+    match = _AMOUNT.match(text.strip())
+    if match:
+        low = _number(match.group(1))
+        high = _number(match.group(2)) if match.group(2) else low
+        if low is None or high is None:
+            return None
+        amount, rest = (low + high) / 2, text.strip()[match.end() :]
+    else:
+        amount, rest = 1.0, text
+    unit = _UNIT.match(rest.strip())
+    ml = _unit_ml(unit.group(1)) if unit else None
+    if ml is None or amount <= 0:
+        return None
+    return round(amount * ml, 2)
@@ -0,0 +1,91 @@
+# Ingredient name normalization shared by the catalog, pantry and recommenders.
+# Mirrors frontend/app/utils/normalize.ts (normalizeKey / normalizeIngredient),
+# including its ALIASES_TO_COCKTAILDB table; keep the two in sync.
+
+import re
+from functools import lru_cache
+
+# Distinct ingredient strings in CocktailDB + pantries are a few thousand
+NORMALIZE_CACHE_SIZE = 8192
+
+_STRIP = re.compile(r"[\(\)\[\]\{\}:,_\-–—]")
+_SPACES = re.compile(r"\s+")
+_FILLER = re.compile(
+    r"\b(fresh|house|homemade|of|the|and|a|ml|oz|ounce|ounces|tsp|tbsp|dash|dashes)\b"
+)
+_WORD = re.compile(r"\w\S*")
+
+# Map common variants -> CocktailDB *canonical* ingredient names (exact casing)
+ALIASES_TO_COCKTAILDB: dict[str, str] = {
+    "gin": "Gin",
+    "dry gin": "Gin",
+    "london dry gin": "Gin",
+    "tequila": "Tequila",
+    "blanco tequila": "Tequila",
+    "silver tequila": "Tequila",
+    "white rum": "White Rum",
+    "light rum": "White Rum",
+    "rum": "Rum",
+    "gold rum": "Rum",
+    "dark rum": "Dark Rum",
+    "triple sec": "Triple Sec",
+    "cointreau": "Triple Sec",
+    "curaçao": "Triple Sec",
+    "orange curaçao": "Triple Sec",
+    "sweet vermouth": "Sweet Vermouth",
+    "rosso vermouth": "Sweet Vermouth",
+    "dry vermouth": "Dry Vermouth",
+    "angostura bitters": "Angostura bitters",
+    "bitters": "Bitters",
+    "simple syrup": "Sugar Syrup",
+    "sugar syrup": "Sugar Syrup",
+    "club soda": "Soda Water",
+    "soda": "Soda Water",
+    "fresh lime juice": "Lime Juice",
+    "lime juice": "Lime Juice",
+    "fresh lemon juice": "Lemon Juice",
+    "lemon juice": "Lemon Juice",
+}
+
+
+def _collapse(text: str) -> str:
+    return _SPACES.sub(" ", _STRIP.sub(" ", text)).strip()
+
+
+def _singular(text: str) -> str:
+    # Basic singularization
+    if text.endswith("ies") and len(text) > 3:
+        return text[:-3] + "y"
+    if text.endswith("s") and len(text) > 3:
+        return text[:-1]
+    return text
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_ingredient_name(name: str) -> str:
+    """
+    Comparable key for an ingredient name: lowercase, no punctuation, no
+    filler/unit words, singular, and folded onto its CocktailDB alias.
+    Memoized, so each distinct string is only normalized once per process.
+    """
+    if not name:
+        return ""
+    lower = _collapse(name.lower())
+    key = _SPACES.sub(" ", _FILLER.sub("", lower)).strip()
+    alias = ALIASES_TO_COCKTAILDB.get(key)
+    if alias is None:
+        key = _singular(key)
+        alias = ALIASES_TO_COCKTAILDB.get(key)
+    return alias.lower() if alias else key
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def canonical_name(name: str) -> str:
+    """Display / CocktailDB lookup name for an ingredient (normalizeIngredient)."""
+    if not name:
+        return ""
+    collapsed = _collapse(name)
+    lower = collapsed.lower()
+    key = _SPACES.sub(" ", _FILLER.sub("", lower)).strip()
+    alias = ALIASES_TO_COCKTAILDB.get(key) or ALIASES_TO_COCKTAILDB.get(lower)
+    return alias or _WORD.sub(lambda m: m[0][0].upper() + m[0][1:].lower(), collapsed)
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+
+from app.core.config import settings
+
+# Priority lanes, highest first
+INTERACTIVE = "interactive"  # route handlers: someone is waiting on the reply
+BACKGROUND = "background"  # catalog sync, cache refreshes and warming
+LANES = (INTERACTIVE, BACKGROUND)
+
+
+class LaneStats:
+    def __init__(self):
+        self.admitted = 0
+        self.queued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.admitted += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def as_dict(self, waiting: int) -> dict:
+        return {
+            "waiting": waiting,
+            "admitted": self.admitted,
+            "queued_total": self.queued,
+            "wait_ms_avg": (
+                round(self.wait_total / self.admitted * 1000, 3)
+                if self.admitted
+                else 0.0
+            ),
+            "wait_ms_max": round(self.wait_max * 1000, 3),
+        }
+
+
+class OutboundBudget:
+    """
+    Token bucket for requests sent to TheCocktailDB (the public API key is
+    rate-limited), with strict-priority lanes: a free token always goes to a
+    waiting interactive request before any background one.
+
+    `rate` tokens per second refill the bucket up to `burst`; rate <= 0
+    disables the budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._queues: dict[str, deque[asyncio.Future]] = {
+            lane: deque() for lane in LANES
+        }
+        self._dispatcher: asyncio.Task | None = None
+        self.lanes = {lane: LaneStats() for lane in LANES}
+
+    @classmethod
+    def from_settings(cls) -> "OutboundBudget":
+        return cls(
+            rate=settings.UPSTREAM_RATE_PER_SECOND, burst=settings.UPSTREAM_RATE_BURST
+        )
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _waiting(self) -> bool:
+        return any(self._queues[lane] for lane in LANES)
+
+    async def acquire(self, lane: str = INTERACTIVE) -> None:
+        """Wait for a token in the given lane."""
+        if self.rate <= 0:
+            return
+        stats = self.lanes[lane]
+        started = self.clock()
+        self._refill()
+        if self._tokens >= 1 and not self._waiting():
+            self._tokens -= 1
+            stats.record(0.0)
+            return
+
+        stats.queued += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[lane].append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Granted just before the cancellation landed: give the token back
+            if waiter.done() and not waiter.cancelled():
+                self._tokens += 1
+            raise
+        stats.record(self.clock() - started)
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to queued requests, highest lane first, as they refill."""
+        while self._waiting():
+            self._refill()
+            for lane in LANES:
+                queue = self._queues[lane]
+                while queue and self._tokens >= 1:
+                    waiter = queue.popleft()
+                    if not waiter.done():
+                        self._tokens -= 1
+                        waiter.set_result(None)
+            if self._waiting():
+                await asyncio.sleep(max(1 - self._tokens, 0) / self.rate)
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3),
+            "lanes": {
+                lane: self.lanes[lane].as_dict(
+                    sum(1 for w in self._queues[lane] if not w.done())
+                )
+                for lane in LANES
+            },
+        }
+
+    def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
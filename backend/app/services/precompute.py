@@ -0,0 +1,215 @@
+import os
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from logging import getLogger
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.ingredient import Ingredient
+from app.models.link_tables import UserIngredient
+from app.models.recipe import PrecomputedRecommendation
+from app.models.user import User
+from app.services import catalog, recommender, taxonomy
+from app.services.recommender import RecipeEntry, RecommenderIndex
+from app.services.substitutions import PantryClasses
+
+log = getLogger(__name__)
+
+USER_CHUNK = 500  # users per read, worker task and bulk write
+
+# (user_id, pantry_version, [(pantry ingredient name as stored, quantity), ...])
+Pantry = tuple[int, int, list[tuple[str, float]]]
+# (user_id, pantry_version, [(entry index, matched, total), ...] best first)
+ScoredPantry = tuple[int, int, list[tuple[int, int, int]]]
+
+
+@dataclass
+class PrecomputeRun:
+    catalog_version: int | None = None
+    taxonomy_version: int = 0
+    users: int = 0
+    rows: int = 0
+
+
+# ===== Reading =====
+
+
+def iter_pantry_chunks(
+    db: Session, chunk_size: int = USER_CHUNK
+) -> Iterator[list[Pantry]]:
+    """Every user with their pantry, chunk_size users at a time (keyset on id)."""
+    last_id = 0
+    while True:
+        users = db.execute(
+            select(User.id, User.pantry_version)
+            .where(User.id > last_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+        ).all()
+        if not users:
+            return
+        items: dict[int, list[tuple[str, float]]] = defaultdict(list)
+        pantry_rows = db.execute(
+            select(UserIngredient.user_id, Ingredient.name, UserIngredient.quantity)
+            .join(UserIngredient.ingredient)
+            .where(UserIngredient.user_id.in_([u.id for u in users]))
+        )
+        for user_id, name, quantity in pantry_rows:
+            items[user_id].append((name, quantity))
+        yield [(u.id, u.pantry_version, items.get(u.id, [])) for u in users]
+        last_id = users[-1].id
+
+
+def load_precomputed(
+    db: Session,
+    user_id: int,
+    pantry_version: int,
+    catalog_version: int,
+    taxonomy_version: int = 0,
+) -> list[tuple[str, int, int]] | None:
+    """
+    The user's stored (drink_id, matched, total) rows, best first, or None
+    when the job has not covered this pantry and catalog version yet.
+    """
+    rows = db.execute(
+        select(
+            PrecomputedRecommendation.drink_id,
+            PrecomputedRecommendation.matched,
+            PrecomputedRecommendation.total,
+        )
+        .where(
+            PrecomputedRecommendation.user_id == user_id,
+            PrecomputedRecommendation.pantry_version == pantry_version,
+            PrecomputedRecommendation.catalog_version == catalog_version,
+            PrecomputedRecommendation.taxonomy_version == taxonomy_version,
+        )
+        .order_by(PrecomputedRecommendation.rank)
+    ).all()
+    return [tuple(r) for r in rows] or None
+
+
+# ===== Scoring (runs in worker processes) =====
+
+
+def score_pantries(
+    index: RecommenderIndex,
+    pantries: list[Pantry],
+    top: int | None = None,
+    ancestors: dict[str, frozenset[str]] | None = None,
+) -> list[ScoredPantry]:
+    return [
+        (
+            user_id,
+            pantry_version,
+            index.ranked(
+                PantryClasses.from_items(pantry, ancestors=ancestors).classes, top
+            ),
+        )
+        for user_id, pantry_version, pantry in pantries
+    ]
+
+
+# Each worker process builds the index once, from the entries it was started with
+_worker_index: RecommenderIndex | None = None
+_worker_ancestors: dict[str, frozenset[str]] | None = None
+
+
+def _init_worker(
+    entries: list[RecipeEntry], ancestors: dict[str, frozenset[str]]
+) -> None:
+    global _worker_index, _worker_ancestors
+    _worker_index = RecommenderIndex(entries)
+    _worker_ancestors = ancestors
+
+
+def _score_chunk(pantries: list[Pantry]) -> list[ScoredPantry]:
+    return score_pantries(_worker_index, pantries, ancestors=_worker_ancestors)
+
+
+# ===== Writing =====
+
+
+def write_chunk(
+    db: Session,
+    index: RecommenderIndex,
+    scored: list[ScoredPantry],
+    catalog_version: int,
+    taxonomy_version: int = 0,
+) -> int:
+    """Replace the stored rankings of the chunk's users; returns rows written."""
+    rows = [
+        {
+            "user_id": user_id,
+            "rank": rank,
+            "drink_id": index.entries[idx].drink_id,
+            "matched": matched,
+            "total": total,
+            "pantry_version": pantry_version,
+            "catalog_version": catalog_version,
+            "taxonomy_version": taxonomy_version,
+        }
+        for user_id, pantry_version, ranked in scored
+        for rank, (idx, matched, total) in enumerate(ranked)
+    ]
+    db.execute(
+        delete(PrecomputedRecommendation).where(
+            PrecomputedRecommendation.user_id.in_([s[0] for s in scored])
+        )
+    )
+    if rows:
+        db.execute(insert(PrecomputedRecommendation), rows)
+    db.commit()
+    return len(rows)
+
+
+def precompute_all(
+    db: Session, workers: int | None = None, chunk_size: int = USER_CHUNK
+) -> PrecomputeRun:
+    """
+    Score every user's pantry against the catalog and store the rankings:
+    every reachable recipe, so stored rankings page exactly like live ones.
+
+    Chunks of users are scored in a process pool (one process per core by
+    default) while the parent keeps reading pantries and bulk-writing results;
+    at most two chunks per worker are in flight at once.
+    """
+    index = recommender.get_recommender(db)
+    run = PrecomputeRun(
+        catalog_version=catalog.catalog_version(db),
+        taxonomy_version=taxonomy.taxonomy_version(db),
+    )
+    if index is None:
+        log.warning("No catalog ingested; nothing to precompute")
+        return run
+    ancestors = taxonomy.get_taxonomy(db).ancestors
+
+    def record(scored: list[ScoredPantry]) -> None:
+        run.users += len(scored)
+        run.rows += write_chunk(
+            db, index, scored, run.catalog_version, run.taxonomy_version
+        )
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in iter_pantry_chunks(db, chunk_size):
+            record(score_pantries(index, chunk, ancestors=ancestors))
+        return run
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(index.entries, ancestors),
+    ) as pool:
+        pending = set()
+        for chunk in iter_pantry_chunks(db, chunk_size):
+            pending.add(pool.submit(_score_chunk, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+        for future in pending:
+            record(future.result())
+    return run
@@ -0,0 +1,68 @@
+import base64
+import heapq
+import json
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# (not fully makeable, -match percentage, position); tuples sort best-first
+ScoreRow = tuple[bool, float, int]
+
+
+class Ranking(Generic[T]):
+    """
+    A scored result set kept as lightweight tuples.
+
+    Pages are cut with a bounded heap (top offset+limit rows) and only the
+    rows actually returned are materialized into response objects.
+    `facets` holds the per-value facet counts of the whole set, when known;
+    `sampled` marks sets scored from an upstream sample, not the catalog.
+    """
+
+    def __init__(
+        self,
+        rows: list[ScoreRow],
+        materialize: Callable[[int], T],
+        facets: dict[str, dict[str, int]] | None = None,
+        sampled: bool = False,
+    ):
+        self.rows = rows
+        self.materialize = materialize
+        self.facets = facets
+        self.sampled = sampled
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def page(self, offset: int, limit: int) -> list[T]:
+        top = heapq.nsmallest(offset + limit, self.rows)
+        return [self.materialize(pos) for _, _, pos in top[offset:]]
+
+
+class CursorError(ValueError):
+    """Cursor is malformed or belongs to a different ranking."""
+
+
+def _key_payload(ranking_key: tuple) -> list:
+    # As the key reads back from JSON (nested tuples become lists)
+    return json.loads(json.dumps(list(ranking_key)))
+
+
+def encode_cursor(offset: int, ranking_key: tuple) -> str:
+    payload = json.dumps({"o": offset, "k": list(ranking_key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, ranking_key: tuple) -> int:
+    """Offset stored in the cursor; raises CursorError if it no longer applies."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = int(payload["o"])
+        key = payload["k"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise CursorError("Malformed cursor") from e
+    if offset < 0 or key != _key_payload(ranking_key):
+        raise CursorError("Cursor has expired")
+    return offset
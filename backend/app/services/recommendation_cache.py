@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any
+
+from app.models.user import User
+
+RECOMMENDATION_CACHE_SIZE = 2048
+# Rankings of an upstream sample (no catalog yet) may be degraded by an outage;
+# they are kept only long enough to page through
+SAMPLED_RANKING_TTL = 30.0  # seconds
+
+
+class RecommendationCache:
+    """
+    LRU cache of computed recommendations.
+
+    Keys start with (user_id, pantry_version, ...), so a pantry change makes
+    old entries unreachable at once; invalidate_user() also frees them.
+    Entries put with a ttl expire after that many seconds.
+    """
+
+    def __init__(self, maxsize: int = RECOMMENDATION_CACHE_SIZE):
+        self.maxsize = maxsize
+        # key -> (value, monotonic expiry or None)
+        self._entries: OrderedDict[tuple, tuple[Any, float | None]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Hashable, ...]) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry[1] is not None
+                and entry[1] <= time.monotonic()
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self, key: tuple[Hashable, ...], value: Any, ttl: float | None = None
+    ) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == user_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+recommendation_cache = RecommendationCache()
+
+
+def bump_pantry_version(user: User) -> None:
+    """
+    Call on every pantry mutation, before committing it. The increment runs
+    in SQL, so concurrent edits never write the same version.
+    """
+    user.pantry_version = User.pantry_version + 1
+    recommendation_cache.invalidate_user(user.id)
@@ -0,0 +1,296 @@
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.recipe import Recipe
+from app.services import catalog
+from app.services.bitset import BitMatrix
+from app.services.facets import FacetIndex
+from app.services.measures import BOTTLE_ML
+from app.services.normalize import normalize_ingredient_name
+from app.services.similarity import NUM_PERM, LSHIndex, from_bytes, minhash
+from app.services.substitutions import PantryClasses, registry
+
+
+@dataclass(frozen=True, slots=True)
+class RecipeEntry:
+    """Read-only view of a catalog recipe, as held by the in-memory index."""
+
+    drink_id: str
+    name: str
+    thumbnail: str | None
+    category: str | None
+    glass: str | None
+    alcoholic: str | None
+    instructions: str | None
+    # estimated at ingest (services/strength.py); None when nothing was measured
+    volume_ml: float | None
+    abv: float | None
+    ingredients: tuple[str, ...]
+    # normalized key per ingredient (same order as `ingredients`, "" if unusable)
+    ingredient_keys: tuple[str, ...]
+    # substitution class id per ingredient (see services/substitutions.py)
+    ingredient_classes: tuple[str, ...]
+    # parsed measure in ml per ingredient (None when it has no volume)
+    measures_ml: tuple[float | None, ...]
+    # distinct non-empty class ids; len(keys) is the recipe's total
+    keys: frozenset[str]
+    # MinHash signature of `keys` stored at ingest (None for older rows)
+    minhash: bytes | None
+
+
+class RecommenderIndex:
+    """
+    Ingredient -> recipe posting lists over the whole catalog.
+
+    Scoring a pantry only walks the postings of the pantry's ingredients, so its
+    cost grows with pantry size (times the popularity of those ingredients)
+    rather than with catalog size x ingredients per recipe.
+
+    The same recipes are also kept as a packed recipes x ingredients bit matrix
+    for whole-catalog scoring: one AND + popcount gives every recipe's
+    matched count at once.
+
+    Ingredients are indexed by substitution class, so pantries must be given as
+    class ids too (PantryClasses.classes): a pantry with Cointreau then matches
+    a recipe calling for Triple Sec.
+    """
+
+    def __init__(self, entries: list[RecipeEntry]):
+        self.entries = entries
+        self.totals = [len(e.keys) for e in entries]
+        postings: dict[str, list[int]] = {}
+        # first display name seen for each key, for showing keys to users
+        self.display_names: dict[str, str] = {}
+        # same per class id, preferring the name of the class's own key
+        self.class_names: dict[str, str] = {}
+        for idx, entry in enumerate(entries):
+            for key in entry.keys:
+                postings.setdefault(key, []).append(idx)
+            for name, key, class_id in zip(
+                entry.ingredients, entry.ingredient_keys, entry.ingredient_classes
+            ):
+                if key:
+                    self.display_names.setdefault(key, name)
+                    self.class_names.setdefault(class_id, name)
+        for class_id in self.class_names:
+            if class_id in self.display_names:
+                self.class_names[class_id] = self.display_names[class_id]
+        self.postings = postings
+        self.positions = {e.drink_id: idx for idx, e in enumerate(entries)}
+
+        self.vocab = {key: col for col, key in enumerate(sorted(postings))}
+        self.matrix = BitMatrix.from_rows(
+            ([self.vocab[k] for k in e.keys] for e in entries), len(self.vocab)
+        )
+        self.facets = FacetIndex.from_entries(entries)
+
+        # Recipes ingested before signatures were stored are hashed here
+        signatures = np.zeros((len(entries), NUM_PERM), dtype=np.uint32)
+        for idx, entry in enumerate(entries):
+            stored = from_bytes(entry.minhash) if entry.minhash else None
+            signatures[idx] = minhash(entry.keys) if stored is None else stored
+        self.lsh = LSHIndex(signatures, [e.keys for e in entries])
+
+        # Measured ingredients as parallel (recipe, column, ml) arrays grouped by
+        # recipe, so servings for the whole catalog is a few array operations
+        measured: dict[tuple[int, int], float] = {}
+        for idx, entry in enumerate(entries):
+            for class_id, ml in zip(entry.ingredient_classes, entry.measures_ml):
+                if class_id and ml:
+                    cell = (idx, self.vocab[class_id])
+                    measured[cell] = measured.get(cell, 0.0) + ml
+        cells = np.array(list(measured), dtype=np.int64).reshape(-1, 2)
+        self.measure_rows, self.measure_cols = cells[:, 0], cells[:, 1]
+        self.measure_ml = np.fromiter(measured.values(), float, len(measured))
+
+    @classmethod
+    def from_recipes(
+        cls,
+        recipes: Iterable[Recipe],
+        normalize: Callable[[str], str] = normalize_ingredient_name,
+        classify: Callable[[str], str] = registry.class_of,
+    ) -> "RecommenderIndex":
+        entries = []
+        for r in recipes:
+            names = tuple(ing.name for ing in r.ingredients)
+            keys = tuple(normalize(n) for n in names)
+            classes = tuple(classify(k) if k else "" for k in keys)
+            measures = tuple(ing.measure_ml for ing in r.ingredients)
+            entries.append(
+                RecipeEntry(
+                    drink_id=r.drink_id,
+                    name=r.name,
+                    thumbnail=r.thumbnail,
+                    category=r.category,
+                    glass=r.glass,
+                    alcoholic=r.alcoholic,
+                    instructions=r.instructions,
+                    volume_ml=r.volume_ml,
+                    abv=r.abv,
+                    ingredients=names,
+                    ingredient_keys=keys,
+                    ingredient_classes=classes,
+                    measures_ml=measures,
+                    keys=frozenset(c for c in classes if c),
+                    minhash=r.minhash,
+                )
+            )
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def mask(self, drink_ids: Iterable[str]) -> np.ndarray:
+        """Boolean array over `entries`, True for the given drinks."""
+        out = np.zeros(len(self.entries), dtype=bool)
+        positions = self.positions
+        out[[positions[d] for d in drink_ids if d in positions]] = True
+        return out
+
+    def match_counts(self, pantry_keys: Iterable[str]) -> dict[int, int]:
+        """
+        Matched-ingredient count for every recipe reachable from the pantry
+        (i.e. sharing at least one ingredient), in one pass over the postings.
+        """
+        counts: dict[int, int] = {}
+        get = counts.get
+        for key in set(pantry_keys):
+            for idx in self.postings.get(key, ()):
+                counts[idx] = get(idx, 0) + 1
+        return counts
+
+    def score(self, pantry_keys: Iterable[str]) -> list[tuple[int, int, int]]:
+        """(entry index, matched, total) for every reachable recipe."""
+        totals = self.totals
+        return [
+            (idx, matched, totals[idx])
+            for idx, matched in self.match_counts(pantry_keys).items()
+        ]
+
+    def missing_at_most(
+        self, pantry_keys: Iterable[str], k: int
+    ) -> list[tuple[int, int, int]]:
+        """(entry index, matched, total) for recipes missing at most k ingredients."""
+        return [s for s in self.score(pantry_keys) if s[2] - s[1] <= k]
+
+    def score_all(self, pantry_keys: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+        """(matched, total) arrays covering every recipe, indexed like `entries`."""
+        vocab = self.vocab
+        vec = self.matrix.pack(vocab[k] for k in set(pantry_keys) if k in vocab)
+        return self.matrix.and_count(vec), self.matrix.row_counts
+
+    def ranked(
+        self, pantry_keys: Iterable[str], limit: int | None = None
+    ) -> list[tuple[int, int, int]]:
+        """
+        (entry index, matched, total) for reachable recipes, best first: fully
+        makeable, then by match percentage, then catalog order.
+        """
+        matched, totals = self.score_all(pantry_keys)
+        positions = np.flatnonzero(matched)
+        m, t = matched[positions], totals[positions]
+        order = np.lexsort((positions, -(m / t), m != t))[:limit]
+        return list(
+            zip(positions[order].tolist(), m[order].tolist(), t[order].tolist())
+        )
+
+    def servings(self, volumes: Mapping[str, float]) -> np.ndarray:
+        """
+        Whole servings of every recipe that the ml available per class allow,
+        indexed like `entries`: the scarcest measured ingredient decides. inf
+        for recipes without any measured ingredient.
+        """
+        return self._servings(self._available(volumes)[self.measure_cols])
+
+    def _available(self, volumes: Mapping[str, float]) -> np.ndarray:
+        """ml available per vocabulary column."""
+        available = np.zeros(len(self.vocab))
+        for class_id, ml in volumes.items():
+            col = self.vocab.get(class_id)
+            if col is not None:
+                available[col] = ml
+        return available
+
+    def _servings(self, cell_ml: np.ndarray) -> np.ndarray:
+        """servings() from the ml available for each measured (recipe, column) cell."""
+        out = np.full(len(self.entries), np.inf)
+        rows = self.measure_rows
+        if len(rows):
+            starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+            ratios = cell_ml / self.measure_ml
+            out[rows[starts]] = np.floor(np.minimum.reduceat(ratios, starts))
+        return out
+
+    def unlocks(
+        self, pantry_keys: Iterable[str], volumes: Mapping[str, float] | None = None
+    ) -> list[tuple[str, list[int]]]:
+        """
+        Ingredients the pantry lacks, each with the recipes that buying it alone
+        would make fully makeable; most unlocks first. With `volumes`, a recipe
+        only counts if the ml left of its other ingredients, plus a full bottle
+        of the missing one, still make at least one serving.
+        """
+        pantry = set(pantry_keys)
+        matched, totals = self.score_all(pantry)
+        candidates = np.flatnonzero(totals - matched == 1)
+        missing = [
+            next(iter(self.entries[idx].keys - pantry)) for idx in candidates.tolist()
+        ]
+        if volumes is not None and len(candidates):
+            missing_col = np.full(len(self.entries), -1)
+            missing_col[candidates] = [self.vocab[key] for key in missing]
+            cols = self.measure_cols
+            cell_ml = np.where(
+                missing_col[self.measure_rows] == cols,
+                BOTTLE_ML,
+                self._available(volumes)[cols],
+            )
+            servings = self._servings(cell_ml)[candidates]
+            missing = [key for key, s in zip(missing, servings) if s >= 1]
+            candidates = candidates[servings >= 1]
+        by_key: dict[str, list[int]] = defaultdict(list)
+        for idx, key in zip(candidates.tolist(), missing):
+            by_key[key].append(idx)
+        return sorted(by_key.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+
+    def missing_ingredients(self, idx: int, pantry_keys: Collection[str]) -> list[str]:
+        """Display names of a recipe's ingredients that the pantry lacks."""
+        entry = self.entries[idx]
+        return [
+            name
+            for name, class_id in zip(entry.ingredients, entry.ingredient_classes)
+            if class_id and class_id not in pantry_keys
+        ]
+
+    def substitutions(self, idx: int, pantry: PantryClasses) -> list[tuple[str, str]]:
+        """(recipe ingredient, pantry substitute) pairs the match relies on."""
+        entry = self.entries[idx]
+        return pantry.substitutions(
+            entry.ingredients, entry.ingredient_keys, entry.ingredient_classes
+        )
+
+
+# ===== Process-wide index, rebuilt when the catalog version changes =====
+
+_lock = Lock()
+_cached: dict = {"version": None, "index": None}
+
+
+def get_recommender(db: Session) -> RecommenderIndex | None:
+    """
+    The index for the current catalog, or None while it has no recipes (never
+    ingested, or every crawl key of the first sync failed).
+    """
+    version = catalog.catalog_version(db)
+    if version is None or not catalog.has_catalog(db):
+        return None
+    with _lock:
+        if _cached["version"] != version:
+            _cached["index"] = RecommenderIndex.from_recipes(catalog.load_recipes(db))
+            _cached["version"] = version
+        return _cached["index"]
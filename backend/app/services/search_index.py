@@ -0,0 +1,139 @@
+import re
+import sqlite3
+from threading import Lock
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.services import catalog, recommender
+from app.services.recommender import RecommenderIndex
+from app.services.spelling import SymSpell
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD.findall(text.lower())
+
+
+# bm25() column weights: name, ingredients, instructions
+BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+def fts_query(text: str) -> str | None:
+    """
+    FTS5 MATCH expression for free text: every word must match, as a prefix
+    (so "marg" finds Margarita while the user is still typing). Words are
+    quoted, so FTS syntax in user input is matched literally.
+    """
+    words = tokenize(text)
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+
+class SearchIndex:
+    """
+    Full-text index (SQLite FTS5, in memory) over the catalog's names,
+    ingredients and instructions, ranked by BM25 with names weighted highest.
+
+    Built over a RecommenderIndex and keyed by the position of the recipe in
+    its `entries`, so hits map straight back to recipes, and the recommender's
+    facet bitsets (services/facets.py) and masks filter and count matches.
+
+    A SymSpell dictionary of the words in cocktail and ingredient names backs
+    "did you mean" suggestions for misspelled queries.
+    """
+
+    def __init__(self, recipes: RecommenderIndex):
+        entries = recipes.entries
+        self.entries = entries
+        self.facets = recipes.facets
+        self.mask = recipes.mask
+        self._lock = Lock()
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE docs USING fts5("
+            " name, ingredients, instructions,"
+            " tokenize = 'unicode61 remove_diacritics 2',"
+            " prefix = '1 2 3')"
+        )
+        self._conn.executemany(
+            "INSERT INTO docs (rowid, name, ingredients, instructions)"
+            " VALUES (?, ?, ?, ?)",
+            (
+                (idx, e.name, " ".join(e.ingredients), e.instructions or "")
+                for idx, e in enumerate(entries)
+            ),
+        )
+        self._conn.execute("INSERT INTO docs (docs) VALUES ('optimize')")
+        self._conn.commit()
+        self.speller = SymSpell.from_texts(
+            (text for e in entries for text in (e.name, *e.ingredients)), tokenize
+        )
+
+    def matches(self, text: str, allowed: np.ndarray | None = None) -> np.ndarray:
+        """
+        Entry indexes of every match, best first. With `allowed` (a boolean
+        array over entries) only those entries match.
+        """
+        query = fts_query(text)
+        if query is None:
+            return np.zeros(0, dtype=np.intp)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid FROM docs WHERE docs MATCH ?"
+                " ORDER BY bm25(docs, ?, ?, ?), rowid",
+                (query, *BM25_WEIGHTS),
+            ).fetchall()
+        hits = np.fromiter((rowid for (rowid,) in rows), np.intp, len(rows))
+        return hits if allowed is None else hits[allowed[hits]]
+
+    def count(self, text: str) -> int:
+        """Number of matches, without ranking them."""
+        query = fts_query(text)
+        if query is None:
+            return 0
+        with self._lock:
+            return self._conn.execute(
+                "SELECT count(*) FROM docs WHERE docs MATCH ?", (query,)
+            ).fetchone()[0]
+
+    def did_you_mean(self, text: str, allowed: np.ndarray | None = None) -> str | None:
+        """
+        The query with misspelled words corrected, if that finds anything
+        among the `allowed` entries. None when the query itself matches: its
+        hits were removed by filters, not by a typo.
+        """
+        if self.count(text):
+            return None
+        corrected = self.speller.correct(tokenize(text))
+        if corrected is None:
+            return None
+        suggestion = " ".join(corrected)
+        if allowed is None:
+            found = self.count(suggestion)
+        else:
+            found = len(self.matches(suggestion, allowed))
+        return suggestion if found else None
+
+
+# ===== Process-wide index, rebuilt when the catalog version changes =====
+
+_lock = Lock()
+_cached: dict = {"version": None, "index": None}
+
+
+def get_search_index(db: Session) -> SearchIndex | None:
+    """The index for the current catalog, or None if no catalog was ingested."""
+    version = catalog.catalog_version(db)
+    if version is None:
+        return None
+    with _lock:
+        if _cached["version"] != version:
+            index = recommender.get_recommender(db)
+            if index is None:
+                return None
+            _cached["index"] = SearchIndex(index)
+            _cached["version"] = version
+        return _cached["index"]
@@ -0,0 +1,87 @@
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7  # deletes are generated from this many leading characters
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Damerau-Levenshtein distance (optimal string alignment: a swap of two
+    adjacent letters costs 1), or limit + 1 once it is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: list[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1] if prev[-1] <= limit else limit + 1
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """Every string reachable from word by removing up to `distance` characters."""
+    out = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+class SymSpell:
+    """
+    Symmetric-delete spelling correction.
+
+    Every dictionary word is stored under all strings reachable by deleting up
+    to MAX_DISTANCE characters from its prefix. A lookup generates the same
+    deletes for the input and only verifies the few words they hit, so its
+    cost does not grow with the dictionary size.
+    """
+
+    def __init__(self, counts: dict[str, int], max_distance: int = MAX_DISTANCE):
+        self.counts = counts
+        self.max_distance = max_distance
+        self._deletes: dict[str, list[str]] = {}
+        for word in counts:
+            for key in _deletes(word[:PREFIX_LENGTH], max_distance):
+                self._deletes.setdefault(key, []).append(word)
+
+    @classmethod
+    def from_texts(
+        cls, texts: Iterable[str], tokenize: Callable[[str], list[str]]
+    ) -> "SymSpell":
+        return cls(Counter(word for text in texts for word in tokenize(text)))
+
+    def lookup(self, word: str, max_distance: int | None = None) -> list[str]:
+        """Dictionary words within max_distance, closest then most frequent first."""
+        limit = self.max_distance if max_distance is None else max_distance
+        if word in self.counts:
+            return [word]
+        found: dict[str, int] = {}
+        for key in _deletes(word[:PREFIX_LENGTH], limit):
+            for candidate in self._deletes.get(key, ()):
+                if candidate not in found:
+                    found[candidate] = edit_distance(word, candidate, limit)
+        hits = [(d, -self.counts[w], w) for w, d in found.items() if d <= limit]
+        return [w for _, _, w in sorted(hits)]
+
+    def correct(self, words: list[str]) -> list[str] | None:
+        """
+        Words with unknown ones replaced by their best suggestion, or None
+        when nothing was changed. Short words allow fewer edits.
+        """
+        corrected = []
+        for word in words:
+            limit = 0 if len(word) <= 2 else 1 if len(word) <= 4 else self.max_distance
+            suggestions = self.lookup(word, limit) if limit else []
+            corrected.append(suggestions[0] if suggestions else word)
+        return corrected if corrected != words else None
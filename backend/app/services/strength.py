@@ -0,0 +1,152 @@
+# Drink strength: estimated total volume and ABV of a recipe, from its parsed
+# measures (services/measures.py) and a per-ingredient ABV table. Computed once
+# at catalog ingest and stored in recipes.volume_ml / recipes.abv.
+
+from collections.abc import Iterable
+
+from app.services.normalize import normalize_ingredient_name
+from app.services.substitutions import registry
+from app.services.taxonomy import DEFAULT_TAXONOMY
+
+# Typical bottlings, in % alcohol by volume
+_ABV_TABLE: dict[str, float] = {
+    "Vodka": 40,
+    "Absolut Citron": 40,
+    "Absolut Kurant": 40,
+    "Absolut Peppar": 40,
+    "Gin": 40,
+    "Sloe Gin": 26,
+    "Rum": 40,
+    "White Rum": 40,
+    "Dark Rum": 40,
+    "Spiced Rum": 35,
+    "151 Proof Rum": 75.5,
+    "Overproof Rum": 63,
+    "Malibu Rum": 21,
+    "Coconut Rum": 21,
+    "Tequila": 40,
+    "Mezcal": 40,
+    "Whiskey": 40,
+    "Bourbon": 45,
+    "Rye Whiskey": 45,
+    "Scotch": 40,
+    "Brandy": 40,
+    "Cognac": 40,
+    "Apple Brandy": 40,
+    "Apricot Brandy": 30,
+    "Cherry Brandy": 25,
+    "Pisco": 40,
+    "Cachaca": 40,
+    "Absinthe": 60,
+    "Everclear": 95,
+    "Triple Sec": 30,
+    "Grand Marnier": 40,
+    "Blue Curacao": 25,
+    "Amaretto": 28,
+    "Coffee Liqueur": 20,
+    "Kahlua": 20,
+    "Baileys Irish Cream": 17,
+    "Creme de Cacao": 25,
+    "Creme de Menthe": 25,
+    "Creme de Cassis": 20,
+    "Galliano": 42.3,
+    "Campari": 25,
+    "Aperol": 11,
+    "Green Chartreuse": 55,
+    "Yellow Chartreuse": 40,
+    "Benedictine": 40,
+    "Drambuie": 40,
+    "Frangelico": 20,
+    "Maraschino Liqueur": 32,
+    "Midori Melon Liqueur": 20,
+    "Peach Schnapps": 20,
+    "Sambuca": 38,
+    "Southern Comfort": 35,
+    "Jägermeister": 35,
+    "Sweet Vermouth": 16,
+    "Dry Vermouth": 18,
+    "Vermouth": 16,
+    "Lillet Blanc": 17,
+    "Dubonnet Rouge": 15,
+    "Sherry": 17,
+    "Port": 20,
+    "Wine": 12,
+    "Red Wine": 13,
+    "White Wine": 12,
+    "Champagne": 12,
+    "Prosecco": 11,
+    "Beer": 5,
+    "Lager": 5,
+    "Guinness Stout": 4.2,
+    "Cider": 5,
+    "Bitters": 40,
+    "Angostura Bitters": 44.7,
+    "Orange Bitters": 40,
+    "Peychaud Bitters": 35,
+    # Soft drinks whose last word would otherwise match ABV_BY_WORD
+    "Ginger Beer": 0,
+    "Root Beer": 0,
+    "Birch Beer": 0,
+}
+ABV_BY_INGREDIENT: dict[str, float] = {
+    normalize_ingredient_name(name): abv for name, abv in _ABV_TABLE.items()
+}
+
+# Brands and styles -> their parent in the default taxonomy ("Bacardi" -> "White
+# Rum"), walked before falling back to ABV_BY_WORD
+_PARENTS: dict[str, str] = {
+    normalize_ingredient_name(child): normalize_ingredient_name(parent)
+    for child, parent in DEFAULT_TAXONOMY.items()
+}
+
+# Fallback for names missing from the table, by their head (last) word
+# ("Bacardi Limon rum", "Pear liqueur"); everything else counts as 0%
+ABV_BY_WORD: dict[str, float] = {
+    "vodka": 40,
+    "gin": 40,
+    "rum": 40,
+    "tequila": 40,
+    "whiskey": 40,
+    "whisky": 40,
+    "bourbon": 45,
+    "brandy": 35,
+    "liqueur": 25,
+    "schnapps": 20,
+    "vermouth": 16,
+    "wine": 12,
+    "beer": 5,
+}
+
+
+def ingredient_abv(name: str) -> float:
+    """Estimated ABV of an ingredient, in %; 0 when it is not known to be alcoholic."""
+    key = normalize_ingredient_name(name)
+    seen = set()
+    while key and key not in seen:
+        seen.add(key)
+        for candidate in (key, registry.class_of(key)):
+            if candidate in ABV_BY_INGREDIENT:
+                return ABV_BY_INGREDIENT[candidate]
+        if key not in _PARENTS:
+            break
+        key = _PARENTS[key]
+    words = key.split()
+    return ABV_BY_WORD.get(words[-1], 0) if words else 0
+
+
+def estimate_strength(
+    ingredients: Iterable[tuple[str, float | None]],
+) -> tuple[float | None, float | None]:
+    """
+    (total volume in ml, ABV in %) from (ingredient name, measure in ml) pairs,
+    before dilution. Unmeasured ingredients are left out; (None, None) when
+    nothing was measured.
+    """
+    volume = alcohol = 0.0
+    for name, ml in ingredients:
+        if ml:
+            volume += ml
+            alcohol += ml * ingredient_abv(name) / 100
+    if volume <= 0:
+        return None, None
+    return round(volume, 1), round(alcohol / volume * 100, 1)
@@ -0,0 +1,144 @@
+# Ingredient substitutions: which ingredients can stand in for each other when
+# deciding whether a pantry can make a recipe.
+#
+# Aliases (normalize.ALIASES_TO_COCKTAILDB) are different spellings of the same
+# ingredient and are already folded into one key by normalization; the groups
+# below are different ingredients that are close enough to swap. They are
+# compiled once, at import, into union-find classes, so every ingredient key
+# maps to a class id with one dict lookup and matching stays a set (or bitset)
+# membership test.
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from app.services.measures import BOTTLE_ML, EMPTY_BOTTLE_FRACTION
+from app.services.normalize import normalize_ingredient_name
+
+# Interchangeable ingredients; the first name of a group is its class id
+SUBSTITUTION_GROUPS: tuple[tuple[str, ...], ...] = (
+    ("Triple Sec", "Cointreau", "Grand Marnier", "Orange Liqueur"),
+    ("Lime Juice", "Lime", "Lime Cordial"),
+    ("Lemon Juice", "Lemon"),
+    ("Orange Juice", "Orange"),
+    ("Sugar", "Powdered Sugar", "Superfine Sugar", "Caster Sugar", "Brown Sugar"),
+    ("Sugar Syrup", "Gomme Syrup", "Rich Simple Syrup"),
+    ("Soda Water", "Carbonated Water", "Sparkling Water", "Seltzer"),
+    ("White Rum", "Silver Rum"),
+    ("Whiskey", "Whisky", "Blended Whiskey", "Irish Whiskey"),
+    ("Coffee Liqueur", "Kahlua"),
+    ("Cream", "Light Cream", "Heavy Cream", "Double Cream", "Whipping Cream"),
+    ("Champagne", "Prosecco", "Sparkling Wine", "Cava"),
+    ("Maraschino Cherry", "Cherry"),
+    ("Egg White", "Aquafaba"),
+)
+
+
+class UnionFind:
+    """Disjoint sets over strings, with path halving; union keeps a's root."""
+
+    def __init__(self):
+        self.parent: dict[str, str] = {}
+
+    def find(self, item: str) -> str:
+        parent = self.parent.setdefault(item, item)
+        while parent != item:
+            grandparent = self.parent[parent]
+            self.parent[item] = grandparent
+            item, parent = parent, grandparent
+        return item
+
+    def union(self, a: str, b: str) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+class SubstitutionRegistry:
+    """Normalized ingredient key -> equivalence class id, compiled from groups."""
+
+    def __init__(self, groups: Iterable[Iterable[str]] = SUBSTITUTION_GROUPS):
+        sets = UnionFind()
+        for group in groups:
+            first, *rest = [normalize_ingredient_name(name) for name in group]
+            sets.find(first)
+            for key in rest:
+                sets.union(first, key)
+        # Keys that share their class with nothing else are left out
+        classes = {key: sets.find(key) for key in sets.parent}
+        sizes: dict[str, int] = {}
+        for root in classes.values():
+            sizes[root] = sizes.get(root, 0) + 1
+        self.classes = {key: root for key, root in classes.items() if sizes[root] > 1}
+
+    def class_of(self, key: str) -> str:
+        """Class id of a normalized ingredient key (the key itself if it has none)."""
+        return self.classes.get(key, key)
+
+
+registry = SubstitutionRegistry()
+
+
+@dataclass(frozen=True, slots=True)
+class PantryClasses:
+    """
+    A pantry mapped to ingredient classes once, for scoring many recipes.
+
+    With `ancestors` (the taxonomy's, see services/taxonomy.py) every item also
+    counts as its more general forms: Bacardi covers White Rum and Rum.
+    Items whose bottle is effectively empty are left out.
+    """
+
+    # normalized keys of what the user has, plus their taxonomy ancestors
+    keys: frozenset[str]
+    # class id -> name of a pantry item in that class
+    classes: dict[str, str]
+    # class id -> ml left across the pantry items in that class
+    volumes: dict[str, float]
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[tuple[str, float]],
+        registry: SubstitutionRegistry = registry,
+        ancestors: Mapping[str, frozenset[str]] | None = None,
+    ) -> "PantryClasses":
+        """From (ingredient name, bottle fraction) pairs."""
+        keys = set()
+        classes: dict[str, str] = {}
+        volumes: dict[str, float] = {}
+        for name, quantity in items:
+            key = normalize_ingredient_name(name)
+            if not key or quantity < EMPTY_BOTTLE_FRACTION:
+                continue
+            covered = {key, *(ancestors or {}).get(key, ())}
+            keys |= covered
+            for class_id in {registry.class_of(k) for k in covered}:
+                classes.setdefault(class_id, name)
+                volumes[class_id] = volumes.get(class_id, 0.0) + quantity * BOTTLE_ML
+        return cls(frozenset(keys), classes, volumes)
+
+    @classmethod
+    def from_names(
+        cls,
+        names: Iterable[str],
+        registry: SubstitutionRegistry = registry,
+        ancestors: Mapping[str, frozenset[str]] | None = None,
+    ) -> "PantryClasses":
+        """From ingredient names, each a full bottle."""
+        return cls.from_items(((name, 1.0) for name in names), registry, ancestors)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+    def substitutions(
+        self, ingredients: Iterable[str], keys: Iterable[str], classes: Iterable[str]
+    ) -> list[tuple[str, str]]:
+        """
+        (recipe ingredient, pantry item standing in for it) for every ingredient
+        the pantry only covers through a substitute.
+        """
+        return [
+            (name, self.classes[class_id])
+            for name, key, class_id in zip(ingredients, keys, classes)
+            if key and key not in self.keys and class_id in self.classes
+        ]
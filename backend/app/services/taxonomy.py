@@ -0,0 +1,235 @@
+from collections import defaultdict
+from logging import getLogger
+from threading import Lock
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.taxonomy import IngredientClosure, IngredientTaxonomy, TaxonomyChange
+from app.services.normalize import normalize_ingredient_name
+
+log = getLogger(__name__)
+
+# ingredient -> more general parent, loaded by `python -m scripts.seed_taxonomy`
+DEFAULT_TAXONOMY: dict[str, str] = {
+    # Rum
+    "White Rum": "Rum",
+    "Dark Rum": "Rum",
+    "Spiced Rum": "Rum",
+    "Añejo Rum": "Rum",
+    "151 Proof Rum": "Rum",
+    "Overproof Rum": "Rum",
+    "Bacardi": "White Rum",
+    "Bacardi White Rum": "White Rum",
+    "Havana Club": "White Rum",
+    "Captain Morgan": "Spiced Rum",
+    "Gosling's Black Seal": "Dark Rum",
+    "Myers's Rum": "Dark Rum",
+    # Whiskey
+    "Bourbon": "Whiskey",
+    "Rye Whiskey": "Whiskey",
+    "Scotch": "Whiskey",
+    "Irish Whiskey": "Whiskey",
+    "Tennessee Whiskey": "Whiskey",
+    "Canadian Whisky": "Whiskey",
+    "Jim Beam": "Bourbon",
+    "Wild Turkey": "Bourbon",
+    "Maker's Mark": "Bourbon",
+    "Jack Daniels": "Tennessee Whiskey",
+    "Johnnie Walker": "Scotch",
+    "Jameson": "Irish Whiskey",
+    "Crown Royal": "Canadian Whisky",
+    # Gin, vodka, tequila
+    "Tanqueray": "Gin",
+    "Bombay Sapphire": "Gin",
+    "Hendrick's Gin": "Gin",
+    "Plymouth Gin": "Gin",
+    "Absolut Vodka": "Vodka",
+    "Smirnoff": "Vodka",
+    "Grey Goose": "Vodka",
+    "Reposado Tequila": "Tequila",
+    "Añejo Tequila": "Tequila",
+    "Jose Cuervo": "Tequila",
+    # Brandy
+    "Cognac": "Brandy",
+    "Armagnac": "Brandy",
+    "Pisco": "Brandy",
+    "Calvados": "Apple Brandy",
+    # Bitters, vermouth, wine
+    "Angostura Bitters": "Bitters",
+    "Orange Bitters": "Bitters",
+    "Peychaud Bitters": "Bitters",
+    "Sweet Vermouth": "Vermouth",
+    "Dry Vermouth": "Vermouth",
+    "Red Wine": "Wine",
+    "White Wine": "Wine",
+}
+
+
+class TaxonomyError(ValueError):
+    """An edge that would make an ingredient its own ancestor."""
+
+
+def taxonomy_version(db: Session) -> int:
+    """Id of the latest taxonomy change, or 0 if the taxonomy was never edited."""
+    return db.execute(select(func.max(TaxonomyChange.id))).scalar() or 0
+
+
+# ===== Incremental closure maintenance =====
+
+
+def _subtree(db: Session, key: str) -> dict[str, int]:
+    """Descendant -> depth below key, key itself included at depth 0."""
+    rows = db.execute(
+        select(IngredientClosure.descendant_key, IngredientClosure.depth).where(
+            IngredientClosure.ancestor_key == key
+        )
+    ).all()
+    return dict(rows) or {key: 0}
+
+
+def _ensure_self_row(db: Session, key: str) -> None:
+    exists = db.execute(
+        select(IngredientClosure.depth).where(
+            IngredientClosure.ancestor_key == key,
+            IngredientClosure.descendant_key == key,
+        )
+    ).first()
+    if exists is None:
+        db.add(IngredientClosure(ancestor_key=key, descendant_key=key, depth=0))
+        db.flush()
+
+
+def _detach(db: Session, subtree: dict[str, int]) -> None:
+    """Drop the rows linking a subtree to the ancestors of its root."""
+    db.execute(
+        delete(IngredientClosure).where(
+            IngredientClosure.descendant_key.in_(subtree),
+            IngredientClosure.ancestor_key.not_in(subtree),
+        )
+    )
+
+
+def set_parent(db: Session, ingredient: str, parent: str) -> None:
+    """
+    Make `parent` the more general form of `ingredient` (moving it, with all
+    its descendants, if it had another parent). Only the closure rows between
+    the moved subtree and its old and new ancestors are touched.
+    """
+    key = normalize_ingredient_name(ingredient)
+    parent_key = normalize_ingredient_name(parent)
+    if not key or not parent_key:
+        raise TaxonomyError("Ingredient names must not be empty")
+    edge = db.get(IngredientTaxonomy, key)
+    if edge is not None and edge.parent_key == parent_key:
+        return
+
+    _ensure_self_row(db, key)
+    _ensure_self_row(db, parent_key)
+    subtree = _subtree(db, key)
+    if parent_key in subtree:
+        raise TaxonomyError(f"{parent!r} is already below {ingredient!r}")
+
+    if edge is None:
+        db.add(IngredientTaxonomy(ingredient_key=key, parent_key=parent_key))
+    else:
+        _detach(db, subtree)
+        edge.parent_key = parent_key
+    ancestors = db.execute(
+        select(IngredientClosure.ancestor_key, IngredientClosure.depth).where(
+            IngredientClosure.descendant_key == parent_key
+        )
+    ).all()
+    db.execute(
+        insert(IngredientClosure),
+        [
+            {"ancestor_key": a, "descendant_key": d, "depth": da + dd + 1}
+            for a, da in ancestors
+            for d, dd in subtree.items()
+        ],
+    )
+    db.add(TaxonomyChange(ingredient_key=key, parent_key=parent_key))
+    db.commit()
+
+
+def remove_parent(db: Session, ingredient: str) -> None:
+    """Detach an ingredient (and everything below it) from its parent."""
+    key = normalize_ingredient_name(ingredient)
+    edge = db.get(IngredientTaxonomy, key)
+    if edge is None:
+        return
+    _detach(db, _subtree(db, key))
+    db.delete(edge)
+    db.add(TaxonomyChange(ingredient_key=key, parent_key=None))
+    db.commit()
+
+
+def rebuild_closure(db: Session) -> int:
+    """Recompute the whole closure from the edges (for repairs); returns rows."""
+    parents = dict(
+        db.execute(
+            select(IngredientTaxonomy.ingredient_key, IngredientTaxonomy.parent_key)
+        ).all()
+    )
+    rows = []
+    for key in set(parents) | set(parents.values()):
+        node, depth = key, 0
+        while node is not None:
+            rows.append({"ancestor_key": node, "descendant_key": key, "depth": depth})
+            node, depth = parents.get(node), depth + 1
+    db.execute(delete(IngredientClosure))
+    if rows:
+        db.execute(insert(IngredientClosure), rows)
+    # Bump the version so cached ancestor sets are reloaded
+    db.add(TaxonomyChange(ingredient_key="*", parent_key=None))
+    db.commit()
+    log.info(
+        "Rebuilt ingredient closure from %d edges: %d rows", len(parents), len(rows)
+    )
+    return len(rows)
+
+
+def seed_defaults(db: Session, taxonomy: dict[str, str] = DEFAULT_TAXONOMY) -> int:
+    """Add the default edges that are missing; returns how many were added."""
+    existing = set(db.execute(select(IngredientTaxonomy.ingredient_key)).scalars())
+    added = 0
+    for ingredient, parent in taxonomy.items():
+        if normalize_ingredient_name(ingredient) not in existing:
+            set_parent(db, ingredient, parent)
+            added += 1
+    return added
+
+
+# ===== Process-wide ancestor sets, reloaded when the taxonomy version changes =====
+
+
+class Taxonomy:
+    """Precomputed ancestor set of every ingredient key in the taxonomy."""
+
+    def __init__(self, ancestors: dict[str, frozenset[str]]):
+        self.ancestors = ancestors
+
+    @classmethod
+    def load(cls, db: Session) -> "Taxonomy":
+        ancestors: dict[str, set[str]] = defaultdict(set)
+        rows = db.execute(
+            select(
+                IngredientClosure.descendant_key, IngredientClosure.ancestor_key
+            ).where(IngredientClosure.depth > 0)
+        )
+        for descendant, ancestor in rows:
+            ancestors[descendant].add(ancestor)
+        return cls({key: frozenset(found) for key, found in ancestors.items()})
+
+
+_lock = Lock()
+_cached: dict = {"version": None, "taxonomy": None}
+
+
+def get_taxonomy(db: Session) -> Taxonomy:
+    version = taxonomy_version(db)
+    with _lock:
+        if _cached["version"] != version:
+            _cached["taxonomy"] = Taxonomy.load(db)
+            _cached["version"] = version
+        return _cached["taxonomy"]
@@ -0,0 +1,273 @@
+import asyncio
+import time
+from logging import getLogger
+
+import httpx
+
+from app.core.config import settings
+from app.services.hedging import Hedger
+from app.services.outbound_budget import BACKGROUND, INTERACTIVE, OutboundBudget
+from app.services.singleflight import SingleFlight
+from app.services.upstream_cache import (
+    CACHE_TTLS,
+    FRESH,
+    STALE,
+    ResponseCache,
+    cache_key,
+)
+from app.services.upstream_guard import UpstreamGuard
+
+log = getLogger(__name__)
+
+# httpcore trace events that mean a request got hold of a pooled connection
+_CONNECTION_ACQUIRED = (
+    "connection.connect_tcp.started",
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+)
+
+
+class UpstreamClient:
+    """
+    Application-wide pooled client for TheCocktailDB.
+
+    One instance is created in the FastAPI lifespan hook and shared by every
+    route and job, so connections (and TLS sessions) are reused across
+    requests instead of being rebuilt for each one.
+
+    With a ResponseCache attached, cacheable endpoints are served
+    stale-while-revalidate, and cached replies stand in for the upstream
+    while it is failing.
+
+    Every upstream call goes through an UpstreamGuard: an adaptive cap on
+    concurrent calls and a circuit breaker that fails fast (CircuitOpenError)
+    after repeated timeouts, so a struggling upstream gets less load, not more.
+    Calls still pending at the observed p95 are hedged within a small budget.
+    Sends are paced by an OutboundBudget token bucket in which interactive
+    calls (the default lane) go ahead of background ones.
+    """
+
+    def __init__(
+        self,
+        base_url: str = settings.COCKTAILDB_BASE_URL,
+        *,
+        timeout: float = settings.UPSTREAM_TIMEOUT_SECONDS,
+        max_connections: int = settings.UPSTREAM_MAX_CONNECTIONS,
+        max_keepalive: int = settings.UPSTREAM_MAX_KEEPALIVE,
+        keepalive_expiry: float = settings.UPSTREAM_KEEPALIVE_EXPIRY,
+        http2: bool = settings.UPSTREAM_HTTP2,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: ResponseCache | None = None,
+        guard: UpstreamGuard | None = None,
+        hedger: Hedger | None = None,
+        budget: OutboundBudget | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+            )
+        self._transport = transport
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url + "/", timeout=timeout, transport=transport
+        )
+
+        self.cache = cache
+        self.guard = guard or UpstreamGuard.from_settings()
+        self.hedger = hedger or Hedger.from_settings()
+        self.budget = budget or OutboundBudget.from_settings()
+        self.flight = SingleFlight("upstream")
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+        # Stats
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    async def get_json(
+        self, endpoint: str, params: dict | None = None, *, lane: str = INTERACTIVE
+    ) -> dict:
+        """
+        GET {base_url}/{endpoint} and decode the JSON body, going through the
+        cache when the endpoint is cacheable. Raises on HTTP errors only when
+        there is no cached reply to fall back to. Jobs pass lane=BACKGROUND.
+        """
+        cache = self.cache
+        if endpoint == "random.php":
+            # Every call must be its own sample: never cached or coalesced
+            body = await self._fetch(endpoint, params, lane)
+            if cache is not None:
+                cache.put_drinks_later(body.get("drinks") or [])
+            return body
+
+        key = cache_key(endpoint, params)
+        if cache is None or endpoint not in CACHE_TTLS:
+            return await self._fetch_shared(key, endpoint, params, lane)
+
+        cached = cache.get(key)
+        if cached and cached[1] == FRESH:
+            cache.hits += 1
+            return cached[0]
+        if cached and cached[1] == STALE:
+            cache.stale_hits += 1
+            self._refresh_in_background(key, endpoint, params)
+            return cached[0]
+
+        cache.misses += 1
+        try:
+            return await self._fetch_shared(key, endpoint, params, lane)
+        except Exception:
+            if cached is None:
+                raise
+            # Upstream is failing: any cached reply beats an error
+            cache.stale_on_error += 1
+            return cached[0]
+
+    async def _fetch_shared(
+        self, key: str, endpoint: str, params: dict | None, lane: str
+    ):
+        """Identical concurrent requests share one upstream call."""
+        return await self.flight.do(
+            key, lambda: self._fetch_and_store(key, endpoint, params, lane)
+        )
+
+    async def _fetch_and_store(
+        self, key: str, endpoint: str, params: dict | None, lane: str
+    ):
+        body = await self._fetch(endpoint, params, lane)
+        if self.cache is not None and endpoint in CACHE_TTLS:
+            self.cache.put_later(key, endpoint, body)
+        return body
+
+    def _refresh_in_background(
+        self, key: str, endpoint: str, params: dict | None
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._fetch_shared(key, endpoint, params, BACKGROUND)
+            except Exception as e:
+                log.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def _fetch(
+        self, endpoint: str, params: dict | None = None, lane: str = INTERACTIVE
+    ) -> dict:
+        admitted = asyncio.Event()
+
+        async def send() -> dict:
+            admitted.set()
+            return await self._send(endpoint, params)
+
+        return await self.hedger.run(
+            lambda: self.guard.call(send, admit=lambda: self.budget.acquire(lane)),
+            admitted,
+        )
+
+    async def _send(self, endpoint: str, params: dict | None) -> dict:
+        started = time.perf_counter()
+        acquired = False
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal acquired
+            if not acquired and event_name in _CONNECTION_ACQUIRED:
+                acquired = True
+                self._record_wait(time.perf_counter() - started)
+
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            resp = await self._client.get(
+                endpoint, params=params, extensions={"trace": trace}
+            )
+            resp.raise_for_status()
+            body = resp.json() or {}
+            self.hedger.observe(time.perf_counter() - started)
+            return body
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    def _record_wait(self, seconds: float) -> None:
+        self._waits += 1
+        self._wait_total += seconds
+        self._wait_max = max(self._wait_max, seconds)
+
+    def pool_stats(self) -> dict:
+        """Connection pool usage, for sizing UPSTREAM_MAX_CONNECTIONS under load."""
+        connections = getattr(
+            getattr(self._transport, "_pool", None), "connections", []
+        )
+        open_conns = [c for c in connections if not c.is_closed()]
+        idle = sum(1 for c in open_conns if c.is_idle())
+        return {
+            "max_connections": self.max_connections,
+            "connections_in_use": len(open_conns) - idle,
+            "connections_idle": idle,
+            "requests_in_flight": self.in_flight,
+            "requests_total": self.requests,
+            "errors_total": self.errors,
+            "pool_wait_ms_avg": (
+                round(self._wait_total / self._waits * 1000, 3) if self._waits else 0.0
+            ),
+            "pool_wait_ms_max": round(self._wait_max * 1000, 3),
+        }
+
+    async def aclose(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self.budget.close()
+        await self._client.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
+
+# ===== Process-wide instance (managed by the app lifespan) =====
+
+_upstream: UpstreamClient | None = None
+
+
+def get_upstream() -> UpstreamClient:
+    """
+    The shared client; created lazily for scripts and tests that skip lifespan.
+    Its pooled connections belong to the event loop it was first used on: code
+    that runs several loops closes it (close_upstream) before switching.
+    """
+    global _upstream
+    if _upstream is None:
+        _upstream = UpstreamClient(cache=ResponseCache.from_settings())
+    return _upstream
+
+
+def set_upstream(client: UpstreamClient | None) -> None:
+    global _upstream
+    _upstream = client
+
+
+async def start_upstream() -> UpstreamClient:
+    client = get_upstream()
+    log.info("Upstream client ready for %s", client.base_url)
+    return client
+
+
+async def close_upstream() -> None:
+    global _upstream
+    if _upstream is not None:
+        await _upstream.aclose()
+        _upstream = None
@@ -0,0 +1,205 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from logging import getLogger
+from threading import Lock
+from urllib.parse import urlencode
+
+from app.core.config import settings
+
+log = getLogger(__name__)
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# How long a reply counts as fresh, per TheCocktailDB endpoint.
+# Endpoints missing here (random.php) are never served from the cache.
+CACHE_TTLS = {
+    "lookup.php": 7 * DAY,
+    "search.php": DAY,
+    "filter.php": DAY,
+    "list.php": 7 * DAY,
+}
+# {"drinks": null} replies: short-lived so new drinks show up reasonably soon
+NEGATIVE_TTL = HOUR
+# After expiry an entry is still served (and refreshed in the background) for this long
+STALE_TTL = 7 * DAY
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+
+def cache_key(endpoint: str, params: dict | None = None) -> str:
+    return f"{endpoint}?{urlencode(sorted((params or {}).items()))}"
+
+
+def is_negative(body: dict) -> bool:
+    return not body.get("drinks")
+
+
+class ResponseCache:
+    """
+    On-disk (SQLite) cache of TheCocktailDB JSON replies that survives restarts.
+
+    Entries are never deleted on expiry: past their TTL they are served as
+    stale while a refresh runs, and at any age when the upstream is down.
+
+    Replies fetched on the event loop are queued with put_later() and written
+    in batches on a worker thread over a second connection; get() sees them
+    while they are still queued.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.clock = clock
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._write_lock = Lock()
+        # key -> (body, row) waiting for the worker thread
+        self._pending: dict[str, tuple[dict, tuple]] = {}
+        self._flushing = False
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " endpoint TEXT NOT NULL,"
+            " body TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_endpoint ON responses (endpoint)"
+        )
+        self._conn.commit()
+        self._writer = sqlite3.connect(path, check_same_thread=False)
+
+        # Stats
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stale_on_error = 0
+
+    @classmethod
+    def from_settings(cls) -> "ResponseCache | None":
+        path = settings.UPSTREAM_CACHE_PATH
+        return cls(path) if path else None
+
+    def get(self, key: str) -> tuple[dict, str] | None:
+        """(body, freshness) for a cached reply, or None."""
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                row = self._conn.execute(
+                    "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        if pending is not None:
+            body, expires_at = pending[0], pending[1][4]
+        elif row is None:
+            return None
+        else:
+            body, expires_at = json.loads(row[0]), row[1]
+        now = self.clock()
+        if now < expires_at:
+            state = FRESH
+        elif now < expires_at + STALE_TTL:
+            state = STALE
+        else:
+            state = EXPIRED
+        return body, state
+
+    def _row(self, key: str, endpoint: str, body: dict) -> tuple:
+        ttl = NEGATIVE_TTL if is_negative(body) else CACHE_TTLS.get(endpoint, 0)
+        now = self.clock()
+        return (key, endpoint, json.dumps(body), now, now + ttl)
+
+    def _write(self, rows: list[tuple]) -> None:
+        """One transaction for all rows, on the writer connection."""
+        with self._write_lock:
+            self._writer.executemany(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, body, fetched_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._writer.commit()
+
+    def put(self, key: str, endpoint: str, body: dict) -> None:
+        """Write a reply now, blocking until it is committed."""
+        self._write([self._row(key, endpoint, body)])
+
+    def put_later(self, key: str, endpoint: str, body: dict) -> None:
+        """
+        Queue a reply for the worker thread; replies queued before it runs
+        share one transaction. Must be called on the event loop.
+        """
+        with self._lock:
+            self._pending[key] = (body, self._row(key, endpoint, body))
+            if self._flushing:
+                return
+            self._flushing = True
+        asyncio.get_running_loop().run_in_executor(None, self._flush_pending)
+
+    def put_drinks_later(self, drinks: Iterable[dict]) -> None:
+        """Remember full drink records (e.g. from random.php) as lookup replies."""
+        for drink in drinks:
+            if drink.get("idDrink"):
+                key = cache_key("lookup.php", {"i": str(drink["idDrink"])})
+                self.put_later(key, "lookup.php", {"drinks": [drink]})
+
+    def _flush_pending(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            log.warning("Writing cached upstream replies failed: %s", e)
+
+    def flush(self) -> None:
+        """Write every queued reply, blocking until they are committed."""
+        with self._lock:
+            batch = dict(self._pending)
+            self._flushing = False
+        if not batch:
+            return
+        self._write([row for _, row in batch.values()])
+        with self._lock:
+            for key, entry in batch.items():
+                # Keep entries queued again while this batch was being written
+                if self._pending.get(key) is entry:
+                    del self._pending[key]
+
+    def sample_drinks(self, count: int) -> list[dict]:
+        """
+        Up to `count` cached drinks of any age, for serving during an outage.
+        Blocks on SQLite: call it off the event loop.
+        """
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM responses"
+                " WHERE endpoint = 'lookup.php' AND body != ?"
+                " ORDER BY random() LIMIT ?",
+                (json.dumps({"drinks": None}), count),
+            ).fetchall()
+        drinks = [d for (body,) in rows for d in (json.loads(body).get("drinks") or [])]
+        return drinks[:count]
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            pending = len(self._pending)
+        return {
+            "entries": entries,
+            "pending_writes": pending,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "stale_on_error": self.stale_on_error,
+        }
+
+    def close(self) -> None:
+        self.flush()
+        with self._write_lock:
+            self._writer.close()
+        with self._lock:
+            self._conn.close()
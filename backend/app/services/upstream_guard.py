@@ -0,0 +1,253 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """The upstream is failing; calls are short-circuited until the breaker resets."""
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors, 429 and 5xx: signs the upstream is struggling."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+
+class AdaptiveLimiter:
+    """
+    AIMD cap on concurrent upstream calls.
+
+    The limit grows by one after a full window (`limit` calls) of successes and
+    is halved on a failure, at most once per `cooldown` seconds so a burst of
+    timeouts from the same slow period only counts once. Callers over the
+    limit queue in FIFO order.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.clock = clock
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._successes = 0
+        self._decreased_at = float("-inf")
+
+        # Stats
+        self.increases = 0
+        self.decreases = 0
+        self.queued = 0
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        self.queued += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Granted just before the cancellation landed: hand the slot back
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def on_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self._successes = 0
+            self.limit += 1
+            self.increases += 1
+            self._wake()
+
+    def on_failure(self) -> None:
+        now = self.clock()
+        if now - self._decreased_at < self.cooldown:
+            return
+        self._decreased_at = now
+        self._successes = 0
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self.decreases += 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for w in self._waiters if not w.done()),
+            "queued_total": self.queued,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive upstream failures. While open,
+    calls fail fast; after `reset_timeout` seconds one probe call is let
+    through (half-open) and its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+        # Stats
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        if self.state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = OPEN
+            self._opened_at = self.clock()
+            self.opened += 1
+
+    def abandon_probe(self) -> None:
+        """The half-open probe was cancelled without an outcome."""
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "opened_total": self.opened,
+            "rejected_total": self.rejected,
+        }
+
+
+class UpstreamGuard:
+    """Breaker + adaptive limiter that every call to TheCocktailDB goes through."""
+
+    def __init__(self, limiter: AdaptiveLimiter, breaker: CircuitBreaker):
+        self.limiter = limiter
+        self.breaker = breaker
+
+    @classmethod
+    def from_settings(cls) -> "UpstreamGuard":
+        return cls(
+            AdaptiveLimiter(
+                initial=settings.UPSTREAM_CONCURRENCY_INITIAL,
+                max_limit=settings.UPSTREAM_MAX_CONNECTIONS,
+            ),
+            CircuitBreaker(
+                failure_threshold=settings.UPSTREAM_BREAKER_FAILURES,
+                reset_timeout=settings.UPSTREAM_BREAKER_RESET_SECONDS,
+            ),
+        )
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        admit: Callable[[], Awaitable[None]] | None = None,
+    ) -> T:
+        """
+        Run `fn` under the breaker and the concurrency limit. `admit` (e.g. a
+        rate-limit wait) runs once the breaker has let the call through.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("TheCocktailDB circuit breaker is open")
+        if admit is not None:
+            try:
+                await admit()
+            except asyncio.CancelledError:
+                self.breaker.abandon_probe()
+                raise
+        await self.limiter.acquire()
+        try:
+            # The breaker may have opened while this call was queued
+            if self.breaker.state == OPEN:
+                self.breaker.rejected += 1
+                raise CircuitOpenError("TheCocktailDB circuit breaker is open")
+            result = await fn()
+        except asyncio.CancelledError:
+            self.breaker.abandon_probe()
+            raise
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            if is_upstream_failure(e):
+                self.breaker.record_failure()
+                self.limiter.on_failure()
+            else:
+                # e.g. a 404: the upstream answered, so it is healthy
+                self.breaker.record_success()
+            raise
+        else:
+            self.breaker.record_success()
+            self.limiter.on_success()
+            return result
+        finally:
+            self.limiter.release()
+
+    def stats(self) -> dict:
+        return {"breaker": self.breaker.stats(), "limiter": self.limiter.stats()}
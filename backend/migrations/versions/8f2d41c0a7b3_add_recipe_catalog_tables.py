@@ -0,0 +1,100 @@
+"""add_recipe_catalog_tables
+
+Revision ID: 8f2d41c0a7b3
+Revises: 3c7138bb847a
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2d41c0a7b3"
+down_revision: Union[str, None] = "3c7138bb847a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the local CocktailDB mirror: recipes, recipe_ingredients, catalog_syncs."""
+    op.create_table(
+        "recipes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("drink_id", sa.String(length=16), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("thumbnail", sa.String(length=512), nullable=True),
+        sa.Column("category", sa.String(length=64), nullable=True),
+        sa.Column("glass", sa.String(length=64), nullable=True),
+        sa.Column("alcoholic", sa.String(length=32), nullable=True),
+        sa.Column("instructions", sa.Text(), nullable=True),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_recipes_id"), "recipes", ["id"], unique=False)
+    op.create_index(op.f("ix_recipes_drink_id"), "recipes", ["drink_id"], unique=True)
+    op.create_index(op.f("ix_recipes_name"), "recipes", ["name"], unique=False)
+    op.create_index(op.f("ix_recipes_category"), "recipes", ["category"], unique=False)
+
+    op.create_table(
+        "recipe_ingredients",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("recipe_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("measure", sa.String(length=64), nullable=True),
+        sa.ForeignKeyConstraint(["recipe_id"], ["recipes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "recipe_id", "position", name="uq_recipe_ingredient_position"
+        ),
+    )
+    op.create_index(
+        op.f("ix_recipe_ingredients_id"), "recipe_ingredients", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_recipe_ingredients_recipe_id"),
+        "recipe_ingredients",
+        ["recipe_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_recipe_ingredients_name"),
+        "recipe_ingredients",
+        ["name"],
+        unique=False,
+    )
+
+    op.create_table(
+        "catalog_syncs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "started_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("drink_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed_keys", sa.String(length=64), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_catalog_syncs_id"), "catalog_syncs", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the local CocktailDB mirror tables."""
+    op.drop_index(op.f("ix_catalog_syncs_id"), table_name="catalog_syncs")
+    op.drop_table("catalog_syncs")
+    op.drop_index(op.f("ix_recipe_ingredients_name"), table_name="recipe_ingredients")
+    op.drop_index(
+        op.f("ix_recipe_ingredients_recipe_id"), table_name="recipe_ingredients"
+    )
+    op.drop_index(op.f("ix_recipe_ingredients_id"), table_name="recipe_ingredients")
+    op.drop_table("recipe_ingredients")
+    op.drop_index(op.f("ix_recipes_category"), table_name="recipes")
+    op.drop_index(op.f("ix_recipes_name"), table_name="recipes")
+    op.drop_index(op.f("ix_recipes_drink_id"), table_name="recipes")
+    op.drop_index(op.f("ix_recipes_id"), table_name="recipes")
+    op.drop_table("recipes")
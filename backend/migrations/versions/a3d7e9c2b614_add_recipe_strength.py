@@ -0,0 +1,32 @@
+"""add_recipe_strength
+
+Revision ID: a3d7e9c2b614
+Revises: f19b6c3e7a52
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d7e9c2b614"
+down_revision: Union[str, None] = "f19b6c3e7a52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add recipes.volume_ml and the indexed recipes.abv, filled at ingest."""
+    op.add_column("recipes", sa.Column("volume_ml", sa.Float(), nullable=True))
+    op.add_column("recipes", sa.Column("abv", sa.Float(), nullable=True))
+    op.create_index(op.f("ix_recipes_abv"), "recipes", ["abv"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop recipes.abv and recipes.volume_ml."""
+    op.drop_index(op.f("ix_recipes_abv"), table_name="recipes")
+    op.drop_column("recipes", "abv")
+    op.drop_column("recipes", "volume_ml")
@@ -0,0 +1,31 @@
+"""add_user_pantry_version
+
+Revision ID: b41e9a6d2c15
+Revises: 8f2d41c0a7b3
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b41e9a6d2c15"
+down_revision: Union[str, None] = "8f2d41c0a7b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add users.pantry_version, bumped on every pantry change."""
+    op.add_column(
+        "users",
+        sa.Column("pantry_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Drop users.pantry_version."""
+    op.drop_column("users", "pantry_version")
@@ -0,0 +1,28 @@
+"""add_recipe_minhash
+
+Revision ID: b8f2c4d61e07
+Revises: a3d7e9c2b614
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f2c4d61e07"
+down_revision: Union[str, None] = "a3d7e9c2b614"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add recipes.minhash, the ingredient-set signature filled at ingest."""
+    op.add_column("recipes", sa.Column("minhash", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop recipes.minhash."""
+    op.drop_column("recipes", "minhash")
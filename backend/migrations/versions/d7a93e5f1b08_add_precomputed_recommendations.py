@@ -0,0 +1,42 @@
+"""add_precomputed_recommendations
+
+Revision ID: d7a93e5f1b08
+Revises: b41e9a6d2c15
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a93e5f1b08"
+down_revision: Union[str, None] = "b41e9a6d2c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create precomputed_recommendations, filled by the batch job."""
+    op.create_table(
+        "precomputed_recommendations",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("drink_id", sa.String(length=16), nullable=False),
+        sa.Column("matched", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("pantry_version", sa.Integer(), nullable=False),
+        sa.Column("catalog_version", sa.Integer(), nullable=False),
+        sa.Column(
+            "computed_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "rank"),
+    )
+
+
+def downgrade() -> None:
+    """Drop precomputed_recommendations."""
+    op.drop_table("precomputed_recommendations")
@@ -0,0 +1,80 @@
+"""add_ingredient_taxonomy
+
+Revision ID: e5c81f2a9d34
+Revises: d7a93e5f1b08
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c81f2a9d34"
+down_revision: Union[str, None] = "d7a93e5f1b08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the ingredient taxonomy, its closure table and change log."""
+    op.create_table(
+        "ingredient_taxonomy",
+        sa.Column("ingredient_key", sa.String(length=128), nullable=False),
+        sa.Column("parent_key", sa.String(length=128), nullable=False),
+        sa.PrimaryKeyConstraint("ingredient_key"),
+    )
+    op.create_index(
+        op.f("ix_ingredient_taxonomy_parent_key"),
+        "ingredient_taxonomy",
+        ["parent_key"],
+        unique=False,
+    )
+    op.create_table(
+        "ingredient_closure",
+        sa.Column("ancestor_key", sa.String(length=128), nullable=False),
+        sa.Column("descendant_key", sa.String(length=128), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("ancestor_key", "descendant_key"),
+    )
+    op.create_index(
+        op.f("ix_ingredient_closure_descendant_key"),
+        "ingredient_closure",
+        ["descendant_key"],
+        unique=False,
+    )
+    op.create_table(
+        "taxonomy_changes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ingredient_key", sa.String(length=128), nullable=False),
+        sa.Column("parent_key", sa.String(length=128), nullable=True),
+        sa.Column(
+            "changed_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        op.f("ix_taxonomy_changes_id"), "taxonomy_changes", ["id"], unique=False
+    )
+    op.add_column(
+        "precomputed_recommendations",
+        sa.Column("taxonomy_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the taxonomy tables."""
+    op.drop_column("precomputed_recommendations", "taxonomy_version")
+    op.drop_index(op.f("ix_taxonomy_changes_id"), table_name="taxonomy_changes")
+    op.drop_table("taxonomy_changes")
+    op.drop_index(
+        op.f("ix_ingredient_closure_descendant_key"), table_name="ingredient_closure"
+    )
+    op.drop_table("ingredient_closure")
+    op.drop_index(
+        op.f("ix_ingredient_taxonomy_parent_key"), table_name="ingredient_taxonomy"
+    )
+    op.drop_table("ingredient_taxonomy")
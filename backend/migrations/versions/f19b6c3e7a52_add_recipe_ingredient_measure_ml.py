@@ -0,0 +1,30 @@
+"""add_recipe_ingredient_measure_ml
+
+Revision ID: f19b6c3e7a52
+Revises: e5c81f2a9d34
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f19b6c3e7a52"
+down_revision: Union[str, None] = "e5c81f2a9d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add recipe_ingredients.measure_ml, filled by the next catalog sync."""
+    op.add_column(
+        "recipe_ingredients", sa.Column("measure_ml", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop recipe_ingredients.measure_ml."""
+    op.drop_column("recipe_ingredients", "measure_ml")
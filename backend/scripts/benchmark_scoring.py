@@ -0,0 +1,98 @@
+# Benchmark whole-catalog pantry scoring on synthetic catalogs.
+#
+# Compares the per-drink Python loop (score_cocktail, as used for upstream drinks),
+# the posting-list walk and the packed bitset AND/popcount at 500, 5k and 50k
+# recipes, plus the vectorized servings computation over parsed measures.
+# Ingredient popularity is Zipf-like, as in the real CocktailDB.
+
+import argparse
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+from app.api.v1.routes_recommendations import score_cocktail
+from app.services.recommender import RecommenderIndex
+from app.services.substitutions import PantryClasses
+
+SIZES = (500, 5_000, 50_000)
+N_INGREDIENTS = 600
+PANTRY_SIZE = 15
+LEGACY_MAX_RECIPES = 5_000  # the per-drink loop gets slow beyond this
+
+
+def make_catalog(n_recipes: int, rng: random.Random) -> list[SimpleNamespace]:
+    names = [f"ingredient {i}" for i in range(N_INGREDIENTS)]
+    weights = [1 / (rank + 1) for rank in range(N_INGREDIENTS)]
+    recipes = []
+    for i in range(n_recipes):
+        picked = set(rng.choices(names, weights=weights, k=rng.randint(2, 8)))
+        recipes.append(
+            SimpleNamespace(
+                drink_id=str(i),
+                name=f"Drink {i}",
+                thumbnail=None,
+                category=None,
+                glass=None,
+                alcoholic=None,
+                instructions=None,
+                volume_ml=None,
+                abv=None,
+                minhash=None,
+                ingredients=[
+                    SimpleNamespace(name=n, measure_ml=30.0) for n in sorted(picked)
+                ],
+            )
+        )
+    return recipes
+
+
+def timeit(fn, repeat: int) -> float:
+    """Median wall time of fn() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def legacy_loop(recipes, pantry):
+    for r in recipes:
+        ingredients = [i.name for i in r.ingredients]
+        score_cocktail(ingredients, pantry)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'recipes':>8} {'per-drink':>12} {'postings':>10} {'bitset':>10}"
+        f" {'servings':>10}  (ms)"
+    )
+    for size in SIZES:
+        recipes = make_catalog(size, rng)
+        index = RecommenderIndex.from_recipes(recipes, lambda s: s)
+        pantry = PantryClasses.from_names(rng.sample(sorted(index.vocab), PANTRY_SIZE))
+
+        legacy = "-"
+        if size <= LEGACY_MAX_RECIPES:
+            ms = timeit(lambda: legacy_loop(recipes, pantry), max(1, args.repeat // 5))
+            legacy = f"{ms:.2f}"
+        postings = timeit(lambda: index.score(pantry.classes), args.repeat)
+        bitset = timeit(lambda: index.score_all(pantry.classes), args.repeat)
+        servings = timeit(lambda: index.servings(pantry.volumes), args.repeat)
+        print(
+            f"{size:>8} {legacy:>12} {postings:>10.2f} {bitset:>10.2f}"
+            f" {servings:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+# Execute `python -m scripts.benchmark_scoring`
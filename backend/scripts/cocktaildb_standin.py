@@ -0,0 +1,316 @@
+# Local stand-in for TheCocktailDB, for offline development, benchmarks and
+# reproducible load tests of the recommendation path.
+#
+# Serves random.php, search.php, filter.php, lookup.php and list.php from the
+# bundled fixture (scripts/fixtures/cocktaildb_sample.json), optionally padded
+# with synthetic drinks, and can inject latency, errors and hung requests.
+# Point the backend at it with:
+#
+#   COCKTAILDB_BASE_URL=http://127.0.0.1:8100/api/json/v1/1
+#
+# Faults can also be changed while it runs: PUT /_standin/faults with any of
+# the Faults fields as JSON. GET /_standin/stats reports what was served.
+
+import argparse
+import asyncio
+import json
+import math
+import random
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal, get_args
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+API_PREFIX = "/api/json/v1/1"
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "cocktaildb_sample.json"
+LatencyDistribution = Literal["fixed", "uniform", "exponential", "lognormal"]
+LATENCY_DISTRIBUTIONS = get_args(LatencyDistribution)
+MAX_INGREDIENTS = 15
+# filter.php / list.php query parameter -> drink field
+FIELD_PARAMS = (("c", "strCategory"), ("g", "strGlass"), ("a", "strAlcoholic"))
+
+
+@dataclass
+class Faults:
+    """What the stand-in does to each request before answering it."""
+
+    latency_ms: float = 0.0  # fixed value, mean or median depending on distribution
+    jitter_ms: float = 0.0  # uniform: +/- range around latency_ms
+    sigma: float = 0.5  # lognormal: spread of log(latency)
+    distribution: str = "fixed"
+    error_rate: float = 0.0  # share of requests answered 503
+    timeout_rate: float = 0.0  # share of requests that hang for hang_seconds
+    hang_seconds: float = 60.0
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Seconds to wait before answering."""
+        base = self.latency_ms
+        if base <= 0 and self.distribution != "uniform":
+            return 0.0
+        if self.distribution == "uniform":
+            ms = rng.uniform(base - self.jitter_ms, base + self.jitter_ms)
+        elif self.distribution == "exponential":
+            ms = rng.expovariate(1 / base)
+        elif self.distribution == "lognormal":
+            ms = rng.lognormvariate(math.log(base), self.sigma)
+        else:
+            ms = base
+        return max(ms, 0.0) / 1000
+
+
+class FaultsUpdate(BaseModel):
+    """Body of PUT /_standin/faults: any subset of the Faults fields."""
+
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    latency_ms: float = Field(0.0, ge=0)
+    jitter_ms: float = Field(0.0, ge=0)
+    sigma: float = Field(0.5, ge=0)
+    distribution: LatencyDistribution = "fixed"
+    error_rate: float = Field(0.0, ge=0, le=1)
+    timeout_rate: float = Field(0.0, ge=0, le=1)
+    hang_seconds: float = Field(60.0, ge=0)
+
+
+# ===== Fixture data =====
+
+
+def expand_drink(item: dict) -> dict:
+    """
+    Full TheCocktailDB drink record from a compact fixture entry. Records that
+    are already in upstream shape (e.g. dumped from the real API) pass through.
+    """
+    if "idDrink" in item:
+        return item
+    drink = {
+        "idDrink": item["id"],
+        "strDrink": item["name"],
+        "strDrinkThumb": item.get("thumbnail"),
+        "strCategory": item.get("category"),
+        "strGlass": item.get("glass"),
+        "strAlcoholic": item.get("alcoholic"),
+        "strInstructions": item.get("instructions"),
+    }
+    ingredients = item.get("ingredients", [])
+    for i in range(1, MAX_INGREDIENTS + 1):
+        name, measure = ingredients[i - 1] if i <= len(ingredients) else (None, None)
+        drink[f"strIngredient{i}"] = name
+        drink[f"strMeasure{i}"] = measure
+    return drink
+
+
+def drink_ingredients(drink: dict) -> list[str]:
+    return [
+        drink[f"strIngredient{i}"]
+        for i in range(1, MAX_INGREDIENTS + 1)
+        if drink.get(f"strIngredient{i}")
+    ]
+
+
+def synthetic_drinks(base: list[dict], count: int, seed: int = 0) -> list[dict]:
+    """
+    Extra drinks recombined from the fixture's ingredients, for catalog-sized
+    load tests. Popular ingredients stay popular (Zipf-like), as upstream.
+    """
+    rng = random.Random(seed)
+    usage = Counter(ing for drink in base for ing in drink_ingredients(drink))
+    names = [name for name, _ in usage.most_common()]
+    weights = [1 / (rank + 1) for rank in range(len(names))]
+    categories = sorted({d["strCategory"] for d in base if d.get("strCategory")})
+    glasses = sorted({d["strGlass"] for d in base if d.get("strGlass")})
+
+    drinks = []
+    for i in range(count):
+        picked = list(dict.fromkeys(rng.choices(names, weights, k=rng.randint(2, 6))))
+        drinks.append(
+            expand_drink(
+                {
+                    "id": str(900000 + i),
+                    "name": f"Standin Drink {i}",
+                    "category": rng.choice(categories),
+                    "glass": rng.choice(glasses),
+                    "alcoholic": "Alcoholic",
+                    "instructions": "Stir with ice and strain.",
+                    "ingredients": [(name, "1 oz") for name in picked],
+                }
+            )
+        )
+    return drinks
+
+
+def load_drinks(
+    path: Path = FIXTURE_PATH, synthetic: int = 0, seed: int = 0
+) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        drinks = [expand_drink(item) for item in json.load(f)["drinks"]]
+    return drinks + synthetic_drinks(drinks, synthetic, seed)
+
+
+# ===== Endpoints =====
+
+
+def _summary(drink: dict) -> dict:
+    """The trimmed record filter.php returns."""
+    return {
+        "strDrink": drink["strDrink"],
+        "strDrinkThumb": drink.get("strDrinkThumb"),
+        "idDrink": drink["idDrink"],
+    }
+
+
+def _matches(value: str | None, wanted: str) -> bool:
+    # Upstream accepts underscores for spaces (filter.php?i=Dry_Vermouth)
+    return (value or "").lower() == wanted.replace("_", " ").lower()
+
+
+class StandinCatalog:
+    def __init__(self, drinks: list[dict], rng: random.Random):
+        self.drinks = drinks
+        self.by_id = {str(d["idDrink"]): d for d in drinks}
+        self.rng = rng
+
+    def random_drink(self, params: dict) -> list[dict] | None:
+        return [self.rng.choice(self.drinks)] if self.drinks else None
+
+    def search(self, params: dict) -> list[dict] | None:
+        if "f" in params:
+            letter = params["f"][:1].lower()
+            return [d for d in self.drinks if d["strDrink"][:1].lower() == letter]
+        needle = params.get("s", "").lower()
+        return [d for d in self.drinks if needle in d["strDrink"].lower()]
+
+    def filter_drinks(self, params: dict) -> list[dict] | None:
+        if "i" in params:
+            return [
+                _summary(d)
+                for d in self.drinks
+                if any(_matches(ing, params["i"]) for ing in drink_ingredients(d))
+            ]
+        for param, field in FIELD_PARAMS:
+            if param in params:
+                return [
+                    _summary(d)
+                    for d in self.drinks
+                    if _matches(d.get(field), params[param])
+                ]
+        return None
+
+    def lookup(self, params: dict) -> list[dict] | None:
+        drink = self.by_id.get(params.get("i", ""))
+        return [drink] if drink else None
+
+    def list_values(self, params: dict) -> list[dict] | None:
+        if params.get("i") == "list":
+            values = {ing for d in self.drinks for ing in drink_ingredients(d)}
+            return [{"strIngredient1": v} for v in sorted(values)]
+        for param, field in FIELD_PARAMS:
+            if params.get(param) == "list":
+                values = {d[field] for d in self.drinks if d.get(field)}
+                return [{field: v} for v in sorted(values)]
+        return None
+
+
+ENDPOINTS = {
+    "random.php": StandinCatalog.random_drink,
+    "search.php": StandinCatalog.search,
+    "filter.php": StandinCatalog.filter_drinks,
+    "lookup.php": StandinCatalog.lookup,
+    "list.php": StandinCatalog.list_values,
+}
+
+
+def create_app(
+    drinks: list[dict], faults: Faults | None = None, seed: int | None = None
+) -> FastAPI:
+    app = FastAPI(title="CocktailDB stand-in")
+    rng = random.Random(seed)
+    catalog = StandinCatalog(drinks, rng)
+    app.state.faults = faults or Faults()
+    app.state.stats = Counter()
+
+    @app.get(API_PREFIX + "/{endpoint}")
+    async def serve(endpoint: str, request: Request):
+        handler = ENDPOINTS.get(endpoint)
+        if handler is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+
+        faults: Faults = app.state.faults
+        stats: Counter = app.state.stats
+        stats["requests"] += 1
+        roll = rng.random()
+        if roll < faults.timeout_rate:
+            stats["timeouts"] += 1
+            await asyncio.sleep(faults.hang_seconds)
+            return JSONResponse({"error": "timeout"}, status_code=504)
+
+        await asyncio.sleep(faults.sample_latency(rng))
+        if roll < faults.timeout_rate + faults.error_rate:
+            stats["errors"] += 1
+            return JSONResponse({"error": "injected"}, status_code=503)
+
+        stats[endpoint] += 1
+        # Upstream answers {"drinks": null} when nothing matches
+        return {"drinks": handler(catalog, dict(request.query_params)) or None}
+
+    @app.get("/_standin/stats")
+    def get_stats():
+        return {"drinks": len(drinks), **app.state.stats}
+
+    @app.get("/_standin/faults")
+    def get_faults():
+        return asdict(app.state.faults)
+
+    @app.put("/_standin/faults")
+    def put_faults(changes: FaultsUpdate):
+        updated = Faults(
+            **{**asdict(app.state.faults), **changes.model_dump(exclude_unset=True)}
+        )
+        app.state.faults = updated
+        return asdict(updated)
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline TheCocktailDB stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--fixture", type=Path, default=FIXTURE_PATH)
+    parser.add_argument(
+        "--synthetic", type=int, default=0, help="extra generated drinks"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument(
+        "--distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=60.0)
+    args = parser.parse_args()
+
+    drinks = load_drinks(args.fixture, args.synthetic, args.seed or 0)
+    faults = Faults(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        sigma=args.sigma,
+        distribution=args.distribution,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+    )
+    print(f"Serving {len(drinks)} drinks at http://{args.host}:{args.port}{API_PREFIX}")
+    uvicorn.run(create_app(drinks, faults, args.seed), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
+
+# Execute `python -m scripts.cocktaildb_standin --latency-ms 80 --distribution lognormal`
@@ -0,0 +1,50 @@
+# Precompute recommendations for every user (meant to run nightly, after
+# sync_catalog).
+#
+# Pantries are read in chunks and scored against the local catalog in a
+# process pool, one process per core by default. Each user's full ranking, one
+# row per reachable recipe (sharing at least one ingredient with the pantry),
+# best first, is bulk-written to precomputed_recommendations. Unfiltered
+# GET /recommendations pages through those rows until the user's pantry, the
+# catalog or the ingredient taxonomy changes; filtered requests are scored live.
+
+import argparse
+import time
+
+from app.core.db import Base, SessionLocal, engine
+from app.models import recipe as _m_recipe  # noqa: F401
+from app.models import taxonomy as _m_taxonomy  # noqa: F401
+from app.models import user as _m_user  # noqa: F401
+from app.services.precompute import USER_CHUNK, precompute_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute recommendations")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="processes (default: one per core)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=USER_CHUNK)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        run = precompute_all(db, workers=args.workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    if run.catalog_version is None:
+        print("No catalog yet; run `python -m scripts.sync_catalog` first.")
+        return
+    print(
+        f"Precomputed {run.users} users ({run.rows} rows) against catalog version "
+        f"{run.catalog_version} in {elapsed:.1f}s."
+    )
+
+
+if __name__ == "__main__":
+    main()
+
+# Execute `python -m scripts.precompute_recommendations`
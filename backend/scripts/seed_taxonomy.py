@@ -0,0 +1,37 @@
+# Load the default ingredient taxonomy (brands -> styles -> spirits, see
+# DEFAULT_TAXONOMY in app/services/taxonomy.py) so that a pantry with, say,
+# Bacardi counts for recipes calling for White Rum or Rum.
+#
+# Only missing edges are added, so it is safe to run repeatedly; each edge
+# updates the closure table incrementally. `--rebuild` recomputes the whole
+# closure from the edges instead, to repair it.
+
+import argparse
+
+from app.core.db import Base, SessionLocal, engine
+from app.models import taxonomy as _m_taxonomy  # noqa: F401
+from app.services.taxonomy import rebuild_closure, seed_defaults
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the ingredient taxonomy")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="recompute the closure from scratch"
+    )
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        added = seed_defaults(db)
+        print(f"Added {added} taxonomy edges.")
+        if args.rebuild:
+            print(f"Rebuilt the closure table ({rebuild_closure(db)} rows).")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
+
+# Execute `python -m scripts.seed_taxonomy`
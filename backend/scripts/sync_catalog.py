@@ -0,0 +1,33 @@
+# Mirror the whole TheCocktailDB catalog into the local recipes tables.
+# Recommendations, search and detail pages read from this local copy.
+#
+# Re-run whenever you want to refresh the catalog; it is safe to run repeatedly.
+
+import asyncio
+
+from app.core.db import Base, SessionLocal, engine
+from app.models import recipe as _m_recipe  # noqa: F401
+from app.services.catalog import sync_catalog
+from app.services.upstream import UpstreamClient
+
+
+async def main():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        client = UpstreamClient(timeout=30.0)
+        try:
+            run = await sync_catalog(db, client)
+        finally:
+            await client.aclose()
+        print(f"Synced {run.drink_count} drinks (catalog version {run.id}).")
+        if run.failed_keys:
+            print(f"Letters that failed and should be retried: {run.failed_keys}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+
+# Execute `python -m scripts.sync_catalog`
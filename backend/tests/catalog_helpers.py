@@ -0,0 +1,109 @@
+"""Shared test data: a tiny TheCocktailDB catalog and recipe stand-ins."""
+
+from types import SimpleNamespace
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.models.recipe import (
+    CatalogSync,
+    PrecomputedRecommendation,
+    Recipe,
+    RecipeIngredient,
+)
+from app.models.taxonomy import IngredientClosure, IngredientTaxonomy, TaxonomyChange
+from app.services.catalog import sync_catalog
+from app.services.upstream import UpstreamClient
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+def make_drink(drink_id: str, name: str, ingredients: list[str], **extra) -> dict:
+    """Build a drink in TheCocktailDB shape (empty slots are null, like upstream)."""
+    drink = {
+        "idDrink": drink_id,
+        "strDrink": name,
+        "strDrinkThumb": f"https://img.test/{drink_id}.jpg",
+        "strCategory": "Cocktail",
+        "strGlass": "Cocktail glass",
+        "strAlcoholic": "Alcoholic",
+        "strInstructions": f"Make a {name}.",
+    }
+    for i in range(1, 16):
+        drink[f"strIngredient{i}"] = None
+        drink[f"strMeasure{i}"] = None
+    for i, ing in enumerate(ingredients, start=1):
+        drink[f"strIngredient{i}"] = ing
+        drink[f"strMeasure{i}"] = "1 oz"
+    drink.update(extra)
+    return drink
+
+
+# Crawl key -> drinks listed under it
+FIXTURE = {
+    "g": [make_drink("990001", "Test Gimlet", ["Gin", "Lime Juice"])],
+    "m": [
+        make_drink("990002", "Test Martini", ["Gin", "Dry Vermouth", "Olive"]),
+        make_drink(
+            "990003",
+            "Test Mojito",
+            ["Light rum", "Mint", "Sugar"],
+            strCategory="Ordinary Drink",
+            strGlass="Highball glass",
+        ),
+    ],
+}
+
+
+def fixture_transport(fail_keys: str = "") -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.url.params.get("f", "")
+        if key in fail_keys:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"drinks": FIXTURE.get(key)})
+
+    return httpx.MockTransport(handler)
+
+
+def clear_catalog(db: Session) -> None:
+    db.query(PrecomputedRecommendation).delete()
+    db.query(RecipeIngredient).delete()
+    db.query(Recipe).delete()
+    db.query(CatalogSync).delete()
+    db.query(IngredientClosure).delete()
+    db.query(IngredientTaxonomy).delete()
+    db.query(TaxonomyChange).delete()
+    db.commit()
+
+
+async def run_sync(db: Session, fail_keys: str = "") -> CatalogSync:
+    client = UpstreamClient(BASE_URL, transport=fixture_transport(fail_keys))
+    try:
+        return await sync_catalog(db, client)
+    finally:
+        await client.aclose()
+
+
+def make_recipe(
+    drink_id: str,
+    ingredients: list[str],
+    measures_ml: list[float | None] | None = None,
+) -> SimpleNamespace:
+    """Stand-in for a Recipe row, as RecommenderIndex.from_recipes reads it."""
+    measures_ml = measures_ml or [None] * len(ingredients)
+    return SimpleNamespace(
+        drink_id=drink_id,
+        name=f"Drink {drink_id}",
+        thumbnail=None,
+        category=None,
+        glass=None,
+        alcoholic=None,
+        instructions=None,
+        volume_ml=None,
+        abv=None,
+        minhash=None,
+        ingredients=[
+            SimpleNamespace(name=n, measure_ml=ml)
+            for n, ml in zip(ingredients, measures_ml)
+        ],
+    )
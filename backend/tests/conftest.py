@@ -0,0 +1,85 @@
+import itertools
+
+import httpx
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal
+from app.core.security import hash_password
+from app.main import app
+from app.models.user import User
+from app.services import upstream
+from app.services.upstream import UpstreamClient
+from tests.catalog_helpers import BASE_URL, FIXTURE, clear_catalog
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def shared_upstream():
+    """Each test runs on its own event loop: close the shared client it used."""
+    yield
+    await upstream.close_upstream()
+
+
+@pytest.fixture
+def catalog_session() -> Session:
+    """Provide a database session with an empty catalog."""
+    db = SessionLocal()
+    clear_catalog(db)
+    try:
+        yield db
+    finally:
+        db.rollback()
+        clear_catalog(db)
+        db.close()
+
+
+@pytest.fixture
+def catalog_user(catalog_session: Session) -> User:
+    db = catalog_session
+    existing = db.query(User).filter(User.email == "test_catalog@example.com").first()
+    if existing:
+        db.delete(existing)
+        db.commit()
+
+    user = User(
+        email="test_catalog@example.com",
+        hashed_password=hash_password("testpass123"),
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    yield user
+
+    db.delete(user)
+    db.commit()
+
+
+@pytest_asyncio.fixture
+async def catalog_client(catalog_user: User) -> AsyncClient:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        login_resp = await client.post(
+            "/api/v1/auth/login",
+            json={"email": catalog_user.email, "password": "testpass123"},
+        )
+        assert login_resp.status_code == 200
+        access_token = login_resp.json()["access_token"]
+        client.headers.update({"Authorization": f"Bearer {access_token}"})
+        yield client
+
+
+@pytest_asyncio.fixture
+async def sampled_upstream():
+    """An upstream whose random.php cycles through the catalog fixture drinks."""
+    drinks = itertools.cycle(FIXTURE["g"] + FIXTURE["m"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"drinks": [next(drinks)]})
+
+    upstream.set_upstream(
+        UpstreamClient(BASE_URL, transport=httpx.MockTransport(handler))
+    )
+    yield
+    await upstream.close_upstream()
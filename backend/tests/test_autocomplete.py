@@ -0,0 +1,55 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.services.autocomplete import IngredientTrie
+from tests.catalog_helpers import run_sync
+
+COUNTS = {
+    "Gin": 120,
+    "Ginger Ale": 30,
+    "Ginger Beer": 12,
+    "Grenadine": 40,
+    "Dark rum": 25,
+    "Light rum": 60,
+    "Triple Sec": 50,
+}
+
+
+def test_prefix_suggestions_are_ranked_by_usage():
+    trie = IngredientTrie(COUNTS)
+
+    assert trie.complete("gin") == [
+        ("Gin", 120),
+        ("Ginger Ale", 30),
+        ("Ginger Beer", 12),
+    ]
+    assert trie.complete("G", limit=2) == [("Gin", 120), ("Grenadine", 40)]
+    assert trie.complete("ginger b") == [("Ginger Beer", 12)]
+    assert trie.complete("vodka") == []
+
+
+def test_later_words_and_aliases_match():
+    trie = IngredientTrie(COUNTS, aliases={"cointreau": "Triple Sec", "x": "Nope"})
+
+    assert trie.complete("rum") == [("Light rum", 60), ("Dark rum", 25)]
+    assert trie.complete("  Cointr") == [("Triple Sec", 50)]
+    # Aliases pointing at ingredients outside the catalog are ignored
+    assert trie.complete("x") == []
+
+
+@pytest.mark.asyncio
+async def test_ingredient_autocomplete_reads_catalog(catalog_session: Session):
+    await run_sync(catalog_session)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/ingredients/autocomplete", params={"q": "g"})
+        assert resp.status_code == 200
+        assert resp.json()["suggestions"] == [{"name": "Gin", "recipe_count": 2}]
+
+        resp = await client.get(
+            "/api/v1/ingredients/autocomplete", params={"q": "juice"}
+        )
+        assert [s["name"] for s in resp.json()["suggestions"]] == ["Lime Juice"]
@@ -0,0 +1,56 @@
+import string
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.recipe import Recipe, RecipeIngredient
+from app.services import recommender
+from app.services.catalog import catalog_version, get_recipe
+from tests.catalog_helpers import run_sync
+
+
+@pytest.mark.asyncio
+async def test_sync_catalog_stores_recipes(catalog_session: Session):
+    run = await run_sync(catalog_session)
+
+    assert run.drink_count == 3
+    assert run.failed_keys is None
+    assert catalog_version(catalog_session) == run.id
+
+    martini = get_recipe(catalog_session, "990002")
+    assert martini.name == "Test Martini"
+    assert [i.name for i in martini.ingredients] == ["Gin", "Dry Vermouth", "Olive"]
+    assert martini.ingredients[0].measure == "1 oz"
+    assert martini.ingredients[0].measure_ml == pytest.approx(29.57)
+
+
+@pytest.mark.asyncio
+async def test_sync_catalog_is_idempotent_and_prunes(catalog_session: Session):
+    await run_sync(catalog_session)
+    stale = Recipe(drink_id="990099", name="Gone Upstream")
+    catalog_session.add(stale)
+    catalog_session.commit()
+
+    # A partial crawl must not prune anything
+    run = await run_sync(catalog_session, fail_keys="g")
+    assert run.failed_keys == "g"
+    assert get_recipe(catalog_session, "990099") is not None
+    assert get_recipe(catalog_session, "990001") is not None
+
+    # A complete crawl prunes drinks that vanished upstream
+    await run_sync(catalog_session)
+    assert get_recipe(catalog_session, "990099") is None
+    assert catalog_session.query(Recipe).count() == 3
+    assert catalog_session.query(RecipeIngredient).count() == 8
+
+
+@pytest.mark.asyncio
+async def test_failed_first_sync_leaves_no_index(catalog_session: Session):
+    run = await run_sync(
+        catalog_session, fail_keys=string.ascii_lowercase + string.digits
+    )
+
+    assert run.drink_count == 0
+    assert catalog_version(catalog_session) == run.id
+    # Recommendations fall back to the upstream instead of an empty catalog
+    assert recommender.get_recommender(catalog_session) is None
@@ -0,0 +1,112 @@
+import random
+
+import httpx
+import pytest
+
+from app.services.catalog import fetch_catalog
+from app.services.upstream import UpstreamClient
+from scripts.cocktaildb_standin import API_PREFIX, Faults, create_app, load_drinks
+
+BASE_URL = "http://standin.test" + API_PREFIX
+
+
+def standin_client(faults: Faults | None = None) -> UpstreamClient:
+    app = create_app(load_drinks(), faults, seed=7)
+    return UpstreamClient(BASE_URL, transport=httpx.ASGITransport(app=app))
+
+
+@pytest.mark.asyncio
+async def test_standin_serves_cocktaildb_endpoints():
+    client = standin_client()
+    try:
+        drink = (await client.get_json("random.php"))["drinks"][0]
+        assert drink["idDrink"] and "strIngredient15" in drink
+
+        margarita = await client.get_json("lookup.php", {"i": "11007"})
+        assert margarita["drinks"][0]["strDrink"] == "Margarita"
+        assert (await client.get_json("lookup.php", {"i": "1"})) == {"drinks": None}
+
+        found = await client.get_json("search.php", {"s": "martini"})
+        assert {d["strDrink"] for d in found["drinks"]} == {
+            "Dry Martini",
+            "Espresso Martini",
+        }
+
+        gin = await client.get_json("filter.php", {"i": "Dry_Vermouth"})
+        assert [d["idDrink"] for d in gin["drinks"]] == ["11005"]
+
+        glasses = await client.get_json("list.php", {"g": "list"})
+        assert {"strGlass": "Copper Mug"} in glasses["drinks"]
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_catalog_crawl_against_standin():
+    client = standin_client()
+    try:
+        drinks, failed = await fetch_catalog(client)
+    finally:
+        await client.aclose()
+
+    assert failed == []
+    assert len(drinks) == len(load_drinks())
+
+
+@pytest.mark.asyncio
+async def test_standin_injects_errors_and_timeouts():
+    client = standin_client(Faults(error_rate=1.0))
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_json("random.php")
+    finally:
+        await client.aclose()
+
+    # Hung requests answer 504 after hang_seconds (a real client times out first)
+    client = standin_client(Faults(timeout_rate=1.0, hang_seconds=0.01))
+    try:
+        with pytest.raises(httpx.HTTPStatusError) as exc:
+            await client.get_json("random.php")
+        assert exc.value.response.status_code == 504
+    finally:
+        await client.aclose()
+
+
+def test_latency_distributions_and_synthetic_padding():
+    rng = random.Random(1)
+    assert Faults(latency_ms=40).sample_latency(rng) == 0.04
+    spread = Faults(latency_ms=40, jitter_ms=10, distribution="uniform")
+    assert all(0.03 <= spread.sample_latency(rng) <= 0.05 for _ in range(100))
+    tail = Faults(latency_ms=40, sigma=1.0, distribution="lognormal")
+    samples = sorted(tail.sample_latency(rng) for _ in range(1000))
+    assert 0.03 < samples[500] < 0.055 and samples[990] > 0.2
+
+    drinks = load_drinks(synthetic=200, seed=3)
+    assert len({d["idDrink"] for d in drinks}) == len(drinks)
+    assert drinks[-1]["strDrink"].startswith("Standin Drink")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"error_rate": "0.5"},
+        {"error_rate": 1.5},
+        {"hang_seconds": -1},
+        {"latency_ms": None},
+        {"distribution": "pareto"},
+        {"retry_rate": 0.1},
+    ],
+)
+async def test_fault_updates_are_validated(changes: dict):
+    app = create_app(load_drinks(), seed=7)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://standin.test"
+    ) as c:
+        resp = await c.put("/_standin/faults", json=changes)
+        assert resp.status_code == 422
+        resp = await c.put("/_standin/faults", json={"error_rate": 1, "latency_ms": 5})
+        assert resp.json()["error_rate"] == 1.0
+        assert resp.json()["distribution"] == "fixed"
+        assert (await c.get(API_PREFIX + "/random.php")).status_code == 503
@@ -0,0 +1,170 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.services.catalog import get_recipe
+from tests.catalog_helpers import run_sync
+
+
+@pytest.mark.asyncio
+async def test_cocktail_detail_and_search_read_local_catalog(catalog_session: Session):
+    await run_sync(catalog_session)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/cocktails/990001")
+        assert resp.status_code == 200
+        detail = resp.json()
+        assert detail["name"] == "Test Gimlet"
+        assert detail["glass"] == "Cocktail glass"
+        assert [i["name"] for i in detail["ingredients"]] == ["Gin", "Lime Juice"]
+
+        resp = await client.get("/api/v1/cocktails/does-not-exist")
+        assert resp.status_code == 404
+
+        resp = await client.get("/api/v1/cocktails/search", params={"q": "test m"})
+        assert resp.status_code == 200
+        names = [c["name"] for c in resp.json()["cocktails"]]
+        # Name matches first; the Gimlet only matches "Make a ..." in instructions
+        assert set(names[:2]) == {"Test Martini", "Test Mojito"}
+        assert names[2:] == ["Test Gimlet"]
+
+
+@pytest.mark.asyncio
+async def test_cocktail_search_full_text_prefix_and_pages(catalog_session: Session):
+    await run_sync(catalog_session)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        # Ingredient match, typed as a prefix
+        resp = await client.get("/api/v1/cocktails/search", params={"q": "verm"})
+        assert [c["id"] for c in resp.json()["cocktails"]] == ["990002"]
+
+        # Every word must match
+        resp = await client.get("/api/v1/cocktails/search", params={"q": "gin mint"})
+        assert resp.json()["total_matches"] == 0
+
+        resp = await client.get(
+            "/api/v1/cocktails/search", params={"q": "test", "limit": 2}
+        )
+        first = resp.json()
+        assert first["total_found"] == 2
+        assert first["total_matches"] == 3
+        assert first["next_offset"] == 2
+
+        resp = await client.get(
+            "/api/v1/cocktails/search",
+            params={"q": "test", "limit": 2, "offset": first["next_offset"]},
+        )
+        second = resp.json()
+        assert second["next_offset"] is None
+        ids = [c["id"] for c in first["cocktails"] + second["cocktails"]]
+        assert sorted(ids) == ["990001", "990002", "990003"]
+
+        # Misspelled queries get a suggestion instead of nothing
+        resp = await client.get("/api/v1/cocktails/search", params={"q": "tset martni"})
+        assert resp.json()["total_matches"] == 0
+        assert resp.json()["did_you_mean"] == "test martini"
+
+        # Only offered when it finds something under the same filters
+        resp = await client.get(
+            "/api/v1/cocktails/search",
+            params={"q": "tset martni", "glass": "Highball glass"},
+        )
+        assert resp.json()["did_you_mean"] is None
+        # Filters, not spelling, emptied a correctly spelled query
+        resp = await client.get(
+            "/api/v1/cocktails/search", params={"q": "martin", "abv_min": 30}
+        )
+        assert resp.json()["total_matches"] == 0
+        assert resp.json()["did_you_mean"] is None
+
+        # FTS syntax in user input is matched literally, not parsed
+        resp = await client.get("/api/v1/cocktails/search", params={"q": 'gin" OR *'})
+        assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_cocktail_strength_stored_and_filtered(catalog_session: Session):
+    await run_sync(catalog_session)
+    # 1 oz Gin + 1 oz Lime Juice; Martini (40 + 18 + 0) / 3; Mojito rum / 3
+    gimlet = get_recipe(catalog_session, "990001")
+    assert gimlet.volume_ml == pytest.approx(59.1)
+    assert gimlet.abv == 20.0
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/cocktails/990002")
+        assert resp.json()["abv"] == 19.3
+
+        resp = await client.get(
+            "/api/v1/cocktails/search", params={"q": "test", "abv_min": 15}
+        )
+        body = resp.json()
+        assert sorted(c["id"] for c in body["cocktails"]) == ["990001", "990002"]
+        assert body["total_matches"] == 2
+
+        resp = await client.get(
+            "/api/v1/cocktails/search",
+            params={"q": "test", "abv_min": 19.5, "abv_max": 25, "limit": 1},
+        )
+        assert [c["id"] for c in resp.json()["cocktails"]] == ["990001"]
+        assert resp.json()["next_offset"] is None
+
+        resp = await client.get(
+            "/api/v1/cocktails/search", params={"q": "test", "abv_max": 101}
+        )
+        assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_cocktail_search_facet_filters_and_counts(catalog_session: Session):
+    await run_sync(catalog_session)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/cocktails/search", params={"q": "test"})
+        facets = resp.json()["facets"]
+        assert facets["category"] == {"Cocktail": 2, "Ordinary Drink": 1}
+        assert facets["glass"] == {"Cocktail glass": 2, "Highball glass": 1}
+        assert facets["alcoholic"] == {"Alcoholic": 3}
+
+        # Values of one facet are ORed, facets are ANDed; counts follow the filter
+        resp = await client.get(
+            "/api/v1/cocktails/search",
+            params={
+                "q": "test",
+                "category": ["ordinary drink", "Shot"],
+                "alcoholic": "Alcoholic",
+            },
+        )
+        body = resp.json()
+        assert [c["id"] for c in body["cocktails"]] == ["990003"]
+        assert body["total_matches"] == 1
+        assert body["facets"]["glass"] == {"Highball glass": 1}
+
+        resp = await client.get(
+            "/api/v1/cocktails/search", params={"q": "test", "glass": "Coupe"}
+        )
+        assert resp.json()["total_matches"] == 0
+        assert resp.json()["facets"]["category"] == {}
+
+
+@pytest.mark.asyncio
+async def test_similar_cocktails_by_ingredients(catalog_session: Session):
+    await run_sync(catalog_session)
+    assert get_recipe(catalog_session, "990001").minhash is not None
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/cocktails/990001/similar")
+        assert resp.status_code == 200
+        # Gin is shared with the Martini; the Mojito has nothing in common
+        cocktails = resp.json()["cocktails"]
+        assert [c["id"] for c in cocktails] == ["990002"]
+        assert cocktails[0]["similarity"] == 0.25
+        assert cocktails[0]["shared_ingredients"] == ["Gin"]
+
+        resp = await client.get("/api/v1/cocktails/does-not-exist/similar")
+        assert resp.status_code == 404
@@ -0,0 +1,59 @@
+import numpy as np
+
+from app.services.bitset import pack, pack_mask, unpack_mask
+from app.services.facets import FacetIndex, facet_values
+
+
+def build_facets() -> FacetIndex:
+    return FacetIndex(
+        {
+            "category": ["Cocktail", "Shot", "cocktail", None, "Ordinary Drink"],
+            "glass": ["Cocktail glass", "Shot glass", "Highball glass", None, ""],
+            "alcoholic": ["Alcoholic", "Alcoholic", "Non alcoholic", None, None],
+        },
+        n_entries=5,
+    )
+
+
+def test_pack_mask_matches_pack_layout():
+    mask = np.zeros(130, dtype=bool)
+    mask[[0, 63, 64, 129]] = True
+    vec = pack_mask(mask)
+    assert np.array_equal(vec, pack([0, 63, 64, 129], 130))
+    assert np.array_equal(unpack_mask(vec, 130), mask)
+
+
+def test_facet_values_are_canonical():
+    assert facet_values([" Shot", "cocktail", "Cocktail", ""]) == ("cocktail", "shot")
+    assert facet_values(None) == ()
+
+
+def test_select_ors_values_and_ands_facets():
+    facets = build_facets()
+    assert facets.select({}) is None
+    assert facets.select({"glass": []}) is None
+
+    mask = facets.mask({"category": ["COCKTAIL"]})
+    assert np.flatnonzero(mask).tolist() == [0, 2]
+
+    mask = facets.mask({"category": ["Cocktail", "Shot"], "alcoholic": ["alcoholic"]})
+    assert np.flatnonzero(mask).tolist() == [0, 1]
+
+    mask = facets.mask({"category": ["Cocktail"], "glass": ["No such glass"]})
+    assert not mask.any()
+
+
+def test_counts_cover_the_result_set_only():
+    facets = build_facets()
+    counts = facets.counts(pack([0, 1, 2, 3], 5))
+    # first spelling seen is shown; largest count first
+    assert counts["category"] == {"Cocktail": 2, "Shot": 1}
+    assert list(counts["alcoholic"].items()) == [("Alcoholic", 2), ("Non alcoholic", 1)]
+    assert counts["glass"] == {
+        "Cocktail glass": 1,
+        "Highball glass": 1,
+        "Shot glass": 1,
+    }
+
+    empty = facets.counts(pack([], 5))
+    assert empty == {"category": {}, "glass": {}, "alcoholic": {}}
@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.hedging import MIN_SAMPLES, Hedger
+from app.services.upstream import UpstreamClient
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+def warmed_up(budget: float, latency: float = 0.01) -> Hedger:
+    hedger = Hedger(budget=budget)
+    for _ in range(MIN_SAMPLES):
+        hedger.observe(latency)
+    return hedger
+
+
+def scripted(latencies: list[float]):
+    """send() whose n-th call takes latencies[n] seconds and returns n."""
+    calls = 0
+
+    async def send():
+        nonlocal calls
+        n = calls
+        calls += 1
+        await asyncio.sleep(latencies[n])
+        return n
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_until_latency_is_known():
+    hedger = Hedger(budget=1.0)
+    assert hedger.delay() is None
+    assert await hedger.run(scripted([0.05, 0.0])) == 0
+    assert hedger.stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_hedge_wins():
+    hedger = warmed_up(budget=1.0)
+
+    started = time.perf_counter()
+    assert await hedger.run(scripted([1.0, 0.0])) == 1
+    assert time.perf_counter() - started < 0.5
+
+    # Fast primaries are never duplicated
+    assert await hedger.run(scripted([0.0, 0.0])) == 0
+
+    stats = hedger.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == 0.5
+    assert stats["win_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_hedges_stay_within_budget():
+    hedger = warmed_up(budget=0.05, latency=0.001)
+
+    for _ in range(100):
+        await hedger.run(scripted([0.005, 0.0]))
+
+    stats = hedger.stats()
+    assert stats["hedged"] == 5
+    assert stats["over_budget"] == 95
+
+
+@pytest.mark.asyncio
+async def test_time_queued_before_admission_is_not_hedged():
+    hedger = warmed_up(budget=1.0, latency=0.02)
+    slots = asyncio.Semaphore(2)
+
+    async def call():
+        admitted = asyncio.Event()
+
+        async def send():
+            async with slots:
+                admitted.set()
+                await asyncio.sleep(0.01)
+            return "ok"
+
+        return await hedger.run(send, admitted)
+
+    # Five waves of two: most calls queue far longer than the p95
+    assert await asyncio.gather(*(call() for _ in range(10))) == ["ok"] * 10
+    assert hedger.stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_back_to_hedge_reply():
+    hedger = warmed_up(budget=1.0)
+    calls = 0
+
+    async def send():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            raise httpx.ReadTimeout("slow")
+        await asyncio.sleep(0.1)
+        return "hedge"
+
+    assert await hedger.run(send) == "hedge"
+
+
+@pytest.mark.asyncio
+async def test_client_hedges_slow_lookups():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, json={"drinks": [{"idDrink": str(calls)}]})
+
+    client = UpstreamClient(
+        BASE_URL, transport=httpx.MockTransport(handler), hedger=warmed_up(1.0)
+    )
+    try:
+        body = await client.get_json("lookup.php", {"i": "11007"})
+    finally:
+        await client.aclose()
+
+    assert body == {"drinks": [{"idDrink": "2"}]}
+    assert client.hedger.stats()["hedge_wins"] == 1
+    assert client.guard.stats()["limiter"]["in_flight"] == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from app.services.measures import parse_measure
+
+
+@pytest.mark.parametrize(
+    ("text", "ml"),
+    [
+        ("1 1/2 oz ", 44.36),
+        ("1½ oz", 44.36),
+        ("2 cl", 20.0),
+        ("10 ml", 10.0),
+        ("1/2 shot", 22.18),
+        ("3 parts", 88.72),
+        ("1 tblsp", 14.79),
+        ("1/4 cup", 59.15),
+        ("2-3 dashes", 2.3),
+        ("2 to 3 oz", 73.93),
+        ("Dash", 0.92),
+    ],
+)
+def test_parse_measure_to_ml(text: str, ml: float):
+    assert parse_measure(text) == pytest.approx(ml)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        None,
+        "",
+        "Juice of 1/2",
+        "Fill with",
+        "Garnish with",
+        "1",
+        "1 slice",
+        # weights, not volumes; "lb" must not read as litres
+        "1 lb",
+        "1 lbs",
+        # malformed amounts
+        "1/0",
+        "1/0 oz",
+        "1-1/0 oz",
+    ],
+)
+def test_measures_without_a_volume(text):
+    assert parse_measure(text) is None
@@ -0,0 +1,36 @@
+from app.services.normalize import canonical_name, normalize_ingredient_name
+
+
+def test_normalize_strips_punctuation_filler_and_plurals():
+    assert (
+        normalize_ingredient_name("Fresh Lime-Juice (squeezed)")
+        == "lime juice squeezed"
+    )
+    assert normalize_ingredient_name("Cherries") == "cherry"
+    assert normalize_ingredient_name("2 oz of the Vodka") == "2 vodka"
+    assert normalize_ingredient_name("") == ""
+
+
+def test_normalize_folds_aliases_onto_cocktaildb_names():
+    assert normalize_ingredient_name("Cointreau") == "triple sec"
+    assert normalize_ingredient_name("Light rum") == "white rum"
+    assert normalize_ingredient_name("London Dry Gin") == "gin"
+    assert normalize_ingredient_name("Simple Syrup") == "sugar syrup"
+    # alias hit before singularization, so "bitters" keeps its plural
+    assert normalize_ingredient_name("Angostura Bitters") == "angostura bitters"
+
+
+def test_canonical_name_matches_frontend_display_names():
+    assert canonical_name("club soda") == "Soda Water"
+    assert canonical_name("fresh lime juice") == "Lime Juice"
+    assert canonical_name("blue  curacao liqueur") == "Blue Curacao Liqueur"
+
+
+def test_normalize_is_memoized_per_distinct_string():
+    normalize_ingredient_name.cache_clear()
+    for _ in range(3):
+        normalize_ingredient_name("Dry Vermouth")
+        normalize_ingredient_name("Olive")
+    info = normalize_ingredient_name.cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
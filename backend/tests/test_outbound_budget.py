@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.catalog import fetch_catalog
+from app.services.outbound_budget import BACKGROUND, INTERACTIVE, OutboundBudget
+from app.services.upstream import UpstreamClient
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+@pytest.mark.asyncio
+async def test_interactive_lane_preempts_background():
+    budget = OutboundBudget(rate=100, burst=1)
+    await budget.acquire(BACKGROUND)  # drains the bucket
+    order = []
+
+    async def request(lane: str, name: str):
+        await budget.acquire(lane)
+        order.append(name)
+
+    background = [asyncio.create_task(request(BACKGROUND, f"bg{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request(INTERACTIVE, "ui"))
+    await asyncio.gather(*background, interactive)
+
+    assert order == ["ui", "bg0", "bg1", "bg2"]
+    lanes = budget.stats()["lanes"]
+    assert lanes["background"]["admitted"] == 4
+    assert lanes["background"]["queued_total"] == 3
+    assert lanes["interactive"]["wait_ms_max"] > 0
+    assert lanes["background"]["wait_ms_max"] >= lanes["interactive"]["wait_ms_max"]
+
+
+@pytest.mark.asyncio
+async def test_budget_paces_requests_to_rate():
+    budget = OutboundBudget(rate=200, burst=2)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(budget.acquire() for _ in range(12)))
+    # 2 from the burst, 10 more at 200/s
+    assert loop.time() - started >= 0.045
+    assert budget.stats()["lanes"]["interactive"]["admitted"] == 12
+
+
+@pytest.mark.asyncio
+async def test_disabled_budget_never_waits():
+    budget = OutboundBudget(rate=0, burst=0)
+    await asyncio.wait_for(asyncio.gather(*(budget.acquire() for _ in range(100))), 0.1)
+
+
+@pytest.mark.asyncio
+async def test_catalog_crawl_runs_in_background_lane():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"drinks": None})
+
+    client = UpstreamClient(
+        BASE_URL,
+        transport=httpx.MockTransport(handler),
+        budget=OutboundBudget(rate=1000, burst=5),
+    )
+    try:
+        await fetch_catalog(client)
+        await client.get_json("lookup.php", {"i": "1"})
+    finally:
+        await client.aclose()
+
+    lanes = client.budget.stats()["lanes"]
+    assert lanes["background"]["admitted"] == 36
+    assert lanes["interactive"]["admitted"] == 1
@@ -106,6 +106,9 @@ async def test_pantry_to_recommendations_flow(
     # Step 3: Get recommendations (request more to increase chances of matches)
     # Try multiple times to increase likelihood of finding fully makeable cocktails
     rec_resp = await authenticated_client.get("/api/v1/recommendations?limit=50")
+    if rec_resp.status_code in (503, 504):
+        # Every call to TheCocktailDB failed and nothing was cached
+        pytest.skip(f"TheCocktailDB API unavailable: {rec_resp.text}")
     assert rec_resp.status_code == 200, f"Recommendations failed: {rec_resp.text}"
 
     recommendations = rec_resp.json()
@@ -0,0 +1,134 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.models.recipe import PrecomputedRecommendation
+from app.models.user import User
+from app.services.catalog import catalog_version
+from app.services.precompute import load_precomputed, precompute_all
+from tests.catalog_helpers import FIXTURE, make_drink, run_sync
+
+
+@pytest.mark.asyncio
+async def test_precomputed_recommendations_are_served_while_fresh(
+    catalog_session: Session, catalog_client: AsyncClient, catalog_user: User
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime Juice"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    run = precompute_all(catalog_session, workers=1)
+    assert run.users >= 1
+    catalog_session.refresh(catalog_user)
+    stored = load_precomputed(
+        catalog_session,
+        catalog_user.id,
+        catalog_user.pantry_version,
+        run.catalog_version,
+    )
+    assert stored == [("990001", 2, 2), ("990002", 1, 3)]
+
+    # Served from the table: a row removed there disappears from the response
+    catalog_session.query(PrecomputedRecommendation).filter(
+        PrecomputedRecommendation.user_id == catalog_user.id,
+        PrecomputedRecommendation.drink_id == "990002",
+    ).delete()
+    catalog_session.commit()
+    resp = await catalog_client.get("/api/v1/recommendations")
+    assert [c["id"] for c in resp.json()["cocktails"]] == ["990001"]
+
+    # A pantry change makes the stored ranking stale
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Olive"}
+    )
+    resp = await catalog_client.get("/api/v1/recommendations")
+    assert [c["id"] for c in resp.json()["cocktails"]] == ["990001", "990002"]
+
+
+@pytest.mark.asyncio
+async def test_precompute_process_pool_matches_in_process(
+    catalog_session: Session, catalog_client: AsyncClient, catalog_user: User
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Mint", "Sugar"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    def stored_rows():
+        return [
+            (r.drink_id, r.matched, r.total)
+            for r in catalog_session.query(PrecomputedRecommendation)
+            .filter(PrecomputedRecommendation.user_id == catalog_user.id)
+            .order_by(PrecomputedRecommendation.rank)
+        ]
+
+    precompute_all(catalog_session, workers=1)
+    in_process = stored_rows()
+    precompute_all(catalog_session, workers=2, chunk_size=1)
+    assert stored_rows() == in_process
+    assert [drink_id for drink_id, _, _ in in_process] == ["990003", "990001", "990002"]
+
+
+@pytest.mark.asyncio
+async def test_precomputed_rankings_cover_every_reachable_recipe(
+    catalog_session: Session,
+    catalog_client: AsyncClient,
+    catalog_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # 201 two-thirds matches push the strong drink below position 200
+    fillers = [
+        make_drink(f"98{i:04d}", f"Filler {i}", ["Gin", "Lime Juice", f"Filler {i}"])
+        for i in range(201)
+    ]
+    strong = make_drink("979999", "Strong One", ["Gin", "Everclear", "Absinthe"])
+    monkeypatch.setitem(FIXTURE, "f", fillers)
+    monkeypatch.setitem(FIXTURE, "s", [strong])
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime Juice"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    precompute_all(catalog_session, workers=1)
+    catalog_session.refresh(catalog_user)
+    stored = load_precomputed(
+        catalog_session,
+        catalog_user.id,
+        catalog_user.pantry_version,
+        catalog_version(catalog_session),
+    )
+    # Every reachable recipe is stored, not just the top rows
+    assert len(stored) == 204
+    assert stored[-1][0] == "979999"
+
+    # Paging the stored ranking reaches the end, like live scoring would
+    resp = await catalog_client.get("/api/v1/recommendations", params={"limit": 50})
+    body = resp.json()
+    assert body["total_ranked"] == 204
+    seen = len(body["cocktails"])
+    while body["next_cursor"]:
+        resp = await catalog_client.get(
+            "/api/v1/recommendations",
+            params={"limit": 50, "cursor": body["next_cursor"]},
+        )
+        body = resp.json()
+        seen += len(body["cocktails"])
+    assert seen == 204
+    assert body["cocktails"][-1]["id"] == "979999"
+
+    resp = await catalog_client.get("/api/v1/recommendations", params={"abv_min": 50})
+    body = resp.json()
+    assert [c["id"] for c in body["cocktails"]] == ["979999"]
+    assert body["total_ranked"] == 1
+
+    # Facet counts cover the whole catalog ranking too
+    resp = await catalog_client.get(
+        "/api/v1/recommendations", params={"category": "cocktail", "limit": 1}
+    )
+    body = resp.json()
+    assert body["total_ranked"] == 204
+    assert body["facets"]["category"] == {"Cocktail": 204}
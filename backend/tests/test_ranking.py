@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.ranking import CursorError, Ranking, decode_cursor, encode_cursor
+
+
+def make_ranking(n: int) -> tuple[Ranking, list[int]]:
+    # position i: fully makeable when even, percentage grows with i
+    rows = [(i % 2 == 1, -float(i), i) for i in range(n)]
+    built: list[int] = []
+
+    def materialize(pos: int) -> str:
+        built.append(pos)
+        return f"drink-{pos}"
+
+    return Ranking(rows, materialize), built
+
+
+def test_page_returns_best_rows_first_and_only_materializes_them():
+    ranking, built = make_ranking(1000)
+    assert ranking.page(0, 3) == ["drink-998", "drink-996", "drink-994"]
+    assert built == [998, 996, 994]
+
+
+def test_pages_tile_the_full_ranking():
+    ranking, _ = make_ranking(25)
+    pages = [ranking.page(offset, 10) for offset in (0, 10, 20)]
+    flat = [d for page in pages for d in page]
+    assert len(flat) == 25
+    assert len(set(flat)) == 25
+    assert pages[2][-1] == "drink-1"
+
+
+def test_cursor_round_trip():
+    key = (3, 17, False)
+    assert decode_cursor(encode_cursor(40, key), key) == 40
+
+
+def test_cursor_from_another_ranking_is_rejected():
+    cursor = encode_cursor(40, (3, 17, False))
+    with pytest.raises(CursorError):
+        decode_cursor(cursor, (4, 17, False))
+    with pytest.raises(CursorError):
+        decode_cursor("not-a-cursor!", (3, 17, False))
@@ -0,0 +1,192 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal
+from app.core.security import hash_password
+from app.main import app
+from app.models.user import User
+from app.services.recommendation_cache import (
+    SAMPLED_RANKING_TTL,
+    RecommendationCache,
+    bump_pantry_version,
+    recommendation_cache,
+)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = RecommendationCache(maxsize=2)
+    cache.put((1, 0, "a"), "A")
+    cache.put((1, 0, "b"), "B")
+    assert cache.get((1, 0, "a")) == "A"
+    cache.put((1, 0, "c"), "C")
+
+    assert cache.get((1, 0, "b")) is None
+    assert cache.get((1, 0, "a")) == "A"
+    assert cache.get((1, 0, "c")) == "C"
+
+
+def test_invalidate_user_only_drops_that_user():
+    cache = RecommendationCache()
+    cache.put((1, 0, "a"), "A")
+    cache.put((2, 0, "a"), "B")
+    cache.invalidate_user(1)
+    assert cache.get((1, 0, "a")) is None
+    assert cache.get((2, 0, "a")) == "B"
+
+
+def test_entries_with_ttl_expire(monkeypatch: pytest.MonkeyPatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "app.services.recommendation_cache.time.monotonic", lambda: now[0]
+    )
+    cache = RecommendationCache()
+    cache.put((1, 0, "sampled"), "S", ttl=30)
+    cache.put((1, 0, "catalog"), "C")
+    now[0] += 29
+    assert cache.get((1, 0, "sampled")) == "S"
+    now[0] += 2
+    assert cache.get((1, 0, "sampled")) is None
+    assert cache.get((1, 0, "catalog")) == "C"
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.fixture
+def db_session() -> Session:
+    """Provide a database session for tests."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+@pytest.fixture
+def test_user(db_session: Session) -> User:
+    """Create a test user in the database."""
+    existing = (
+        db_session.query(User).filter(User.email == "test_reccache@example.com").first()
+    )
+    if existing:
+        db_session.delete(existing)
+        db_session.commit()
+
+    user = User(
+        email="test_reccache@example.com",
+        hashed_password=hash_password("testpass123"),
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    yield user
+
+    db_session.delete(user)
+    db_session.commit()
+
+
+@pytest_asyncio.fixture
+async def authenticated_client(test_user: User) -> AsyncClient:
+    """Create an authenticated async client with test user's token."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        login_resp = await client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"},
+        )
+        assert login_resp.status_code == 200
+        access_token = login_resp.json()["access_token"]
+        client.headers.update({"Authorization": f"Bearer {access_token}"})
+        yield client
+
+
+def pantry_version(db: Session, user: User) -> int:
+    db.expire_all()
+    return db.get(User, user.id).pantry_version
+
+
+@pytest.mark.asyncio
+async def test_pantry_mutations_bump_version(
+    authenticated_client: AsyncClient, db_session: Session, test_user: User
+):
+    assert pantry_version(db_session, test_user) == 0
+
+    resp = await authenticated_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+    item_id = resp.json()["id"]
+    assert pantry_version(db_session, test_user) == 1
+
+    await authenticated_client.put(
+        f"/api/v1/users/me/pantry/{item_id}", json={"quantity": 0.5}
+    )
+    assert pantry_version(db_session, test_user) == 2
+
+    await authenticated_client.get("/api/v1/users/me/pantry")
+    assert pantry_version(db_session, test_user) == 2
+
+    await authenticated_client.delete(f"/api/v1/users/me/pantry/{item_id}")
+    assert pantry_version(db_session, test_user) == 3
+
+
+def test_concurrent_bumps_both_count(db_session: Session, test_user: User):
+    # Two requests that loaded the user before either committed
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        a, b = first.get(User, test_user.id), second.get(User, test_user.id)
+        assert a.pantry_version == b.pantry_version == 0
+        bump_pantry_version(a)
+        bump_pantry_version(b)
+        first.commit()
+        second.commit()
+    finally:
+        first.close()
+        second.close()
+    assert pantry_version(db_session, test_user) == 2
+
+
+@pytest.mark.asyncio
+async def test_repeat_visits_hit_cache_until_pantry_changes(
+    authenticated_client: AsyncClient, sampled_upstream
+):
+    await authenticated_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+
+    first = await authenticated_client.get("/api/v1/recommendations?limit=5")
+    hits = recommendation_cache.hits
+    second = await authenticated_client.get("/api/v1/recommendations?limit=5")
+    assert second.json() == first.json()
+    assert recommendation_cache.hits == hits + 1
+
+    await authenticated_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Vodka"}
+    )
+    misses = recommendation_cache.misses
+    await authenticated_client.get("/api/v1/recommendations?limit=5")
+    assert recommendation_cache.misses == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_sampled_rankings_expire(
+    authenticated_client: AsyncClient, sampled_upstream, monkeypatch: pytest.MonkeyPatch
+):
+    # No catalog: the ranking comes from an upstream sample
+    now = [1000.0]
+    monkeypatch.setattr(
+        "app.services.recommendation_cache.time.monotonic", lambda: now[0]
+    )
+    await authenticated_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+    await authenticated_client.get("/api/v1/recommendations?limit=5")
+
+    hits = recommendation_cache.hits
+    await authenticated_client.get("/api/v1/recommendations?limit=5")
+    assert recommendation_cache.hits == hits + 1
+
+    now[0] += SAMPLED_RANKING_TTL + 1
+    misses = recommendation_cache.misses
+    await authenticated_client.get("/api/v1/recommendations?limit=5")
+    assert recommendation_cache.misses == misses + 1
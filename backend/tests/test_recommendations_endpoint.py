@@ -1,3 +1,4 @@
+import httpx
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
@@ -7,6 +8,9 @@ from app.core.db import SessionLocal
 from app.core.security import hash_password
 from app.main import app
 from app.models.user import User
+from app.services import taxonomy, upstream
+from app.services.upstream import UpstreamClient
+from tests.catalog_helpers import BASE_URL, FIXTURE, make_drink, run_sync
 
 
 @pytest.fixture
@@ -74,7 +78,9 @@ async def test_recommendations_without_pantry(authenticated_client: AsyncClient)
 
 
 @pytest.mark.asyncio
-async def test_recommendations_with_pantry(authenticated_client: AsyncClient):
+async def test_recommendations_with_pantry(
+    authenticated_client: AsyncClient, sampled_upstream
+):
     """Test recommendations endpoint with pantry ingredients."""
     # Add some ingredients
     ingredients = ["Gin", "Vodka", "Lime Juice"]
@@ -115,7 +121,9 @@ async def test_recommendations_with_pantry(authenticated_client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_recommendations_limit_parameter(authenticated_client: AsyncClient):
+async def test_recommendations_limit_parameter(
+    authenticated_client: AsyncClient, sampled_upstream
+):
     """Test recommendations endpoint with different limit values."""
     # Add ingredients
     await authenticated_client.post(
@@ -137,7 +145,9 @@ async def test_recommendations_limit_parameter(authenticated_client: AsyncClient
 
 
 @pytest.mark.asyncio
-async def test_recommendations_fully_makeable_only(authenticated_client: AsyncClient):
+async def test_recommendations_fully_makeable_only(
+    authenticated_client: AsyncClient, sampled_upstream
+):
     """Test recommendations endpoint with fully_makeable_only parameter."""
     # Add ingredients
     await authenticated_client.post(
@@ -165,3 +175,279 @@ async def test_recommendations_requires_authentication():
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         resp = await client.get("/api/v1/recommendations")
         assert resp.status_code == 401  # Unauthorized
+
+
+@pytest.mark.asyncio
+async def test_recommendations_score_local_catalog(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime Juice"]:
+        resp = await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+        assert resp.status_code == 201
+
+    resp = await catalog_client.get("/api/v1/recommendations?limit=10")
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert data["fully_makeable_count"] == 1
+    top = data["cocktails"][0]
+    assert top["id"] == "990001"
+    assert top["fully_makeable"] is True
+    assert top["match_score"] == {"matched": 2, "total": 2, "percentage": 100.0}
+    assert [c["id"] for c in data["cocktails"]][1] == "990002"
+    assert top["substitutions"] == []
+
+
+@pytest.mark.asyncio
+async def test_recommendations_match_through_substitutes(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations?limit=10")
+    top = resp.json()["cocktails"][0]
+    assert top["id"] == "990001"
+    assert top["fully_makeable"] is True
+    assert top["missing_ingredients"] == []
+    assert top["substitutions"] == [{"ingredient": "Lime Juice", "substitute": "Lime"}]
+
+
+@pytest.mark.asyncio
+async def test_recommendations_count_servings_from_pantry_quantities(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    # The fixture measures everything as 1 oz (29.57 ml)
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin", "quantity": 0.1}
+    )
+    resp = await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Lime Juice"}
+    )
+    lime_id = resp.json()["id"]
+
+    resp = await catalog_client.get("/api/v1/recommendations")
+    top = resp.json()["cocktails"][0]
+    assert top["id"] == "990001"
+    assert top["fully_makeable"] is True
+    assert top["servings"] == 2
+    assert resp.json()["cocktails"][1]["servings"] == 0
+
+    # Less than one pour left: listed, but not makeable
+    await catalog_client.put(
+        f"/api/v1/users/me/pantry/{lime_id}", json={"quantity": 0.03}
+    )
+    resp = await catalog_client.get("/api/v1/recommendations")
+    gimlet = resp.json()["cocktails"][0]
+    assert gimlet["fully_makeable"] is False
+    assert gimlet["servings"] == 0
+
+    # An effectively empty bottle counts as missing
+    await catalog_client.put(
+        f"/api/v1/users/me/pantry/{lime_id}", json={"quantity": 0.01}
+    )
+    resp = await catalog_client.get("/api/v1/recommendations?fully_makeable_only=true")
+    assert resp.json()["cocktails"] == []
+    resp = await catalog_client.get("/api/v1/recommendations")
+    gimlet = resp.json()["cocktails"][0]
+    assert gimlet["missing_ingredients"] == ["Lime Juice"]
+
+
+@pytest.mark.asyncio
+async def test_recommendations_servings_without_measures(
+    catalog_session: Session, catalog_client: AsyncClient, monkeypatch
+):
+    unmeasured = {"strMeasure1": "Fill with", "strMeasure2": "Garnish with"}
+    monkeypatch.setitem(
+        FIXTURE,
+        "u",
+        [
+            make_drink("990010", "Test Unmeasured", ["Gin", "Olive"], **unmeasured),
+            make_drink(
+                "990011", "Test Unmeasured Sour", ["Gin", "Lemon"], **unmeasured
+            ),
+        ],
+    )
+    await run_sync(catalog_session)
+    for name in ["Gin", "Olive"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations")
+    by_id = {c["id"]: c for c in resp.json()["cocktails"]}
+    # Makeable with unknown measures: null; missing an ingredient: 0
+    assert by_id["990010"]["fully_makeable"] is True
+    assert by_id["990010"]["servings"] is None
+    assert by_id["990011"]["fully_makeable"] is False
+    assert by_id["990011"]["servings"] == 0
+
+
+@pytest.mark.asyncio
+async def test_recommendations_filter_by_abv_range(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Light rum"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations")
+    assert len(resp.json()["cocktails"]) == 3
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations", params={"abv_min": 15, "abv_max": 19.5}
+    )
+    cocktails = resp.json()["cocktails"]
+    assert [c["id"] for c in cocktails] == ["990002"]
+    assert cocktails[0]["abv"] == 19.3
+    assert cocktails[0]["volume_ml"] == pytest.approx(88.7)
+
+    resp = await catalog_client.get("/api/v1/recommendations", params={"abv_max": 14})
+    assert [c["id"] for c in resp.json()["cocktails"]] == ["990003"]
+
+
+@pytest.mark.asyncio
+async def test_recommendations_facet_filters_and_counts(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Light rum"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations", params={"limit": 1})
+    assert resp.json()["facets"]["category"] == {"Cocktail": 2, "Ordinary Drink": 1}
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations", params={"glass": "cocktail GLASS", "limit": 1}
+    )
+    body = resp.json()
+    assert body["total_ranked"] == 2
+    assert body["facets"]["glass"] == {"Cocktail glass": 2}
+    assert {c["id"] for c in body["cocktails"]} <= {"990001", "990002"}
+
+    # Cursors carry the facet filter
+    resp = await catalog_client.get(
+        "/api/v1/recommendations",
+        params={"glass": "cocktail glass", "cursor": body["next_cursor"]},
+    )
+    assert resp.status_code == 200
+    assert len(resp.json()["cocktails"]) == 1
+    resp = await catalog_client.get(
+        "/api/v1/recommendations", params={"cursor": body["next_cursor"]}
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_recommendations_match_through_the_taxonomy(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Bacardi White Rum", "Mint", "Sugar"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations")
+    assert resp.json()["fully_makeable_count"] == 0
+
+    # Editing the taxonomy changes the ranking key, so nothing stale is served
+    taxonomy.seed_defaults(catalog_session)
+    resp = await catalog_client.get("/api/v1/recommendations")
+    top = resp.json()["cocktails"][0]
+    assert top["id"] == "990003"
+    assert top["fully_makeable"] is True
+    assert top["missing_ingredients"] == []
+
+
+@pytest.mark.asyncio
+async def test_recommendations_page_through_ranking_with_cursor(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime Juice", "Mint"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations?limit=2")
+    first = resp.json()
+    assert [c["id"] for c in first["cocktails"]] == ["990001", "990002"]
+    assert first["total_ranked"] == 3
+    assert first["next_cursor"]
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+    )
+    second = resp.json()
+    assert [c["id"] for c in second["cocktails"]] == ["990003"]
+    assert second["next_cursor"] is None
+
+    # A pantry change invalidates outstanding cursors
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Sugar"}
+    )
+    resp = await catalog_client.get(
+        "/api/v1/recommendations",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_unlocks_rank_missing_ingredients(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+
+    resp = await catalog_client.get("/api/v1/recommendations/unlocks?top=5")
+    assert resp.status_code == 200
+    assert resp.json()["unlocks"] == [
+        {"ingredient": "Lime Juice", "unlocks": 1, "cocktails": ["Test Gimlet"]}
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("failure", "status_code"),
+    [
+        (httpx.Response(500), 503),
+        (httpx.ReadTimeout("upstream too slow"), 504),
+    ],
+)
+async def test_recommendations_report_an_upstream_outage(
+    catalog_session: Session, catalog_client: AsyncClient, failure, status_code
+):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
+
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+    # No catalog and no response cache: nothing can stand in for the upstream
+    upstream.set_upstream(
+        UpstreamClient(BASE_URL, transport=httpx.MockTransport(handler))
+    )
+    try:
+        resp = await catalog_client.get("/api/v1/recommendations")
+    finally:
+        await upstream.close_upstream()
+
+    assert resp.status_code == status_code
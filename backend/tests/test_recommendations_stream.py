@@ -0,0 +1,109 @@
+import json
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.services import upstream
+from app.services.upstream import UpstreamClient
+from tests.catalog_helpers import BASE_URL, FIXTURE, run_sync
+
+
+@pytest.mark.asyncio
+async def test_recommendations_stream_ndjson_from_catalog(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Lime Juice"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get("/api/v1/recommendations/stream?limit=10")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    frames = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert [f["type"] for f in frames] == ["cocktail", "cocktail", "summary"]
+    assert [f["data"]["id"] for f in frames[:-1]] == ["990001", "990002"]
+    assert frames[-1]["data"] == {"total_found": 2, "fully_makeable_count": 1}
+
+
+@pytest.mark.asyncio
+async def test_recommendations_stream_filters_by_abv(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Light rum"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations/stream", params={"abv_min": 15, "abv_max": 19.5}
+    )
+    frames = [json.loads(line) for line in resp.text.splitlines()]
+    assert [f["data"]["id"] for f in frames[:-1]] == ["990002"]
+    assert frames[-1]["data"]["total_found"] == 1
+
+
+@pytest.mark.asyncio
+async def test_recommendations_stream_filters_by_facets(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    await run_sync(catalog_session)
+    for name in ["Gin", "Light rum"]:
+        await catalog_client.post(
+            "/api/v1/users/me/pantry", json={"ingredient_name": name}
+        )
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations/stream", params={"glass": "highball GLASS"}
+    )
+    frames = [json.loads(line) for line in resp.text.splitlines()]
+    assert [f["data"]["id"] for f in frames[:-1]] == ["990003"]
+
+    resp = await catalog_client.get(
+        "/api/v1/recommendations/stream",
+        params={"category": ["Cocktail", "Ordinary Drink"], "abv_max": 14},
+    )
+    frames = [json.loads(line) for line in resp.text.splitlines()]
+    assert [f["data"]["id"] for f in frames[:-1]] == ["990003"]
+
+
+@pytest.mark.asyncio
+async def test_recommendations_stream_sse_from_upstream_sample(
+    catalog_session: Session, catalog_client: AsyncClient
+):
+    drinks = iter(FIXTURE["g"] + FIXTURE["m"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"drinks": [next(drinks)]})
+
+    await catalog_client.post(
+        "/api/v1/users/me/pantry", json={"ingredient_name": "Gin"}
+    )
+    upstream.set_upstream(
+        UpstreamClient(BASE_URL, transport=httpx.MockTransport(handler))
+    )
+    try:
+        resp = await catalog_client.get(
+            "/api/v1/recommendations/stream",
+            params={"limit": 2, "format": "sse"},
+        )
+    finally:
+        await upstream.close_upstream()
+
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0], json.loads(block.split("\n")[1][len("data: ") :]))
+        for block in resp.text.strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == [
+        "event: cocktail",
+        "event: cocktail",
+        "event: summary",
+    ]
+    assert {data["id"] for _, data in events[:-1]} <= {"990001", "990002", "990003"}
+    assert events[-1][1] == {"total_found": 2, "fully_makeable_count": 0}
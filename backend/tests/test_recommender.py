@@ -0,0 +1,132 @@
+from app.services.bitset import BitMatrix
+from app.services.normalize import normalize_ingredient_name
+from app.services.recommender import RecommenderIndex
+from tests.catalog_helpers import make_recipe
+
+
+def build_index() -> RecommenderIndex:
+    return RecommenderIndex.from_recipes(
+        [
+            make_recipe("1", ["Gin", "Lime Juice"]),
+            make_recipe("2", ["Gin", "Dry Vermouth", "Olives"]),
+            make_recipe("3", ["Vodka", "Lime juice", "Triple sec", "Cranberry juice"]),
+            make_recipe("4", ["Light rum", "Mint", "Sugar"]),
+        ]
+    )
+
+
+def pantry(*names: str) -> set[str]:
+    return {normalize_ingredient_name(n) for n in names}
+
+
+def test_postings_cover_every_ingredient():
+    index = build_index()
+    assert index.postings["gin"] == [0, 1]
+    assert index.postings["lime juice"] == [0, 2]
+    assert index.totals == [2, 3, 4, 3]
+
+
+def test_score_only_reaches_recipes_sharing_an_ingredient():
+    index = build_index()
+    scored = {
+        index.entries[i].drink_id: (m, t)
+        for i, m, t in index.score(pantry("Gin", "Lime Juice"))
+    }
+    assert scored == {"1": (2, 2), "2": (1, 3), "3": (1, 4)}
+
+
+def test_missing_at_most_k():
+    index = build_index()
+    keys = pantry("Gin", "Lime Juice", "Dry Vermouth")
+
+    fully = [index.entries[i].drink_id for i, _, _ in index.missing_at_most(keys, 0)]
+    assert fully == ["1"]
+
+    one_away = sorted(
+        index.entries[i].drink_id for i, _, _ in index.missing_at_most(keys, 1)
+    )
+    assert one_away == ["1", "2"]
+
+
+def test_missing_ingredients_keeps_display_names():
+    index = build_index()
+    assert index.missing_ingredients(2, pantry("Vodka", "Lime Juice")) == [
+        "Triple sec",
+        "Cranberry juice",
+    ]
+
+
+def test_empty_pantry_scores_nothing():
+    assert build_index().score(set()) == []
+
+
+def test_score_all_agrees_with_postings():
+    index = build_index()
+    keys = pantry("Gin", "Lime Juice", "Vodka", "Mint")
+    matched, totals = index.score_all(keys)
+
+    assert totals.tolist() == index.totals
+    expected = [0] * len(index)
+    for idx, m, _ in index.score(keys):
+        expected[idx] = m
+    assert matched.tolist() == expected
+
+
+def test_servings_are_limited_by_the_scarcest_measured_ingredient():
+    index = RecommenderIndex.from_recipes(
+        [
+            make_recipe("1", ["Gin", "Lime Juice", "Lime"], [60.0, 30.0, None]),
+            make_recipe("2", ["Gin", "Olives"]),
+        ]
+    )
+    servings = index.servings({"gin": 150.0, "lime juice": 300.0})
+    assert servings[0] == 2
+    # Nothing measured: no limit
+    assert servings[1] == float("inf")
+    assert index.servings({"gin": 150.0})[0] == 0
+
+
+def test_bit_matrix_spans_multiple_words():
+    matrix = BitMatrix.from_rows([[0, 64, 130], [63], []], n_cols=131)
+    assert matrix.words.shape == (3, 3)
+    assert matrix.row_counts.tolist() == [3, 1, 0]
+    assert matrix.and_count(matrix.pack([64, 130, 63])).tolist() == [2, 1, 0]
+
+
+def test_unlocks_groups_one_away_recipes_by_missing_ingredient():
+    index = RecommenderIndex.from_recipes(
+        [
+            make_recipe("1", ["Gin", "Lime Juice"]),
+            make_recipe("2", ["Gin", "Tonic Water"]),
+            make_recipe("3", ["Vodka", "Tonic Water"]),
+            make_recipe("4", ["Gin", "Campari", "Sweet Vermouth"]),
+            make_recipe("5", ["Tonic Water"]),
+            make_recipe("6", ["Gin"]),
+        ]
+    )
+    unlocks = index.unlocks(pantry("Gin", "Vodka"))
+    assert [
+        (key, [index.entries[i].drink_id for i in idxs]) for key, idxs in unlocks
+    ] == [
+        ("tonic water", ["2", "3", "5"]),
+        ("lime juice", ["1"]),
+    ]
+    assert index.display_names["tonic water"] == "Tonic Water"
+
+
+def test_unlocks_skip_recipes_the_pantry_lacks_volume_for():
+    index = RecommenderIndex.from_recipes(
+        [
+            make_recipe("1", ["Gin", "Tonic Water"], [60.0, 120.0]),
+            make_recipe("2", ["Vodka", "Tonic Water"], [60.0, 120.0]),
+            make_recipe("3", ["Rum", "Tonic Water"], [60.0, 1000.0]),
+        ]
+    )
+    keys = pantry("Gin", "Vodka", "Rum")
+    volumes = {"gin": 30.0, "vodka": 100.0, "rum": 100.0}
+    unlocks = index.unlocks(keys, volumes)
+    # Gin runs short, and one bottle of tonic is less than recipe 3 pours
+    assert [
+        (key, [index.entries[i].drink_id for i in idxs]) for key, idxs in unlocks
+    ] == [("tonic water", ["2"])]
+    assert len(index.unlocks(keys)[0][1]) == 3
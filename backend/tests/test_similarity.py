@@ -0,0 +1,45 @@
+import numpy as np
+
+from app.services.similarity import (
+    NUM_PERM,
+    LSHIndex,
+    from_bytes,
+    jaccard,
+    minhash,
+    signature_bytes,
+)
+
+
+def test_minhash_estimates_jaccard():
+    a = {f"ingredient {i}" for i in range(40)}
+    b = {f"ingredient {i}" for i in range(20, 60)}
+    estimate = float((minhash(a) == minhash(b)).mean())
+    assert abs(estimate - jaccard(frozenset(a), frozenset(b))) < 0.15
+    assert np.array_equal(minhash(a), minhash(sorted(a, reverse=True)))
+
+
+def test_signatures_round_trip_through_storage():
+    keys = ["gin", "lime juice"]
+    stored = signature_bytes(keys)
+    assert len(stored) == NUM_PERM * 4
+    assert np.array_equal(from_bytes(stored), minhash(keys))
+    assert from_bytes(stored[:8]) is None
+
+
+def test_lsh_finds_near_duplicates_and_ranks_exactly():
+    sets = [
+        frozenset({"gin", "lime juice", "sugar syrup"}),
+        frozenset({"gin", "lime juice", "sugar syrup", "soda water"}),
+        frozenset({"gin", "lime juice"}),
+        frozenset({"tequila", "triple sec", "lime juice"}),
+        frozenset({"vodka", "coffee liqueur", "cream"}),
+    ]
+    index = LSHIndex(np.array([minhash(s) for s in sets]), sets)
+
+    similar = index.similar(0)
+    assert [idx for idx, _ in similar[:2]] == [1, 2]
+    assert similar[0][1] == 0.75
+    assert 0 not in index.candidates(0)
+    # No shared ingredient, never returned
+    assert all(idx != 4 for idx, _ in similar)
+    assert index.similar(0, limit=1) == [(1, 0.75)]
@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.singleflight import SingleFlight
+from app.services.upstream import UpstreamClient
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight("test-share")
+    runs = 0
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return runs
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+    assert results == [1] * 5
+    assert flight.stats() == {"executed": 1, "coalesced": 4, "in_flight": 0}
+
+    # Once finished, the key is released and the next call runs again
+    assert await flight.do("k", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_release_the_key():
+    flight = SingleFlight("test-errors")
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", boom) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    flight = SingleFlight("test-cancel")
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "done"
+
+
+@pytest.mark.asyncio
+async def test_upstream_coalesces_identical_lookups_but_not_random():
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"drinks": [{"idDrink": "1"}]})
+
+    client = UpstreamClient(BASE_URL, transport=httpx.MockTransport(handler))
+    try:
+        await asyncio.gather(
+            *(client.get_json("lookup.php", {"i": "1"}) for _ in range(10)),
+            *(client.get_json("random.php") for _ in range(3)),
+        )
+    finally:
+        await client.aclose()
+
+    assert calls.count("/api/json/v1/1/lookup.php") == 1
+    assert calls.count("/api/json/v1/1/random.php") == 3
+    assert client.flight.stats()["coalesced"] == 9
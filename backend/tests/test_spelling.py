@@ -0,0 +1,34 @@
+from app.services.spelling import SymSpell, edit_distance
+
+
+def test_edit_distance_counts_adjacent_swaps_once():
+    assert edit_distance("margarita", "margarita", 2) == 0
+    assert edit_distance("margarta", "margarita", 2) == 1
+    assert edit_distance("cointraeu", "cointreau", 2) == 1
+    assert edit_distance("margrta", "margarita", 2) == 2
+    # Beyond the limit the exact value is not computed
+    assert edit_distance("vodka", "margarita", 2) == 3
+
+
+def test_lookup_prefers_closest_then_most_frequent():
+    speller = SymSpell({"gin": 50, "margarita": 3, "margaritas": 1, "cointreau": 2})
+
+    assert speller.lookup("margarita") == ["margarita"]
+    assert speller.lookup("margaritta") == ["margarita", "margaritas"]
+    assert speller.lookup("cointreu") == ["cointreau"]
+    assert speller.lookup("whiskey") == []
+
+
+def test_long_words_match_past_the_prefix():
+    speller = SymSpell({"angostura": 1, "maraschino": 1})
+    assert speller.lookup("angosturra") == ["angostura"]
+    assert speller.lookup("marachino") == ["maraschino"]
+
+
+def test_correct_replaces_only_unknown_words():
+    speller = SymSpell({"blue": 1, "margarita": 1, "gin": 1, "tonic": 1})
+
+    assert speller.correct(["blue", "margarta"]) == ["blue", "margarita"]
+    assert speller.correct(["gin", "tonic"]) is None
+    # Short words allow fewer edits ("gni" is one swap from "gin"; "xy" is left alone)
+    assert speller.correct(["gni", "xy"]) == ["gin", "xy"]
@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.strength import estimate_strength, ingredient_abv
+
+
+@pytest.mark.parametrize(
+    ("name", "abv"),
+    [
+        ("Gin", 40),
+        ("gin ", 40),
+        ("Dry Vermouth", 18),
+        # through the substitution class (Cointreau -> Triple Sec)
+        ("Cointreau", 30),
+        # by word, when the name is not in the table
+        ("Bacardi Limon rum", 40),
+        ("Pear liqueur", 25),
+        ("Lime Juice", 0),
+        ("Ginger Ale", 0),
+        # soft drinks named after alcoholic ones
+        ("Ginger Beer", 0),
+        ("Root beer", 0),
+        ("Rum extract", 0),
+        # brands, through the table or the default taxonomy (Bacardi -> White Rum)
+        ("Absolut Citron", 40),
+        ("Bacardi", 40),
+        ("Jim Beam", 45),
+    ],
+)
+def test_ingredient_abv(name: str, abv: float):
+    assert ingredient_abv(name) == abv
+
+
+def test_estimate_strength_averages_by_volume():
+    volume, abv = estimate_strength(
+        [("Gin", 60.0), ("Lime Juice", 30.0), ("Sugar Syrup", 10.0), ("Mint", None)]
+    )
+    assert volume == 100.0
+    assert abv == 24.0
+
+
+def test_estimate_strength_without_measures():
+    assert estimate_strength([("Gin", None), ("Mint", 0.0)]) == (None, None)
+    assert estimate_strength([]) == (None, None)
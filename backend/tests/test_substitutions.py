@@ -0,0 +1,53 @@
+from app.services.recommender import RecommenderIndex
+from app.services.substitutions import PantryClasses, SubstitutionRegistry, UnionFind
+from tests.catalog_helpers import make_recipe
+
+
+def test_union_find_merges_transitively_and_keeps_first_root():
+    sets = UnionFind()
+    sets.union("a", "b")
+    sets.union("c", "d")
+    sets.union("b", "d")
+    assert {sets.find(x) for x in "abcd"} == {"a"}
+    assert sets.find("e") == "e"
+
+
+def test_registry_compiles_groups_into_classes():
+    registry = SubstitutionRegistry(
+        [("Triple Sec", "Grand Marnier"), ("Grand Marnier", "Orange Liqueur")]
+    )
+    assert registry.class_of("orange liqueur") == "triple sec"
+    assert registry.class_of("grand marnier") == "triple sec"
+    assert registry.class_of("gin") == "gin"
+
+
+def test_aliases_are_the_same_ingredient_not_a_substitution():
+    pantry = PantryClasses.from_names(["Cointreau"])
+    assert pantry.keys == {"triple sec"}
+    assert pantry.substitutions(["Triple sec"], ["triple sec"], ["triple sec"]) == []
+
+
+def test_index_matches_recipes_through_substitutes():
+    index = RecommenderIndex.from_recipes(
+        [
+            make_recipe("1", ["Vodka", "Triple sec", "Lime Juice"]),
+            make_recipe("2", ["Gin", "Lemon Juice"]),
+        ]
+    )
+    pantry = PantryClasses.from_names(["Vodka", "Grand Marnier", "Lime Juice"])
+
+    matched, totals = index.score_all(pantry.classes)
+    assert matched.tolist() == [3, 0]
+    assert index.missing_ingredients(0, pantry.classes) == []
+    assert index.substitutions(0, pantry) == [("Triple sec", "Grand Marnier")]
+
+
+def test_unlocks_name_the_class_by_its_catalog_ingredient():
+    index = RecommenderIndex.from_recipes(
+        [make_recipe("1", ["Gin", "Lime"]), make_recipe("2", ["Rum", "Lime Juice"])]
+    )
+    pantry = PantryClasses.from_names(["Gin", "Rum"])
+    assert [
+        (index.class_names[key], len(idxs))
+        for key, idxs in index.unlocks(pantry.classes)
+    ] == [("Lime Juice", 2)]
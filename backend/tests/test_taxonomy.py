@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.db import SessionLocal
+from app.main import app  # noqa: F401  (creates the tables)
+from app.models.taxonomy import IngredientClosure, IngredientTaxonomy, TaxonomyChange
+from app.services import taxonomy
+from app.services.substitutions import PantryClasses
+from app.services.taxonomy import TaxonomyError
+
+
+def clear_taxonomy(db: Session) -> None:
+    db.query(IngredientClosure).delete()
+    db.query(IngredientTaxonomy).delete()
+    db.query(TaxonomyChange).delete()
+    db.commit()
+
+
+@pytest.fixture
+def db_session() -> Session:
+    db = SessionLocal()
+    clear_taxonomy(db)
+    try:
+        yield db
+    finally:
+        db.rollback()
+        clear_taxonomy(db)
+        db.close()
+
+
+def closure(db: Session) -> set[tuple[str, str, int]]:
+    return set(
+        db.execute(
+            select(
+                IngredientClosure.ancestor_key,
+                IngredientClosure.descendant_key,
+                IngredientClosure.depth,
+            )
+        ).all()
+    )
+
+
+def test_closure_holds_every_ancestor_with_its_depth(db_session: Session):
+    taxonomy.set_parent(db_session, "Bacardi", "White Rum")
+    taxonomy.set_parent(db_session, "White Rum", "Rum")
+
+    ancestors = taxonomy.Taxonomy.load(db_session).ancestors
+    assert ancestors["bacardi"] == {"white rum", "rum"}
+    assert ancestors["white rum"] == {"rum"}
+    assert ("rum", "bacardi", 2) in closure(db_session)
+
+
+def test_incremental_updates_match_a_full_rebuild(db_session: Session):
+    taxonomy.set_parent(db_session, "White Rum", "Rum")
+    taxonomy.set_parent(db_session, "Bacardi", "White Rum")
+    taxonomy.set_parent(db_session, "Havana Club", "White Rum")
+    taxonomy.set_parent(db_session, "Rum", "Spirit")
+    # Move a subtree, then detach a leaf
+    taxonomy.set_parent(db_session, "White Rum", "Spirit")
+    taxonomy.remove_parent(db_session, "Havana Club")
+    incremental = closure(db_session)
+
+    taxonomy.rebuild_closure(db_session)
+    # The rebuild leaves no self row for the detached, now unlinked leaf
+    assert closure(db_session) == incremental - {("havana club", "havana club", 0)}
+    assert taxonomy.Taxonomy.load(db_session).ancestors["bacardi"] == {
+        "white rum",
+        "spirit",
+    }
+
+
+def test_cycles_are_rejected(db_session: Session):
+    taxonomy.set_parent(db_session, "Bacardi", "White Rum")
+    taxonomy.set_parent(db_session, "White Rum", "Rum")
+    with pytest.raises(TaxonomyError):
+        taxonomy.set_parent(db_session, "Rum", "Bacardi")
+    with pytest.raises(TaxonomyError):
+        taxonomy.set_parent(db_session, "Rum", "Rum")
+
+
+def test_cached_ancestors_reload_when_the_version_changes(db_session: Session):
+    version = taxonomy.taxonomy_version(db_session)
+    assert taxonomy.get_taxonomy(db_session).ancestors == {}
+
+    taxonomy.seed_defaults(db_session, {"Jameson": "Irish Whiskey"})
+    assert taxonomy.taxonomy_version(db_session) > version
+    assert taxonomy.get_taxonomy(db_session).ancestors["jameson"] == {"irish whiskey"}
+    # Already present: nothing to add
+    assert taxonomy.seed_defaults(db_session, {"Jameson": "Irish Whiskey"}) == 0
+
+
+def test_pantry_items_cover_their_ancestors():
+    ancestors = {"bacardi white rum": frozenset({"white rum", "rum"})}
+    pantry = PantryClasses.from_names(["Bacardi White Rum"], ancestors=ancestors)
+    assert pantry.keys == {"bacardi white rum", "white rum", "rum"}
+    # Light rum is an alias of White Rum, so no substitution is reported
+    assert pantry.substitutions(["Light rum"], ["white rum"], ["white rum"]) == []
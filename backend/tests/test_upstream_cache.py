@@ -0,0 +1,179 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.api.v1.routes_recommendations import fetch_random_drinks
+from app.services import upstream
+from app.services.upstream import UpstreamClient
+from app.services.upstream_cache import (
+    CACHE_TTLS,
+    DAY,
+    NEGATIVE_TTL,
+    STALE_TTL,
+    ResponseCache,
+    cache_key,
+)
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+class FakeUpstream:
+    """MockTransport handler that counts calls and can be switched off."""
+
+    def __init__(self):
+        self.calls = 0
+        self.down = False
+        self.version = 1
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.down:
+            return httpx.Response(503)
+        if request.url.params.get("s") == "nothing":
+            return httpx.Response(200, json={"drinks": None})
+        return httpx.Response(
+            200, json={"drinks": [{"idDrink": "11007", "v": self.version}]}
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake():
+    return FakeUpstream()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(str(tmp_path / "cache.db"), clock=clock)
+
+
+@pytest_asyncio.fixture
+async def client(fake, cache):
+    c = UpstreamClient(BASE_URL, transport=httpx.MockTransport(fake), cache=cache)
+    yield c
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fresh_replies_are_served_from_cache(client, fake):
+    first = await client.get_json("lookup.php", {"i": "11007"})
+    second = await client.get_json("lookup.php", {"i": "11007"})
+    assert first == second
+    assert fake.calls == 1
+    assert client.cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_reply_is_served_while_refreshing(client, fake, clock):
+    await client.get_json("lookup.php", {"i": "11007"})
+    fake.version = 2
+    clock.advance(CACHE_TTLS["lookup.php"] + 1)
+
+    stale = await client.get_json("lookup.php", {"i": "11007"})
+    assert stale["drinks"][0]["v"] == 1
+    await asyncio.gather(*client._refreshing.values())
+
+    fresh = await client.get_json("lookup.php", {"i": "11007"})
+    assert fresh["drinks"][0]["v"] == 2
+    assert fake.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_replies_use_the_short_ttl(client, fake, clock):
+    assert await client.get_json("search.php", {"s": "nothing"}) == {"drinks": None}
+    await client.get_json("search.php", {"s": "nothing"})
+    assert fake.calls == 1
+
+    clock.advance(NEGATIVE_TTL + STALE_TTL + 1)
+    await client.get_json("search.php", {"s": "nothing"})
+    assert fake.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_outage_serves_expired_entries(client, fake, clock):
+    await client.get_json("filter.php", {"i": "Gin"})
+    clock.advance(DAY + STALE_TTL + 1)
+    fake.down = True
+
+    body = await client.get_json("filter.php", {"i": "Gin"})
+    assert body["drinks"][0]["idDrink"] == "11007"
+    assert client.cache.stats()["stale_on_error"] == 1
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get_json("filter.php", {"i": "Vodka"})
+
+
+def test_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    key = cache_key("list.php", {"i": "list"})
+    first = ResponseCache(path)
+    first.put(key, "list.php", {"drinks": [{"strIngredient1": "Gin"}]})
+    first.close()
+
+    body, state = ResponseCache(path).get(key)
+    assert body == {"drinks": [{"strIngredient1": "Gin"}]}
+    assert state == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_recommendation_sampling_falls_back_to_seen_drinks(client, fake):
+    upstream.set_upstream(client)
+    try:
+        assert len(await fetch_random_drinks(3)) == 3
+        fake.down = True
+        drinks = await fetch_random_drinks(3)
+    finally:
+        upstream.set_upstream(None)
+
+    assert [d["idDrink"] for d in drinks] == ["11007"]
+
+
+@pytest.mark.asyncio
+async def test_replies_are_written_in_batches_off_the_loop(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    key = cache_key("lookup.php", {"i": "1"})
+    cache.put_later(key, "lookup.php", {"drinks": [{"idDrink": "1"}]})
+    cache.put_drinks_later([{"idDrink": str(i)} for i in range(2, 6)])
+    # Visible while queued, before the worker thread commits
+    assert cache.get(key)[0] == {"drinks": [{"idDrink": "1"}]}
+
+    for _ in range(100):
+        if not cache.stats()["pending_writes"]:
+            break
+        await asyncio.sleep(0.01)
+    assert cache.stats()["entries"] == 5
+    cache.close()
+
+    assert ResponseCache(str(tmp_path / "cache.db")).get(key)[1] == "fresh"
+
+
+def test_sample_drinks_skips_negative_replies(cache):
+    for i in range(10):
+        cache.put(
+            cache_key("lookup.php", {"i": str(i)}),
+            "lookup.php",
+            {"drinks": [{"idDrink": str(i)}]},
+        )
+    cache.put(cache_key("lookup.php", {"i": "x"}), "lookup.php", {"drinks": None})
+
+    drinks = cache.sample_drinks(3)
+    assert len(drinks) == 3
+    assert len({d["idDrink"] for d in drinks}) == 3
+    assert len(cache.sample_drinks(50)) == 10
@@ -0,0 +1,87 @@
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.v1.routes_recommendations import fetch_random_drinks
+from app.main import app
+from app.services import upstream
+from app.services.upstream import UpstreamClient
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+def mock_client(handler) -> UpstreamClient:
+    return UpstreamClient(BASE_URL, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_get_json_uses_base_url_and_counts_requests():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        if request.url.path.endswith("lookup.php"):
+            return httpx.Response(200, json={"drinks": [{"idDrink": "1"}]})
+        return httpx.Response(500)
+
+    client = mock_client(handler)
+    try:
+        data = await client.get_json("lookup.php", {"i": "1"})
+        assert data == {"drinks": [{"idDrink": "1"}]}
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_json("search.php", {"s": "x"})
+    finally:
+        await client.aclose()
+
+    assert seen[0] == f"{BASE_URL}/lookup.php?i=1"
+    stats = client.pool_stats()
+    assert stats["requests_total"] == 2
+    assert stats["errors_total"] == 1
+    assert stats["requests_in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_random_drinks_share_the_upstream_client():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"drinks": [{"idDrink": str(calls)}]})
+
+    client = mock_client(handler)
+    upstream.set_upstream(client)
+    try:
+        drinks = await fetch_random_drinks(4)
+    finally:
+        await upstream.close_upstream()
+
+    assert calls == 4
+    assert sorted(d["idDrink"] for d in drinks) == ["1", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_owns_the_shared_client():
+    async with app.router.lifespan_context(app):
+        first = upstream.get_upstream()
+        assert upstream.get_upstream() is first
+    assert upstream._upstream is None
+
+
+@pytest.mark.asyncio
+async def test_upstream_health_reports_pool_stats():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/api/v1/health/upstream")
+    assert resp.status_code == 200
+    pool = resp.json()["pool"]
+    for key in (
+        "connections_in_use",
+        "connections_idle",
+        "requests_in_flight",
+        "pool_wait_ms_avg",
+        "pool_wait_ms_max",
+    ):
+        assert key in pool
@@ -0,0 +1,135 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.upstream import UpstreamClient
+from app.services.upstream_cache import ResponseCache, cache_key
+from app.services.upstream_guard import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    UpstreamGuard,
+)
+
+BASE_URL = "http://cocktaildb.test/api/json/v1/1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_grows_additively_and_halves_on_failure():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial=4, max_limit=6, cooldown=1.0, clock=clock)
+
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.stats()["limit"] == 5
+
+    limiter.on_failure()
+    assert limiter.stats()["limit"] == 2
+    # A burst of failures within the cooldown only backs off once
+    limiter.on_failure()
+    assert limiter.stats()["limit"] == 2
+    clock.now += 2
+    limiter.on_failure()
+    limiter.on_failure()
+    assert limiter.stats()["limit"] == 1
+    assert limiter.stats()["decreases"] == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_calls():
+    limiter = AdaptiveLimiter(initial=2)
+    release = asyncio.Event()
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        await limiter.acquire()
+        try:
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+        finally:
+            limiter.release()
+
+    tasks = [asyncio.create_task(call()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert limiter.stats()["waiting"] == 3
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_breaker_opens_probes_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow()  # the probe
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["opened_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_and_serves_cache_while_open(tmp_path):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ReadTimeout("slow", request=request)
+
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    key = cache_key("lookup.php", {"i": "11007"})
+    cache.put(key, "lookup.php", {"drinks": [{"idDrink": "11007"}]})
+    cache.clock = lambda: 10**12  # everything cached is past its TTL
+
+    guard = UpstreamGuard(
+        AdaptiveLimiter(initial=4), CircuitBreaker(failure_threshold=2)
+    )
+    client = UpstreamClient(
+        BASE_URL, transport=httpx.MockTransport(handler), cache=cache, guard=guard
+    )
+    try:
+        for _ in range(2):
+            with pytest.raises(httpx.ReadTimeout):
+                await client.get_json("random.php")
+        assert guard.breaker.state == OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await client.get_json("random.php")
+        # Cached replies still stand in for the upstream
+        body = await client.get_json("lookup.php", {"i": "11007"})
+        assert body == {"drinks": [{"idDrink": "11007"}]}
+    finally:
+        await client.aclose()
+
+    assert calls == 2
+    stats = guard.stats()
+    assert stats["breaker"]["rejected_total"] == 2
+    assert stats["limiter"]["limit"] == 2
+    assert stats["limiter"]["in_flight"] == 0